@@ -0,0 +1,106 @@
+"""
+HTTP API Server Benchmark
+Measures requests per second and latency of the match API server under concurrent clients.
+
+Usage: python benchmarks/bench_http_server.py [--events 1000] [--clients 8] [--requests 2000] [--route /events]
+"""
+
+import argparse
+import http.client
+import statistics
+import sys
+import os
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data.api_server import MatchAPIServer
+
+
+def make_events(count):
+    """Build a mix of live, finished and upcoming sofascore-style events across 20 tournaments"""
+    now = int(time.time())
+    statuses = [
+        {'type': 'inprogress', 'code': 7, 'description': '2nd half'},
+        {'type': 'finished', 'code': 100, 'description': 'Ended', 'winnerCode': 1},
+        {'type': 'notstarted', 'code': 0, 'description': 'Not started'},
+    ]
+    events = []
+    for i in range(count):
+        events.append({
+            'id': i,
+            'tournament': {'name': f"League {i % 20}", 'uniqueTournament': {'id': i % 20}},
+            'roundInfo': {'round': 1 + i % 38},
+            'status': statuses[i % len(statuses)],
+            'homeTeam': {'name': f"Home Team {i}", 'shortName': f"HT{i}"},
+            'awayTeam': {'name': f"Away Team {i}", 'shortName': f"AT{i}"},
+            'homeScore': {'current': i % 4, 'period1': i % 2},
+            'awayScore': {'current': i % 3, 'period1': i % 2},
+            'time': {'currentPeriodStartTimestamp': now - 1200},
+            'startTimestamp': now + i * 60,
+        })
+    return events
+
+
+def run_client(port, route, headers, count, latencies, sizes):
+    """Send count requests over one keep-alive connection"""
+    connection = http.client.HTTPConnection('127.0.0.1', port)
+    for _ in range(count):
+        start = time.perf_counter()
+        connection.request('GET', route, headers=headers)
+        response = connection.getresponse()
+        body = response.read()
+        latencies.append((time.perf_counter() - start) * 1000)
+        sizes.append(len(body))
+    connection.close()
+
+
+def run_scenario(port, route, headers, clients, requests):
+    """Run concurrent clients and get (requests per second, latencies, body sizes)"""
+    latencies = []
+    sizes = []
+    per_client = max(1, requests // clients)
+    threads = [threading.Thread(target=run_client, args=(port, route, headers, per_client, latencies, sizes))
+               for _ in range(clients)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return len(latencies) / elapsed, sorted(latencies), sizes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the match API server")
+    parser.add_argument('--events', type=int, default=1000, help="Events in the served snapshot")
+    parser.add_argument('--clients', type=int, default=8, help="Concurrent keep-alive clients")
+    parser.add_argument('--requests', type=int, default=2000, help="Requests per scenario")
+    parser.add_argument('--route', default='/events', help="Route to request")
+    args = parser.parse_args()
+    
+    server = MatchAPIServer(port=0)
+    server.publish({'events': make_events(args.events)}, 1)
+    server.start()
+    etag = server.get_response(args.route).etag
+    print(f"{args.events} events, publish {server.get_stats()['last_publish_ms']:.1f}ms, "
+          f"{args.clients} clients, {args.requests} requests per scenario, route {args.route}")
+    
+    scenarios = [
+        ("plain 200", {}),
+        ("gzip 200", {'Accept-Encoding': 'gzip'}),
+        ("304 (ETag)", {'Accept-Encoding': 'gzip', 'If-None-Match': etag}),
+    ]
+    for name, headers in scenarios:
+        rate, latencies, sizes = run_scenario(server.port, args.route, headers, args.clients, args.requests)
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        print(f"{name:<12} {rate:8.0f} req/s  p50 {statistics.median(latencies):6.2f}ms  "
+              f"p99 {p99:6.2f}ms  {statistics.mean(sizes) / 1024:8.1f} KB/response")
+    
+    server.stop()
+    print(f"Server stats: {server.get_stats()}")
+
+
+if __name__ == '__main__':
+    main()
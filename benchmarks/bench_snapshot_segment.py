@@ -0,0 +1,101 @@
+"""
+Snapshot Segment Benchmark
+Compares what a local consumer pays per poll: re-parsing the JSON file versus checking and
+reading the shared-memory segment. Publishing is timed separately from reading.
+
+Usage: python benchmarks/bench_snapshot_segment.py [--events 1000] [--polls 2000] [--changes 20]
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data.snapshot_segment import SnapshotPublisher, SnapshotReader
+from bench_http_server import make_events
+
+
+def measure(function, count):
+    """Get the mean milliseconds of count calls"""
+    start = time.perf_counter()
+    for _ in range(count):
+        function()
+    return (time.perf_counter() - start) * 1000 / count
+
+
+def measure_after(prepare, function, count):
+    """Get the mean milliseconds of count calls of function, each after an untimed call of prepare"""
+    total = 0.0
+    for _ in range(count):
+        prepare()
+        start = time.perf_counter()
+        function()
+        total += time.perf_counter() - start
+    return total * 1000 / count
+
+
+def make_snapshots(data, changes, renamed):
+    """Yield snapshots that each change the scores of changes events, or a team name if renamed"""
+    round_number = 0
+    while True:
+        round_number += 1
+        events = list(data['events'])
+        for index in range(changes):
+            position = (round_number * changes + index) % len(events)
+            event = dict(events[position], homeScore={'current': round_number, 'period1': 0})
+            if renamed:
+                event['homeTeam'] = {'name': f"Renamed {round_number}", 'shortName': 'REN'}
+            events[position] = event
+        yield {'events': events}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark shared-memory snapshot reads")
+    parser.add_argument('--events', type=int, default=1000, help="Events in the snapshot")
+    parser.add_argument('--polls', type=int, default=2000, help="Polls per scenario")
+    parser.add_argument('--changes', type=int, default=20, help="Events changed per new snapshot")
+    args = parser.parse_args()
+    
+    data = {'events': make_events(args.events)}
+    rounds = max(1, args.polls // 20)
+    with tempfile.TemporaryDirectory() as directory:
+        json_path = os.path.join(directory, 'events.json')
+        with open(json_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=4)
+        
+        def parse_file():
+            with open(json_path, 'r', encoding='utf-8') as f:
+                json.load(f)
+        
+        publisher = SnapshotPublisher(os.path.join(directory, 'snapshot.seg'))
+        reader = SnapshotReader(publisher.path)
+        version = iter(range(1, 1 << 30))
+        publisher.publish(data, next(version))
+        reader.read()
+        
+        scores = make_snapshots(data, args.changes, renamed=False)
+        names = make_snapshots(data, args.changes, renamed=True)
+        scenarios = [
+            ("JSON file re-parse", measure(parse_file, rounds)),
+            ("segment unchanged", measure(reader.read, args.polls)),
+            ("read, scores changed", measure_after(lambda: publisher.publish(next(scores), next(version)),
+                                                   reader.read, rounds)),
+            ("read, names changed", measure_after(lambda: publisher.publish(next(names), next(version)),
+                                                  reader.read, rounds)),
+            ("publish, scores", measure(lambda: publisher.publish(next(scores), next(version)), rounds)),
+            ("publish, names", measure(lambda: publisher.publish(next(names), next(version)), rounds)),
+        ]
+        print(f"{args.events} events, {args.changes} changed per snapshot, "
+              f"{os.path.getsize(json_path) / 1024:.1f} KB JSON file")
+        for name, mean_ms in scenarios:
+            print(f"{name:<22} {mean_ms * 1000:10.1f} us/poll")
+        reader.close()
+        publisher.close()
+
+
+if __name__ == '__main__':
+    main()
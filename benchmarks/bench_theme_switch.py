@@ -0,0 +1,110 @@
+"""
+Theme Switch Benchmark
+Measures how long a theme switch takes with the full chrome and 500 match cards on screen.
+
+Usage: python benchmarks/bench_theme_switch.py [--cards 500] [--switches 10]
+"""
+
+import argparse
+import statistics
+import sys
+import os
+import time
+import tkinter as tk
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.design_system import DesignSystem
+from core.theme_manager import ThemeManager
+from ui.header import Header
+from ui.sidebar import Sidebar
+from ui.content import ContentArea
+from ui.status_bar import StatusBar
+from ui.match_display import MatchDisplay
+
+
+def make_events(count):
+    """Build a mix of live, finished and upcoming sofascore-style events"""
+    now = int(time.time())
+    statuses = [
+        {'type': 'inprogress', 'description': '2nd half'},
+        {'type': 'finished', 'description': 'Ended', 'winnerCode': 1},
+        {'type': 'notstarted', 'description': 'Not started'},
+    ]
+    events = []
+    for i in range(count):
+        events.append({
+            'id': i,
+            'status': statuses[i % len(statuses)],
+            'homeTeam': {'name': f"Home Team {i}"},
+            'awayTeam': {'name': f"Away Team {i}"},
+            'homeScore': {'current': i % 4},
+            'awayScore': {'current': i % 3},
+            'time': {'minute': 60 + i % 30},
+            'startTimestamp': now + i * 60,
+        })
+    return events
+
+
+def build_window(root, design, theme_manager, card_count):
+    """Create the app chrome and a card grid like the main window"""
+    main_container = design.themed(tk.Frame, root, {'bg': 'bg_primary'})
+    main_container.pack(fill=tk.BOTH, expand=True)
+    header = Header(main_container, design)
+    
+    content_frame = design.themed(tk.Frame, main_container, {'bg': 'bg_secondary'})
+    content_frame.pack(fill=tk.BOTH, expand=True)
+    callbacks = {name: (lambda: None) for name in (
+        'fetch_matches', 'stop_fetching', 'show_live_matches',
+        'show_fixtures', 'show_finished', 'show_settings')}
+    sidebar = Sidebar(content_frame, design, callbacks)
+    content = ContentArea(content_frame, design)
+    status_bar = StatusBar(main_container, design)
+    
+    match_display = MatchDisplay(design)
+    content.set_match_display(match_display)
+    
+    content.show_transient_content()
+    grid = design.themed(tk.Frame, content.transient_frame, {'bg': 'bg_card'})
+    grid.pack(fill=tk.BOTH, expand=True)
+    cards = [match_display.create_modern_match_card(event, grid, 'live')
+             for event in make_events(card_count)]
+    match_display.layout_card_grid(grid, cards, match_display.get_column_count(1280))
+    
+    for component in (header, sidebar, content, status_bar, match_display):
+        theme_manager.register_component(component)
+    return cards
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark theme switching")
+    parser.add_argument('--cards', type=int, default=500, help="Match cards on screen")
+    parser.add_argument('--switches', type=int, default=10, help="Theme switches to time")
+    args = parser.parse_args()
+    
+    root = tk.Tk()
+    root.geometry("1400x900")
+    design = DesignSystem(theme='dark', root=root)
+    theme_manager = ThemeManager(design)
+    build_window(root, design, theme_manager, args.cards)
+    root.update()
+    
+    apply_times = []
+    redraw_times = []
+    for i in range(args.switches):
+        theme = 'light' if design.current_theme == 'dark' else 'dark'
+        start = time.perf_counter()
+        theme_manager.switch_theme(theme)
+        applied = time.perf_counter()
+        root.update()
+        apply_times.append((applied - start) * 1000)
+        redraw_times.append((time.perf_counter() - start) * 1000)
+    
+    print(f"{args.cards} cards, {len(design.theme_bindings)} bound widgets, {args.switches} switches")
+    print(f"Apply:         median {statistics.median(apply_times):.1f}ms, max {max(apply_times):.1f}ms")
+    print(f"Apply+redraw:  median {statistics.median(redraw_times):.1f}ms, max {max(redraw_times):.1f}ms")
+    root.destroy()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,162 @@
+"""
+Data Layer Benchmark Suite
+Times the hot data-path functions on synthetic match days of 100, 1k and 10k events and compares
+them with a baseline recorded on the same machine.
+
+Usage:
+    python benchmarks/run_benchmarks.py --save           # record benchmarks/baseline.json (not committed)
+    python benchmarks/run_benchmarks.py                  # compare with it
+    python benchmarks/run_benchmarks.py --sizes 10000 --filter organize --threshold 0.1 --strict
+
+The comparison is advisory: timings are divided by a calibration loop timed in the same run, which
+cancels out much of the machine's speed changes but not all of it, so slowdowns past the threshold
+are reported and only fail the run (status 1) with --strict.
+"""
+
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from data.data_processor import DataProcessor, MatchOrganizer
+from core.fileio import atomic_write_json
+from data.synthetic import generate_payload
+from ui.content import ContentArea
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+NOW = 1700000000  # Fixed anchor so every run benchmarks the same data
+
+
+def make_benchmarks(size, directory):
+    """Get name -> function of the benchmarks at one data size"""
+    data = generate_payload(events=size, tournaments=max(5, size // 30), seed=0, now=NOW)
+    path = os.path.join(directory, f"events-{size}.json")
+    atomic_write_json(path, data, fsync=False)
+    
+    processor = DataProcessor(output_path=path)
+    processor.set_data(data)
+    organized = MatchOrganizer.organize_matches_by_tournament(data)
+    
+    # The filters don't touch the widget, so they run without a Tk window
+    return {
+        'get_limited_data': processor.get_limited_data,
+        'organize_matches_by_tournament': lambda: MatchOrganizer.organize_matches_by_tournament(data),
+        'get_match_statistics': lambda: MatchOrganizer.get_match_statistics(organized),
+        'filter_live_matches': lambda: ContentArea.filter_live_matches(None, data),
+        'filter_upcoming_matches': lambda: ContentArea.filter_upcoming_matches(None, data),
+        'filter_finished_matches': lambda: ContentArea.filter_finished_matches(None, data),
+        'json_load': processor.load_data_from_file,
+        # The app's save without the disk flush, whose cost depends on the disk, not the code
+        'json_save': lambda: atomic_write_json(path, data, fsync=False),
+    }
+
+
+def calibrate():
+    """A fixed pure-Python workload; the benchmarks are compared in multiples of its time"""
+    items = [{'id': index, 'name': f"Team {index * 7919 % 2003}"} for index in range(2000)]
+    json.dumps(sorted(items, key=lambda item: item['name']))
+
+
+def measure(function, repeat):
+    """Get the median time of one call in milliseconds over repeat rounds of at least 0.2s"""
+    timer = timeit.Timer(function)
+    loops, _ = timer.autorange()
+    return statistics.median(timer.repeat(repeat=repeat, number=loops)) / loops * 1000
+
+
+def run(sizes, repeat, name_filter=None):
+    """Run the benchmarks and get 'name@size' -> milliseconds per call, with the calibration loop's time"""
+    results = {'calibration': measure(calibrate, repeat)}
+    print(f"{'calibration':<40} {results['calibration']:10.3f} ms")
+    with tempfile.TemporaryDirectory() as directory:
+        for size in sizes:
+            for name, function in make_benchmarks(size, directory).items():
+                if name_filter and name_filter not in name:
+                    continue
+                key = f"{name}@{size}"
+                results[key] = measure(function, repeat)
+                print(f"{key:<40} {results[key]:10.3f} ms")
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Get (key, baseline ms, current ms, ratio) of the results slower than baseline by more than threshold.
+    
+    The ratio is relative to the calibration loop of each run, so a machine that is
+    uniformly slower today doesn't report every benchmark.
+    """
+    regressions = []
+    scale = results['calibration'] / baseline['calibration'] if baseline.get('calibration') else 1.0
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if key == 'calibration' or not previous:
+            continue
+        ratio = current / (previous * scale)
+        if ratio > 1 + threshold:
+            regressions.append((key, previous, current, ratio))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the data layer against a stored baseline")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[100, 1000, 10000], help="Events per benchmark")
+    parser.add_argument('--repeat', type=int, default=9, help="Timing rounds per benchmark; the median is kept")
+    parser.add_argument('--filter', help="Only run benchmarks whose name contains this")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help="Baseline JSON file")
+    parser.add_argument('--save', action='store_true', help="Write the results as the new baseline")
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help="Calibrated slowdown that counts as a regression (default: 0.25 = 25%%)")
+    parser.add_argument('--strict', action='store_true', help="Exit with status 1 when there are regressions")
+    args = parser.parse_args()
+    
+    print(f"Python {platform.python_version()} on {platform.platform()}")
+    results = run(args.sizes, args.repeat, args.filter)
+    
+    if args.save:
+        baseline = {
+            'recorded': datetime.datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'results_ms': {key: round(value, 4) for key, value in results.items()}
+        }
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2)
+            f.write('\n')
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; record one with --save")
+        return 0
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    print(f"Baseline recorded {baseline.get('recorded')} with Python {baseline.get('python')}")
+    
+    previous_results = baseline['results_ms']
+    scale = results['calibration'] / previous_results['calibration'] if previous_results.get('calibration') else 1.0
+    print(f"Calibration loop {(scale - 1) * 100:+.1f}% against the baseline; changes below are relative to it")
+    for key, value in results.items():
+        previous = previous_results.get(key)
+        if previous and key != 'calibration':
+            print(f"{key:<40} {(value / (previous * scale) - 1) * 100:+7.1f}%")
+    regressions = compare(results, previous_results, args.threshold)
+    for key, previous, current, ratio in regressions:
+        print(f"REGRESSION {key}: {previous:.3f}ms -> {current:.3f}ms ({ratio:.2f}x calibrated)")
+    if not regressions:
+        print(f"No regressions above {args.threshold:.0%}")
+        return 0
+    if args.strict:
+        return 1
+    print("Advisory only; rerun to confirm, or pass --strict to fail on regressions")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,278 @@
+"""
+Headless Football Scores Daemon
+Runs the scraper and data pipeline on a schedule without Tk and writes NDJSON records.
+
+Usage:
+    python daemon.py                          # records on stdout, logs on stderr
+    python daemon.py --output data/daemon     # replayable segment-*.ndjson history and metrics.ndjson
+    python daemon.py --once --interval 60
+    python daemon.py --serve 8765 --output data/daemon   # also serve /events, /live and /tournaments
+    python daemon.py --source http://central:8765 --serve 8765   # relay another daemon
+    python daemon.py --segment data/snapshot.seg   # local UIs: python main.py --source shm:data/snapshot.seg
+"""
+
+import argparse
+import json
+import os
+import signal
+import sys
+import threading
+import time
+
+# Add src directory to Python path
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src'))
+
+from core.executor import ExecutorService
+from core.refresh_scheduler import RefreshPolicy
+from data.data_processor import DataProcessor
+from data.sources import create_source
+from data.api_server import MatchAPIServer
+from data.snapshot_segment import SnapshotPublisher
+from data.delta_log import DeltaLog
+
+try:
+    import resource  # Unix only
+except ImportError:
+    resource = None
+
+
+def log(message):
+    """Print a log line to stderr so stdout stays valid NDJSON"""
+    print(message, file=sys.stderr, flush=True)
+
+
+def get_usage():
+    """Get (own CPU seconds, child CPU seconds, peak RSS in KB) of this process
+    
+    Chromium runs as a child process; its CPU time is counted once it has exited.
+    Peak RSS is None where the resource module is unavailable.
+    """
+    if resource is None:
+        return time.process_time(), 0.0, None
+    own = resource.getrusage(resource.RUSAGE_SELF)
+    children = resource.getrusage(resource.RUSAGE_CHILDREN)
+    max_rss = own.ru_maxrss // 1024 if sys.platform == 'darwin' else own.ru_maxrss  # Bytes on macOS
+    return own.ru_utime + own.ru_stime, children.ru_utime + children.ru_stime, max_rss
+
+
+class NDJSONWriter:
+    """Writes records as one JSON object per line, to a stream or to one file per record type."""
+    
+    def __init__(self, output_dir=None, stream=None):
+        self.output_dir = output_dir
+        self.stream = stream or sys.stdout
+        self.files = {}  # record type -> open file
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+    
+    def write(self, record):
+        """Write a record with a 'type' key, e.g. 'snapshot', 'delta' or 'metrics'"""
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+        if not self.output_dir:
+            self.stream.write(line)
+            self.stream.flush()
+            return
+        
+        record_type = record['type']
+        if record_type not in self.files:
+            name = record_type if record_type.endswith('s') else record_type + 's'
+            path = os.path.join(self.output_dir, f"{name}.ndjson")
+            self.files[record_type] = open(path, 'a', encoding='utf-8')
+        self.files[record_type].write(line)
+        self.files[record_type].flush()
+    
+    def close(self):
+        """Close the record files"""
+        for f in self.files.values():
+            f.close()
+        self.files = {}
+
+
+class Daemon:
+    """Refreshes match data on a schedule and writes snapshot, delta and metrics records.
+    
+    Snapshot and delta records come from the delta log: a full snapshot on the
+    first successful refresh and then every snapshot_every records, with only
+    the changes against the previous refresh in between. Without a delta log
+    they go to writer. The interval adapts to the data unless fixed. Every
+    successful refresh is also published to the API server and the
+    shared-memory segment, if any.
+    """
+    
+    def __init__(self, writer, processor=None, policy=None, interval=None, snapshot_every=10, timeout=60,
+                 server=None, publisher=None, delta_log=None):
+        self.writer = writer
+        self.server = server
+        self.publisher = publisher
+        self.delta_log = delta_log or DeltaLog(writer=writer, checkpoint_every=max(0, snapshot_every - 1))
+        self.processor = processor or DataProcessor(executor=ExecutorService(pools={'io': 1}))
+        self.processor.prepare_on_fetch = False  # Nothing draws match cards here
+        self.policy = policy or RefreshPolicy()
+        self.interval = interval  # Fixed seconds between refreshes; None adapts to the data
+        self.timeout = timeout  # Seconds before a refresh is cancelled
+        self.refreshes = 0
+        self.failures = 0
+        self.stop_event = threading.Event()
+    
+    def fetch(self):
+        """Run one fetch to completion and get (success, data or error message)"""
+        result = {}
+        
+        def on_fetched(success, data_or_error):
+            result['success'] = success
+            result['data'] = data_or_error
+        
+        if not self.processor.start_fetching(on_fetched):
+            return False, self.processor.get_last_error() or "Failed to start scraper"
+        if not self.processor.wait_until_idle(self.timeout):
+            self.processor.stop_fetching()
+            self.processor.wait_until_idle(5)
+            return False, f"Timed out after {self.timeout}s"
+        if not result:
+            return False, "Fetch cancelled"
+        return result['success'], result['data']
+    
+    def refresh(self):
+        """Fetch once, write the records and get the delay in seconds until the next refresh"""
+        cpu_before, child_cpu_before, _ = get_usage()
+        start = time.perf_counter()
+        success, data = self.fetch()
+        duration_ms = (time.perf_counter() - start) * 1000
+        timestamp = time.time()
+        self.refreshes += 1
+        
+        metrics = {'type': 'metrics', 'ts': timestamp, 'refresh': self.refreshes, 'success': success,
+                   'source': self.processor.source.name}
+        if success:
+            self.failures = 0
+            metrics.update(self.write_data(data, timestamp))
+            delay, reason = self.policy.next_interval(data)
+        else:
+            self.failures += 1
+            metrics['error'] = data
+            delay = self.policy.error_interval(self.failures)
+            reason = f"retry after {self.failures} failed refresh(es)"
+            log(f"Refresh failed: {data}")
+        if self.interval is not None:
+            delay, reason = self.interval, "fixed interval"
+        
+        cpu_after, child_cpu_after, max_rss = get_usage()
+        metrics.update({
+            'duration_ms': round(duration_ms, 1),
+            'cpu_ms': round((cpu_after - cpu_before) * 1000, 1),
+            'child_cpu_ms': round((child_cpu_after - child_cpu_before) * 1000, 1),
+            'max_rss_kb': max_rss,
+            'data_age_s': self.processor.source.get_freshness()['age_seconds'],
+            'next_refresh_s': round(delay, 1),
+            'reason': reason
+        })
+        self.writer.write(metrics)
+        return delay, reason
+    
+    def write_data(self, data, timestamp):
+        """Log a snapshot or the deltas since the previous refresh and publish; get the metrics fields"""
+        version = self.processor.snapshot_version
+        record = self.delta_log.append(data, timestamp, version)
+        if record is None:
+            deltas = 0  # Nothing changed, nothing written
+        else:
+            deltas = len(record['deltas']) if record['type'] == 'delta' else None
+        if self.server:
+            self.server.publish(data, version)
+        if self.publisher:
+            self.publisher.publish(data, version)
+        return {'version': version, 'events': len(data.get('events', [])), 'deltas': deltas}
+    
+    def run(self, max_refreshes=None):
+        """Refresh until stopped or max_refreshes have run"""
+        while not self.stop_event.is_set():
+            delay, reason = self.refresh()
+            if max_refreshes and self.refreshes >= max_refreshes:
+                break
+            log(f"Next refresh in {delay:.0f}s ({reason})")
+            self.stop_event.wait(delay)
+    
+    def stop(self):
+        """Stop after the current refresh, cancelling it if one is running"""
+        self.stop_event.set()
+        self.processor.stop_fetching()
+
+
+def main():
+    """Parse arguments and run the daemon"""
+    parser = argparse.ArgumentParser(description="Fetch football matches on a schedule without a GUI.")
+    parser.add_argument('--output', metavar='DIR',
+                        help="write a replayable history (segment-*.ndjson) and metrics.ndjson to DIR "
+                             "instead of stdout")
+    parser.add_argument('--interval', type=float, metavar='SECONDS',
+                        help="fixed refresh interval (default: adapt to live matches and fixtures)")
+    parser.add_argument('--once', action='store_true', help="refresh once and exit")
+    parser.add_argument('--max-refreshes', type=int, metavar='N', help="exit after N refreshes")
+    parser.add_argument('--snapshot-every', type=int, default=10, metavar='N',
+                        help="write a full snapshot every N records, deltas in between (default: 10)")
+    parser.add_argument('--timeout', type=float, default=60, metavar='SECONDS',
+                        help="cancel a refresh that takes longer than this (default: 60)")
+    parser.add_argument('--serve', metavar='[HOST:]PORT',
+                        help="serve /events, /live and /tournaments over HTTP (default host: 127.0.0.1)")
+    parser.add_argument('--segment', metavar='PATH',
+                        help="publish every snapshot into a memory-mapped file for local UIs (--source shm:PATH)")
+    parser.add_argument('--keep-hours', type=float, default=48, metavar='HOURS',
+                        help="history kept in the --output directory (default: 48)")
+    parser.add_argument('--source', default='scraper', metavar='SOURCE',
+                        help="'scraper' (default), 'shared' (scrape unless another local instance already does), "
+                             "another daemon's URL or a JSON file or directory")
+    parser.add_argument('--data-file', default=os.path.join("data", "events.json"),
+                        help="where the scraper saves the latest JSON (default: data/events.json)")
+    args = parser.parse_args()
+    
+    # The scraper prints progress to stdout; send it to stderr when records go to stdout
+    writer = NDJSONWriter(args.output, stream=sys.stdout)
+    if not args.output:
+        sys.stdout = sys.stderr
+    
+    executor = ExecutorService(pools={'io': 1})
+    try:
+        source = create_source(args.source, args.data_file)
+    except ValueError as e:
+        parser.error(str(e))
+    processor = DataProcessor(output_path=args.data_file, executor=executor, source=source)
+    server = None
+    if args.serve:
+        host, _, port = args.serve.rpartition(':')
+        server = MatchAPIServer(host or '127.0.0.1', int(port))
+        server.start()
+    publisher = SnapshotPublisher(args.segment) if args.segment else None
+    checkpoint_every = max(0, args.snapshot_every - 1)
+    if args.output:
+        delta_log = DeltaLog(args.output, checkpoint_every, max_age=args.keep_hours * 3600)
+    else:
+        delta_log = DeltaLog(writer=writer, checkpoint_every=checkpoint_every)
+    daemon = Daemon(writer, processor, interval=args.interval, timeout=args.timeout, server=server,
+                    publisher=publisher, delta_log=delta_log)
+    
+    def handle_signal(signum, frame):
+        log("Stopping...")
+        daemon.stop()
+    
+    signal.signal(signal.SIGINT, handle_signal)
+    signal.signal(signal.SIGTERM, handle_signal)
+    
+    try:
+        daemon.run(1 if args.once else args.max_refreshes)
+    finally:
+        if server:
+            server.stop()
+            log(f"API: {server.get_stats()}")
+        if publisher:
+            publisher.close()
+            log(f"Segment: {publisher.stats}")
+        delta_log.close()
+        log(f"Delta log: {delta_log.stats}")
+        executor.shutdown(timeout=5.0)
+        source.close()
+        writer.close()
+        log(executor.describe_stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -5,27 +5,43 @@ Main entry point that imports and orchestrates all components.
 
 import tkinter as tk
 from tkinter import messagebox
+import argparse
 import sys
 import os
+import threading
 
 # Add src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from core.design_system import DesignSystem
 from core.theme_manager import ThemeManager
+from core.preferences import CollapsedTournaments
+from core.refresh_scheduler import RefreshScheduler
+from core.dispatcher import MainThreadDispatcher
+from core.executor import get_executor
 from ui.header import Header
 from ui.sidebar import Sidebar
 from ui.content import ContentArea
 from ui.status_bar import StatusBar
 from ui.match_display import MatchDisplay
+from ui.animation import AnimationClock
 from data.data_processor import DataProcessor, MatchOrganizer
+from data.stream_client import StreamSubscriber
+from data.sources import SharedSource, create_source
+from data.shared_snapshot import SnapshotWatcher
+from data.replay import ReplayPlayer, load_records
 
 
 class FootballApp:
     """Main Football Scores Pro application."""
     
-    def __init__(self, root):
+    def __init__(self, root, stream_url=None, source=None, replay_path=None, replay_speed=1.0):
         self.root = root
+        self.stream_url = stream_url  # Follow a daemon's /stream instead of scraping locally
+        self.stream_subscriber = None
+        self.replay_path = replay_path  # Play a recording back instead of fetching
+        self.replay_player = None
+        self.snapshot_watcher = None
         self.root.title("Football Scores Pro")
         self.root.geometry("1400x900")
         self.root.minsize(1200, 800)
@@ -33,16 +49,26 @@ class FootballApp:
         try:
             # Initialize design system with saved theme or default to dark
             saved_theme = self.load_theme_preference()
-            self.design = DesignSystem(theme=saved_theme or 'dark')
+            self.design = DesignSystem(theme=saved_theme or 'dark', root=self.root)
             
             # Initialize theme manager
             self.theme_manager = ThemeManager(self.design)
             
-            # Initialize data processor
-            self.data_processor = DataProcessor()
+            # Worker threads hand results to the Tk thread through this queue
+            self.dispatcher = MainThreadDispatcher(self.root)
+            self.dispatcher.start()
             
-            # Initialize match display
+            # Initialize data processor; the scraper unless another data source is given
+            self.data_processor = DataProcessor(source=source)
+            
+            # One clock drives every animation and pauses while the window is hidden
+            self.animation_clock = AnimationClock(self.root, self.design)
+            
+            # Initialize match display with the remembered collapsed tournaments
             self.match_display = MatchDisplay(self.design)
+            self.match_display.set_collapse_state(CollapsedTournaments())
+            self.match_display.set_view_model_builder(self.data_processor.view_models)
+            self.match_display.set_animation_clock(self.animation_clock)
             
             # Setup main container
             self.setup_main_container()
@@ -50,15 +76,52 @@ class FootballApp:
             # Initialize UI components
             self.initialize_components()
             
-            # Register for theme changes
+            # Register for theme changes; widget colors follow their theme bindings
             self.design.register_theme_change_callback(self.on_theme_changed)
             
-            # Apply initial theme
-            self.apply_theme()
+            # Refresh automatically at an interval chosen from the latest snapshot
+            self.background_fetch = False
+            self.refresh_scheduler = RefreshScheduler(
+                self.root,
+                self.auto_refresh,
+                is_busy=self.data_processor.is_fetching,
+                on_pause=self.data_processor.source.pause
+            )
             
-            # Automatically fetch matches when the app starts
-            self.root.after(1000, self.fetch_matches)
+            # Cancel background work before the window goes away
+            self.root.protocol("WM_DELETE_WINDOW", self.on_close)
             
+            if self.replay_path:
+                # Recorded snapshots arrive on their scaled timeline; nothing is fetched
+                self.replay_player = ReplayPlayer(
+                    load_records(self.replay_path),
+                    self.on_replay_data,
+                    speed=replay_speed,
+                    on_finished=self.dispatcher.wrap(self.on_replay_finished, key='replay_finished')
+                )
+                self.replay_player.start()
+                self.status_bar.update_status(f"Replaying {self.replay_path} at {replay_speed:g}x...")
+            elif self.stream_url:
+                # Matches arrive from the stream; nothing is scraped or scheduled locally
+                self.stream_subscriber = StreamSubscriber(
+                    self.stream_url,
+                    self.on_stream_data,
+                    on_status=self.dispatcher.wrap(self.status_bar.update_status, key='stream_status')
+                )
+                self.stream_subscriber.start()
+                self.status_bar.update_status(f"Connecting to {self.stream_url}...")
+            else:
+                # Automatically fetch matches when the app starts
+                self.root.after(1000, self.fetch_matches)
+            
+            # Followers pick up the leader's new snapshots as soon as they are saved
+            if not (self.stream_url or self.replay_path) and isinstance(self.data_processor.source, SharedSource):
+                self.snapshot_watcher = SnapshotWatcher(
+                    self.data_processor.source.path,
+                    self.dispatcher.wrap(self.on_snapshot_changed, key='snapshot_changed')
+                )
+                self.snapshot_watcher.start()
+        
         except Exception as e:
             messagebox.showerror("Initialization Error", f"Failed to initialize application: {str(e)}")
             self.root.destroy()
@@ -96,40 +159,16 @@ class FootballApp:
     def on_theme_changed(self):
         """Handle theme change event"""
         self.save_theme_preference(self.design.current_theme)
-        self.apply_theme()
-    
-    def apply_theme(self):
-        """Apply current theme to the root window and main container"""
-        try:
-            # Update root and main container colors
-            self.root.config(bg=self.design.colors['bg_primary'])
-            self.main_container.config(bg=self.design.colors['bg_primary'])
-            self.content_frame.config(bg=self.design.colors['bg_secondary'])
-            
-            # Update header if it exists
-            if hasattr(self, 'header') and hasattr(self.header, 'update_theme'):
-                self.header.update_theme(self.design)
-                
-            # Update sidebar if it exists
-            if hasattr(self, 'sidebar') and hasattr(self.sidebar, 'refresh'):
-                self.sidebar.refresh()
-                
-            # Update content area if it exists
-            if hasattr(self, 'content') and hasattr(self.content, 'update_theme'):
-                self.content.update_theme(self.design)
-                
-        except Exception as e:
-            print(f"Error applying theme: {e}")
     
     def setup_main_container(self):
         """Setup the main container with gradient background"""
-        self.main_container = tk.Frame(self.root, bg=self.design.colors['bg_primary'])
+        self.design.bind_roles(self.root, bg='bg_primary')
+        self.main_container = self.design.themed(tk.Frame, self.root, {'bg': 'bg_primary'})
         self.main_container.pack(fill=tk.BOTH, expand=True)
         
         # Content area with card design
-        self.content_frame = tk.Frame(
-            self.main_container, 
-            bg=self.design.colors['bg_secondary'],
+        self.content_frame = self.design.themed(
+            tk.Frame, self.main_container, {'bg': 'bg_secondary'},
             relief=tk.FLAT
         )
         # Don't pack the content frame yet - it will be packed after the header
@@ -139,6 +178,7 @@ class FootballApp:
         """Initialize all UI components"""
         # Create header first
         self.header = Header(self.main_container, self.design)
+        self.header.set_animation_clock(self.animation_clock)
         
         # Now pack the content frame below the header
         self.content_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(0, 20))
@@ -174,39 +214,96 @@ class FootballApp:
         self.theme_manager.register_component(self.status_bar)
         self.theme_manager.register_component(self.match_display)
     
-    def fetch_matches(self):
-        """Start fetching matches with modern UI updates"""
+    def fetch_matches(self, force=False, background=False):
+        """Start fetching matches with modern UI updates
+        
+        force bypasses the data cache; background keeps the current view on screen
+        and reports errors in the status bar instead of a dialog.
+        """
         if self.data_processor.is_fetching():
             return
         
+        if self.stream_subscriber:
+            self.stream_subscriber.resync()
+            self.status_bar.update_status("Resynchronizing with the stream...")
+            return
+        if self.replay_player:
+            self.status_bar.update_status(self.replay_player.describe())
+            return
+        
         # Check if we have valid cached data
-        cached_data = self.data_processor.get_cached_data()
+        cached_data = None if force else self.data_processor.get_cached_data()
         if cached_data:
             print("Using cached data for faster loading")
             self.process_results(cached_data)
             return
             
         # Update UI state
+        self.background_fetch = background
         self.sidebar.set_fetch_button_state(False)
-        self.sidebar.update_status("Fetching matches...", self.design.colors['primary'], "●")
-        self.status_bar.update_status("Fetching live matches...")
+        self.sidebar.update_status("Fetching matches...", 'primary', "●")
+        self.status_bar.update_status("Refreshing matches..." if background else "Fetching live matches...")
         
         # Show loading state
-        self.content.show_modern_loading_state()
+        if not background:
+            self.content.show_modern_loading_state()
         
-        # Start fetching with callback
-        success = self.data_processor.start_fetching(self.on_data_fetched)
+        # Start fetching; the result is delivered on the Tk thread by the dispatcher
+        success = self.data_processor.start_fetching(
+            self.dispatcher.wrap(self.on_data_fetched, key='fetch_result')
+        )
         
         if not success:
+            self.refresh_scheduler.on_refresh_complete(False)
             error_msg = self.data_processor.get_last_error() or "Failed to start scraper"
             self.show_error(error_msg)
     
+    def auto_refresh(self):
+        """Refresh in the background when the refresh scheduler says so"""
+        self.fetch_matches(force=True, background=True)
+    
+    def on_stream_data(self, data, version):
+        """Take a snapshot rebuilt from the stream, on the subscriber thread"""
+        self.data_processor.set_data(data)
+        self.data_processor.prepare_view_models()
+        self.dispatcher.post(self.process_results, data, key='fetch_result')
+    
+    def on_replay_data(self, data, version, due, ts):
+        """Take a replayed snapshot through the same path as stream updates, on the replay thread"""
+        # Live minutes run from the recorded time at the replay's speed, not from today's clock
+        self.data_processor.set_data(data, fetched_at=ts, clock_rate=self.replay_player.speed)
+        self.data_processor.prepare_view_models()
+        self.dispatcher.post(self.show_replay_frame, data, due, key='fetch_result')
+    
+    def show_replay_frame(self, data, due):
+        """Display a replayed snapshot and record how late it is on screen"""
+        self.process_results(data)
+        self.root.update_idletasks()
+        self.replay_player.record_render(due)
+        self.status_bar.update_status(self.replay_player.describe())
+    
+    def on_replay_finished(self):
+        """Report the lag behind the recorded timeline once the replay ends"""
+        print(f"Replay finished: {self.replay_player.get_report()}")
+        self.status_bar.update_status(f"{self.replay_player.describe()} (finished)")
+    
+    def on_snapshot_changed(self):
+        """Reload the shared snapshot another instance has just saved, unless minimized"""
+        if (not self.data_processor.source.is_leader and not self.data_processor.is_fetching()
+                and not self.refresh_scheduler.paused):
+            self.fetch_matches(force=True, background=True)
+    
     def on_data_fetched(self, success, data_or_error):
-        """Callback for when data fetching is complete"""
+        """Callback for when data fetching is complete, delivered on the Tk thread"""
+        self.refresh_scheduler.on_refresh_complete(success, data_or_error if success else None)
         if success:
             # Cache the data for future use
             self.data_processor.set_cached_data(data_or_error)
             self.process_results(data_or_error)
+        elif self.background_fetch:
+            self.cleanup()
+            self.sidebar.update_status("Refresh failed, will retry", 'warning', "●")
+            self.status_bar.update_status(f"Auto-refresh failed: {data_or_error}")
         else:
             self.show_error(data_or_error)
     
@@ -225,10 +322,10 @@ class FootballApp:
             showing = limited_data.get('showing', stats['total_matches'])
             
             if total_available > showing:
-                self.sidebar.update_status(f"Showing {showing} of {total_available} matches", self.design.colors['success'], "●")
+                self.sidebar.update_status(f"Showing {showing} of {total_available} matches", 'success', "●")
                 self.status_bar.update_status(f"Showing {showing} of {total_available} matches (lazy loading enabled)")
             else:
-                self.sidebar.update_status(f"Loaded {stats['total_matches']} matches", self.design.colors['success'], "●")
+                self.sidebar.update_status(f"Loaded {stats['total_matches']} matches", 'success', "●")
                 self.status_bar.update_status(f"Successfully loaded {stats['total_matches']} matches")
             
             self.status_bar.update_match_count(stats['total_matches'])
@@ -237,15 +334,16 @@ class FootballApp:
             print(f"Live: {stats['live_matches']}, Finished: {stats['finished_matches']}, Upcoming: {stats['upcoming_matches']}")
             
             # Display content based on current view using limited data
+            version = self.data_processor.snapshot_version
             if self.content.current_view == "live_matches":
-                self.content.show_live_matches(limited_data)
+                self.content.show_live_matches(limited_data, version)
             elif self.content.current_view == "fixtures":
-                self.content.show_fixtures(limited_data)
+                self.content.show_fixtures(limited_data, version)
             elif self.content.current_view == "finished":
-                self.content.show_finished(limited_data)
+                self.content.show_finished(limited_data, version)
             else:
                 # Default to live matches view
-                self.content.show_live_matches(limited_data)
+                self.content.show_live_matches(limited_data, version)
                 
         except Exception as e:
             self.show_error(f"Error processing results: {str(e)}")
@@ -256,15 +354,38 @@ class FootballApp:
         """Stop the running scraper"""
         self.data_processor.stop_fetching()
         self.cleanup()
-        self.sidebar.update_status("Stopped by user", self.design.colors['warning'], "⏸")
+        self.sidebar.update_status("Stopped by user", 'warning', "⏸")
         self.status_bar.update_status("Operation stopped")
     
     def cleanup(self):
         """Clean up after fetching is complete"""
         self.sidebar.set_fetch_button_state(True)
     
+    def on_close(self):
+        """Stop timers, cancel background tasks and close the window"""
+        self.refresh_scheduler.cancel()
+        self.data_processor.stop_fetching()
+        if self.stream_subscriber:
+            self.stream_subscriber.stop()
+        if self.replay_player:
+            self.replay_player.stop()
+            print(f"Replay: {self.replay_player.get_report()}")
+        if self.snapshot_watcher:
+            self.snapshot_watcher.stop()
+        executor = get_executor()
+        print(executor.describe_stats())
+        print(self.data_processor.source.describe())
+        executor.shutdown(timeout=2.0)
+        self.data_processor.source.close()
+        self.dispatcher.stop()
+        self.root.destroy()
+    
     def show_error(self, message):
         """Display an error message with modern styling"""
+        if threading.current_thread() is not threading.main_thread():
+            self.dispatcher.post(self.show_error, message, key='error')
+            return
+        
         messagebox.showerror("Error", message)
         self.cleanup()
         self.content.content_subtitle.config(text="Real-time football scores and updates")
@@ -275,27 +396,27 @@ class FootballApp:
         self.sidebar.update_nav_selection(0)
         self.status_bar.update_status("Viewing live matches")
         
-        # Get current data and show live matches
-        data = self.data_processor.get_data()
-        self.content.show_live_matches(data)
+        # Show the slice process_results displays, so the retained view is reused if unchanged
+        data = self.data_processor.get_limited_data()
+        self.content.show_live_matches(data, self.data_processor.snapshot_version)
     
     def show_fixtures(self):
         """Show upcoming fixtures"""
         self.sidebar.update_nav_selection(1)
         self.status_bar.update_status("Viewing upcoming fixtures")
         
-        # Get current data and show fixtures
-        data = self.data_processor.get_data()
-        self.content.show_fixtures(data)
+        # Show the slice process_results displays, so the retained view is reused if unchanged
+        data = self.data_processor.get_limited_data()
+        self.content.show_fixtures(data, self.data_processor.snapshot_version)
     
     def show_finished(self):
         """Show finished matches"""
         self.sidebar.update_nav_selection(2)
         self.status_bar.update_status("Viewing finished matches")
         
-        # Get current data and show finished matches
-        data = self.data_processor.get_data()
-        self.content.show_finished(data)
+        # Show the slice process_results displays, so the retained view is reused if unchanged
+        data = self.data_processor.get_limited_data()
+        self.content.show_finished(data, self.data_processor.snapshot_version)
     
     def show_settings(self):
         """Show settings"""
@@ -308,16 +429,7 @@ class FootballApp:
     def switch_theme(self, theme):
         """Switch application theme"""
         if self.theme_manager.switch_theme(theme):
-            # Update root window background
-            self.root.configure(bg=self.design.colors['bg_primary'])
-            
-            # Update main container background
-            self.main_container.configure(bg=self.design.colors['bg_primary'])
-            
-            # Update content frame background
-            self.content_frame.configure(bg=self.design.colors['bg_secondary'])
-            
-            print(f"Theme switched to: {theme}")
+            print(f"Theme switched to: {theme} in {self.design.last_switch_ms:.1f}ms")
             self.status_bar.update_status(f"Switched to {theme} theme")
         else:
             print(f"Failed to switch to theme: {theme}")
@@ -325,6 +437,27 @@ class FootballApp:
 
 def main():
     """Main entry point for the application"""
+    parser = argparse.ArgumentParser(description="Football Scores Pro")
+    parser.add_argument('--stream', metavar='URL',
+                        help="follow a daemon's match stream, e.g. http://host:8765/stream, instead of scraping")
+    parser.add_argument('--source', default='scraper', metavar='SOURCE',
+                        help="where to fetch matches: 'scraper' (default), 'shared' (one instance per machine "
+                             "scrapes, the others read its snapshot), a daemon URL such as "
+                             "http://host:8765, shm:PATH of a local daemon's --segment or a JSON file or directory")
+    parser.add_argument('--replay', metavar='PATH',
+                        help="play back a recording (a daemon --output directory or an NDJSON file)")
+    parser.add_argument('--speed', type=float, default=1.0,
+                        help="replay speed, e.g. 1, 10 or 100 times real time (default: 1)")
+    args = parser.parse_args()
+    if args.replay and not os.path.exists(args.replay):
+        parser.error(f"No recording at {args.replay}")
+    if args.speed <= 0:
+        parser.error("--speed must be positive")
+    try:
+        source = create_source(args.source, os.path.join("data", "events.json"))
+    except ValueError as e:
+        parser.error(str(e))
+    
     root = tk.Tk()
     
     # Configure root window with modern styling
@@ -337,7 +470,7 @@ def main():
     except:
         pass
     
-    app = FootballApp(root)
+    app = FootballApp(root, stream_url=args.stream, source=source, replay_path=args.replay, replay_speed=args.speed)
     root.mainloop()
 
 
@@ -1,10 +1,21 @@
-from playwright.sync_api import sync_playwright
+from playwright.sync_api import sync_playwright, TimeoutError as PlaywrightTimeoutError
 import json
 import time
 import os
+import sys
+import threading
 from typing import Optional, Dict, Any
 
+try:
+    from core.fileio import atomic_write_json
+except ImportError:  # Imported without the app's src/ on the path
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+    from core.fileio import atomic_write_json
+
 class MatchScraper:
+    # Only one Chromium scrape runs at a time, however many scrapers exist
+    scrape_lock = threading.Lock()
+    
     def __init__(self, date: Optional[str] = None, output_path: str = "data/events.json"):
         """Initialize the MatchScraper.
         
@@ -24,6 +35,8 @@ class MatchScraper:
         self.url = f"https://www.sofascore.com/football/{date}"
         self.output_path = output_path
         self.json_data: Optional[Dict[str, Any]] = None
+        self.response_processed = False
+        self.stop_event = threading.Event()  # Set by stop() from any thread
 
     def _log_response(self, response) -> None:
         """Handle the response from the server.
@@ -31,15 +44,14 @@ class MatchScraper:
         Args:
             response: The response object from Playwright.
         """
+        if self.stop_event.is_set():
+            return
         if "scheduled-events" in response.url and response.status == 200:
             print(f"✅ Found request: {response.url}")
             try:
                 self.json_data = response.json()
-                # Ensure the directory exists before writing
-                os.makedirs(os.path.dirname(os.path.abspath(self.output_path)), exist_ok=True)
-                
-                with open(self.output_path, "w", encoding="utf-8") as f:
-                    json.dump(self.json_data, f, ensure_ascii=False, indent=4)
+                # Swap in a complete file, so other instances never read a partial one
+                atomic_write_json(self.output_path, self.json_data)
                 print(f"✅ JSON saved to {self.output_path}")
                 self.response_processed = True
             except json.JSONDecodeError as e:
@@ -52,11 +64,14 @@ class MatchScraper:
                 print(f"❌ Unexpected error: {e}")
                 self.response_processed = True
 
-    def run(self, wait_time: int = 10000) -> bool:
+    def run(self, wait_time: int = 10000, poll_interval: int = 100, navigation_timeout: int = 1000) -> bool:
         """Run the scraper to fetch match data.
         
         Args:
             wait_time: Maximum time to wait for the data in milliseconds.
+            poll_interval: How often to check for data or a stop request in milliseconds.
+            navigation_timeout: How long the initial navigation may block before the
+                stop-aware poll loop takes over, in milliseconds.
             
         Returns:
             bool: True if data was successfully fetched and saved, False otherwise.
@@ -64,8 +79,25 @@ class MatchScraper:
         self.response_processed = False
         self.json_data = None
         
+        # Wait for any other scrape to finish, giving up if stopped meanwhile
+        start_time = time.monotonic()
+        while not MatchScraper.scrape_lock.acquire(timeout=poll_interval / 1000):
+            if self.stop_event.is_set() or (time.monotonic() - start_time) * 1000 >= wait_time:
+                print("⚠️ Another scrape is still running")
+                return False
+        
+        try:
+            if self.stop_event.is_set():
+                return False
+            return self._scrape(wait_time, poll_interval, navigation_timeout)
+        finally:
+            MatchScraper.scrape_lock.release()
+    
+    def _scrape(self, wait_time: int, poll_interval: int, navigation_timeout: int) -> bool:
+        """Open the page and wait for the data, closing the browser however the wait ends."""
         try:
             with sync_playwright() as p:
+                browser = context = page = None
                 try:
                     browser = p.chromium.launch(headless=True)
                     context = browser.new_context()
@@ -74,19 +106,24 @@ class MatchScraper:
                     page.on("response", self._log_response)
                     print("➡️ Opening page...")
                     
-                    # Navigate to the page
-                    page.goto(self.url, wait_until="domcontentloaded")
-                    print(f"🌐 Loaded page: {self.url}")
+                    # Block on navigation for at most a short slice, so stop() is noticed quickly;
+                    # a timed out goto leaves the page loading and the data arrives while we poll below
+                    start_time = time.monotonic()
+                    try:
+                        page.goto(self.url, wait_until="commit", timeout=min(navigation_timeout, wait_time))
+                        print(f"🌐 Opened page: {self.url}")
+                    except PlaywrightTimeoutError:
+                        print("⏳ Page still loading, waiting for data...")
 
-                    # Wait for data to be processed
-                    start_time = time.time()
-                    while not self.response_processed and (time.time() - start_time) * 1000 < wait_time:
-                        page.wait_for_timeout(100)
+                    # Wait for data to be processed or a stop request
+                    while (not self.response_processed and not self.stop_event.is_set()
+                           and (time.monotonic() - start_time) * 1000 < wait_time):
+                        page.wait_for_timeout(poll_interval)
                     
-                    # Clean up
-                    context.close()
-                    browser.close()
-                    print("🚪 Browser closed.")
+                    if self.stop_event.is_set():
+                        print("⏹️ Scrape cancelled")
+                        self.json_data = None
+                        return False
                     
                     if not self.response_processed:
                         print("⚠️ Timed out waiting for data")
@@ -95,15 +132,34 @@ class MatchScraper:
                     return self.json_data is not None
 
                 except Exception as e:
-                    print(f"❌ Browser error: {e}")
+                    if self.stop_event.is_set():
+                        print("⏹️ Scrape cancelled")
+                    else:
+                        print(f"❌ Browser error: {e}")
                     return False
+                finally:
+                    self._close(page, context, browser)
                     
         except Exception as e:
             print(f"❌ Playwright error: {e}")
             return False
     
-    def stop(self):
-        """Stop the scraper (placeholder method for compatibility)"""
-        # This method is called by the data processor but the scraper
-        # doesn't need explicit stopping since it runs synchronously
-        pass
\ No newline at end of file
+    def _close(self, page, context, browser) -> None:
+        """Close the page, context and browser, ignoring ones that failed to open."""
+        for resource in (page, context, browser):
+            if resource is None:
+                continue
+            try:
+                resource.close()
+            except Exception as e:
+                print(f"⚠️ Error closing browser: {e}")
+        if browser is not None:
+            print("🚪 Browser closed.")
+    
+    def stop(self) -> None:
+        """Ask a running scrape to stop; safe to call from any thread.
+        
+        The scrape notices within one poll interval (one navigation timeout while
+        the page is opening), closes the browser and discards any data it received.
+        """
+        self.stop_event.set()
\ No newline at end of file
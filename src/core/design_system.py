@@ -3,16 +3,88 @@ Design System Module
 Contains all design tokens including colors, fonts, spacing, and styling configurations.
 """
 
+import time
+import weakref
 import tkinter as tk
 from tkinter import ttk
+import tkinter.font as tkfont
+
+from core.text import truncate_name
+
+
+# Semantic color roles shared by widgets, mapped to palette keys of the current theme
+COLOR_ROLES = {
+    'surface': 'bg_card',
+    'surface_alt': 'bg_primary',
+    'card_bg': 'bg_card',
+    'card_border': 'border',
+    'card_border_hover': 'primary',
+    'card_text': 'text_primary',
+    'card_badge_bg': 'bg_primary',
+    'card_badge_fg': 'primary',
+    'card_status_bg': 'bg_primary',
+    'winner_text': 'finished',
+    'header_bg': 'bg_header',
+    'header_text': 'text_white',
+    'sidebar_bg': 'bg_sidebar',
+    'input_bg': 'bg_input',
+}
+
+
+class ThemeBindings:
+    """Registry of widget options that follow color roles across theme switches.
+    
+    Widgets register their roles once when created; a theme switch reconfigures
+    them in a single pass instead of walking the widget tree or rebuilding.
+    """
+    
+    def __init__(self):
+        self.bindings = []  # (weak widget reference, {option: role})
+        self.compact_at = 1024
+    
+    def register(self, widget, roles):
+        """Remember which color role drives each option of a widget"""
+        self.bindings.append((weakref.ref(widget), roles))
+        if len(self.bindings) >= self.compact_at:
+            self.compact()
+    
+    def compact(self):
+        """Drop bindings of widgets that have been garbage collected"""
+        self.bindings = [(ref, roles) for ref, roles in self.bindings if ref() is not None]
+        self.compact_at = max(1024, 2 * len(self.bindings))
+    
+    def apply(self, role_colors):
+        """Reconfigure every bound widget with the given role colors, pruning destroyed ones"""
+        live = []
+        for ref, roles in self.bindings:
+            widget = ref()
+            if widget is None:
+                continue
+            try:
+                widget.configure(**{option: role_colors[role] for option, role in roles.items()})
+            except tk.TclError:
+                continue  # Widget was destroyed but is still referenced somewhere
+            live.append((ref, roles))
+        
+        self.bindings = live
+        self.compact_at = max(1024, 2 * len(live))
+        return len(live)
+    
+    def __len__(self):
+        return len(self.bindings)
 
 
 class DesignSystem:
     """Centralized design system for the Football Scores Pro application."""
     
-    def __init__(self, theme='dark'):
+    def __init__(self, theme='dark', root=None):
         self._theme = theme
         self._callbacks = []
+        # Named fonts belong to a Tk interpreter; ttk.Style() creates the default root if needed
+        self.root = root or ttk.Style().master
+        self.font_scale = 1.0
+        self.theme_bindings = ThemeBindings()
+        self.last_switch_ms = 0.0
         self.setup_colors()
         self.setup_fonts()
         self.setup_spacing()
@@ -25,10 +97,14 @@ class DesignSystem:
     @current_theme.setter
     def current_theme(self, value):
         if value != self._theme:
+            start = time.perf_counter()
             self._theme = value
             self.setup_colors()
+            bound = self.theme_bindings.apply(self.role_colors)
             self.setup_ttk_styles()
             self.notify_theme_change()
+            self.last_switch_ms = (time.perf_counter() - start) * 1000
+            print(f"Theme '{value}' applied to {bound} bound widgets in {self.last_switch_ms:.1f}ms")
     
     def register_theme_change_callback(self, callback):
         """Register a callback to be called when theme changes"""
@@ -65,6 +141,7 @@ class DesignSystem:
                 'bg_card': '#2D2D2D',           # Dark card backgrounds
                 'bg_sidebar': '#2D2D2D',        # Dark sidebar background
                 'bg_header': '#1B1B2F',         # Midnight Navy
+                'bg_input': '#2D2D2D',          # Dark input fields
                 
                 # Text Colors
                 'text_primary': '#FFFFFF',      # White text
@@ -98,6 +175,7 @@ class DesignSystem:
                 'bg_card': '#ffffff',           # Card backgrounds
                 'bg_sidebar': '#f1f3f4',       # Light gray sidebar
                 'bg_header': '#1a73e8',         # Blue header
+                'bg_input': '#f5f5f5',          # Light gray input fields
                 
                 # Text Colors
                 'text_primary': '#202124',      # Almost black
@@ -116,10 +194,36 @@ class DesignSystem:
                 'hover': '#f1f3f4',             # Light gray hover
                 'active': '#e8f0fe',            # Light blue active
             }
+        
+        self.setup_color_roles()
+    
+    def setup_color_roles(self):
+        """Resolve named color roles (and plain palette keys) for the current theme"""
+        self.role_colors = dict(self.colors)
+        for role, palette_key in COLOR_ROLES.items():
+            self.role_colors[role] = self.colors[palette_key]
+    
+    def get_role_color(self, role):
+        """Get the current color of a named role or palette key"""
+        return self.role_colors[role]
+    
+    def themed(self, widget_class, parent, roles, **options):
+        """Create a widget whose color options follow roles, e.g. roles={'bg': 'card_bg'}"""
+        for option, role in roles.items():
+            options[option] = self.role_colors[role]
+        widget = widget_class(parent, **options)
+        self.theme_bindings.register(widget, roles)
+        return widget
+    
+    def bind_roles(self, widget, **roles):
+        """Bind color options of an existing widget to roles and apply the current colors"""
+        widget.configure(**{option: self.role_colors[role] for option, role in roles.items()})
+        self.theme_bindings.register(widget, roles)
+        return widget
     
     def setup_fonts(self):
-        """Setup typography scale"""
-        self.fonts = {
+        """Setup typography scale as named fonts shared by every widget"""
+        self.font_specs = {
             'display_large': ('Inter', 32, 'bold'),
             'display_medium': ('Inter', 24, 'bold'),
             'headline': ('Inter', 18, 'normal'),
@@ -128,6 +232,29 @@ class DesignSystem:
             'caption': ('Inter', 12, 'normal'),
             'label': ('Inter', 11, 'bold'),
         }
+        
+        # Each style also gets a bold variant, e.g. 'headline_bold'
+        self.fonts = {}
+        for key, (family, size, weight) in self.font_specs.items():
+            self.fonts[key] = self.get_named_font(key, family, size, weight)
+            self.fonts[f'{key}_bold'] = self.get_named_font(f'{key}_bold', family, size, 'bold')
+    
+    def get_named_font(self, key, family, size, weight):
+        """Create (or reuse) the named Tk font for a typography style"""
+        name = f'fsp_{key}'
+        options = {'family': family, 'size': round(size * self.font_scale), 'weight': weight}
+        if name in tkfont.names(self.root):
+            font = tkfont.nametofont(name, root=self.root)
+            font.configure(**options)
+            return font
+        return tkfont.Font(root=self.root, name=name, **options)
+    
+    def set_font_scale(self, scale):
+        """Scale every named font; widgets using them update without being touched"""
+        self.font_scale = scale
+        for key, (family, size, weight) in self.font_specs.items():
+            self.fonts[key].configure(size=round(size * scale))
+            self.fonts[f'{key}_bold'].configure(size=round(size * scale))
     
     def setup_spacing(self):
         """Setup spacing system (8px grid)"""
@@ -184,25 +311,22 @@ class DesignSystem:
                            relief='flat',
                            padding=(16, 12))
     
+    def get_section_role(self, section_type):
+        """Get the color role for a section type"""
+        return section_type if section_type in ('live', 'finished', 'upcoming') else 'primary'
+    
     def get_section_color(self, section_type):
         """Get color for section type"""
-        colors = {
-            'live': self.colors['live'],
-            'finished': self.colors['finished'],
-            'upcoming': self.colors['upcoming']
-        }
-        return colors.get(section_type, self.colors['primary'])
+        return self.colors[self.get_section_role(section_type)]
     
     def truncate_team_name(self, name, max_length=20):
-        """Truncate team name for display"""
-        return name[:max_length] + '...' if len(name) > max_length else name
+        """Truncate team name for display, as on the match cards"""
+        return truncate_name(name, max_length)
     
     def switch_theme(self, theme):
         """Switch between light and dark themes"""
         if theme in ['light', 'dark']:
             self.current_theme = theme
-            self.setup_colors()
-            self.setup_ttk_styles()
             return True
         return False
     
@@ -0,0 +1,99 @@
+"""
+Main Thread Dispatcher Module
+Delivers results from worker threads on the Tk main loop.
+"""
+
+import itertools
+import threading
+import time
+from collections import OrderedDict, deque
+
+
+class MainThreadDispatcher:
+    """Thread-safe queue of callbacks drained on the Tk thread by an after() pump.
+    
+    Worker threads post callbacks instead of touching widgets. Posts that share
+    a key supersede each other, so only the latest pending update is delivered.
+    Each delivery records how long it waited in the queue.
+    """
+    
+    def __init__(self, root, interval=30, time_budget=50, slow_latency=250):
+        self.root = root
+        self.interval = interval  # Milliseconds between pump runs
+        self.time_budget = time_budget  # Milliseconds of callbacks per pump run before yielding to Tk
+        self.slow_latency = slow_latency  # Log deliveries that waited longer than this
+        self.pending = OrderedDict()  # key -> (callback, args, enqueued at)
+        self.lock = threading.Lock()
+        self.sequence = itertools.count()
+        self.latencies = deque(maxlen=256)
+        self.stats = {'posted': 0, 'delivered': 0, 'coalesced': 0, 'errors': 0, 'max_latency_ms': 0.0}
+        self.job = None
+        self.running = False
+    
+    def start(self):
+        """Start the pump on the Tk thread"""
+        if not self.running:
+            self.running = True
+            self.job = self.root.after(self.interval, self.pump)
+    
+    def stop(self):
+        """Stop the pump; posted callbacks stay queued"""
+        self.running = False
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
+    
+    def post(self, callback, *args, key=None):
+        """Queue a callback for the Tk thread; safe to call from any thread"""
+        with self.lock:
+            self.stats['posted'] += 1
+            if key is None:
+                key = ('unkeyed', next(self.sequence))
+            elif key in self.pending:
+                self.stats['coalesced'] += 1
+                del self.pending[key]  # Superseded: the newer update takes its place at the back
+            self.pending[key] = (callback, args, time.perf_counter())
+    
+    def wrap(self, callback, key=None):
+        """Get a function that posts callback with its arguments when called from a worker"""
+        def post_to_main_thread(*args):
+            self.post(callback, *args, key=key)
+        return post_to_main_thread
+    
+    def pump(self):
+        """Deliver queued callbacks within the time budget, then reschedule"""
+        self.job = None
+        deadline = time.perf_counter() + self.time_budget / 1000
+        while time.perf_counter() < deadline:
+            with self.lock:
+                if not self.pending:
+                    break
+                key, (callback, args, enqueued) = self.pending.popitem(last=False)
+            self.deliver(key, callback, args, enqueued)
+        
+        if self.running:
+            self.job = self.root.after(self.interval, self.pump)
+    
+    def deliver(self, key, callback, args, enqueued):
+        """Run one callback and record its queue latency"""
+        latency_ms = (time.perf_counter() - enqueued) * 1000
+        self.latencies.append(latency_ms)
+        self.stats['delivered'] += 1
+        self.stats['max_latency_ms'] = max(self.stats['max_latency_ms'], latency_ms)
+        if latency_ms > self.slow_latency:
+            print(f"Dispatcher: {getattr(callback, '__name__', 'callback')} waited {latency_ms:.0f}ms in queue")
+        
+        try:
+            callback(*args)
+        except Exception as e:
+            self.stats['errors'] += 1
+            print(f"Error in dispatched callback: {e}")
+    
+    def get_stats(self):
+        """Get delivery counters, queue depth and median queue latency"""
+        with self.lock:
+            stats = dict(self.stats)
+            stats['queued'] = len(self.pending)
+        latencies = sorted(self.latencies)
+        stats['median_latency_ms'] = latencies[len(latencies) // 2] if latencies else 0.0
+        return stats
@@ -0,0 +1,288 @@
+"""
+Executor Service Module
+Runs background work on named, bounded worker pools with priorities and cancellation.
+"""
+
+import itertools
+import queue
+import threading
+import time
+
+
+# Task priorities; lower values run first
+HIGH = 0
+NORMAL = 10
+LOW = 20
+
+
+class TaskHandle:
+    """Handle to a submitted task: state, result, timings and cancellation."""
+    
+    def __init__(self, task_id, pool, name, priority, fn, args, kwargs):
+        self.id = task_id
+        self.pool = pool
+        self.name = name
+        self.priority = priority
+        self.fn = fn
+        self.args = args
+        self.kwargs = kwargs
+        self.state = 'queued'  # queued, running, done, failed, cancelled
+        self.result = None
+        self.error = None
+        self.queued_at = time.perf_counter()
+        self.started_at = None
+        self.finished_at = None
+        self.cancel_event = threading.Event()  # Set on cancel; long tasks can poll it
+        self.done_event = threading.Event()
+        self.lock = threading.Lock()
+        self.done_callbacks = []
+        self.cancel_callbacks = []
+    
+    @property
+    def cancelled(self):
+        return self.cancel_event.is_set()
+    
+    def cancel(self):
+        """Cancel the task: queued tasks never start, running tasks are asked to stop"""
+        with self.lock:
+            if self.done_event.is_set() or self.cancel_event.is_set():
+                return False
+            self.cancel_event.set()
+            callbacks = list(self.cancel_callbacks)
+            queued = self.state == 'queued'
+        
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception as e:
+                print(f"Error in cancel callback of task {self.name}: {e}")
+        if queued:
+            self.finish('cancelled')
+        return True
+    
+    def add_cancel_callback(self, callback):
+        """Call callback(handle) when the task is cancelled, e.g. to stop a blocking operation"""
+        with self.lock:
+            self.cancel_callbacks.append(callback)
+    
+    def add_done_callback(self, callback):
+        """Call callback(handle) on the worker thread once the task has finished"""
+        with self.lock:
+            if not self.done_event.is_set():
+                self.done_callbacks.append(callback)
+                return
+        callback(self)
+    
+    def wait(self, timeout=None):
+        """Wait for the task to finish; returns False on timeout"""
+        return self.done_event.wait(timeout)
+    
+    def finish(self, state, result=None, error=None):
+        """Record the outcome and run done callbacks"""
+        with self.lock:
+            if self.done_event.is_set():
+                return
+            self.state = state
+            self.result = result
+            self.error = error
+            self.finished_at = time.perf_counter()
+            self.done_event.set()
+            callbacks = list(self.done_callbacks)
+        
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception as e:
+                print(f"Error in done callback of task {self.name}: {e}")
+    
+    def get_wait_ms(self):
+        """Get how long the task waited in the queue"""
+        end = self.started_at or self.finished_at or time.perf_counter()
+        return (end - self.queued_at) * 1000
+    
+    def get_run_ms(self):
+        """Get how long the task has been running"""
+        if self.started_at is None:
+            return 0.0
+        return ((self.finished_at or time.perf_counter()) - self.started_at) * 1000
+
+
+class WorkerPool:
+    """Fixed number of worker threads serving a bounded priority queue."""
+    
+    def __init__(self, name, max_workers, max_queue):
+        self.name = name
+        self.max_workers = max_workers
+        self.tasks = queue.PriorityQueue(maxsize=max_queue)
+        self.workers = []
+        self.running = set()
+        self.lock = threading.Lock()
+        self.stats = {
+            'submitted': 0, 'completed': 0, 'failed': 0, 'cancelled': 0, 'rejected': 0,
+            'total_wait_ms': 0.0, 'total_run_ms': 0.0, 'max_run_ms': 0.0
+        }
+    
+    def put(self, priority, sequence, handle):
+        """Queue a task, starting another worker if the pool isn't at its limit"""
+        try:
+            self.tasks.put_nowait((priority, sequence, handle))
+        except queue.Full:
+            with self.lock:
+                self.stats['rejected'] += 1
+            raise RuntimeError(f"Executor pool '{self.name}' queue is full")
+        
+        with self.lock:
+            self.stats['submitted'] += 1
+            if len(self.workers) < self.max_workers:
+                worker = threading.Thread(target=self.work, name=f"{self.name}-{len(self.workers)}", daemon=True)
+                self.workers.append(worker)
+                worker.start()
+    
+    def work(self):
+        """Worker loop: run tasks by priority until a shutdown sentinel arrives"""
+        while True:
+            _, _, handle = self.tasks.get()
+            if handle is None:
+                return
+            self.run(handle)
+    
+    def run(self, handle):
+        """Run one task and record its timings"""
+        with handle.lock:
+            if handle.cancel_event.is_set() or handle.done_event.is_set():
+                skip = True
+            else:
+                skip = False
+                handle.state = 'running'
+                handle.started_at = time.perf_counter()
+        if skip:
+            handle.finish('cancelled')
+            self.record(handle)
+            return
+        
+        with self.lock:
+            self.running.add(handle)
+        try:
+            result = handle.fn(*handle.args, **handle.kwargs)
+            handle.finish('cancelled' if handle.cancelled else 'done', result=result)
+        except Exception as e:
+            handle.finish('cancelled' if handle.cancelled else 'failed', error=e)
+            if not handle.cancelled:
+                print(f"Task {handle.name} failed: {e}")
+        finally:
+            with self.lock:
+                self.running.discard(handle)
+            self.record(handle)
+    
+    def record(self, handle):
+        """Add a finished task to the pool counters"""
+        with self.lock:
+            key = {'done': 'completed', 'failed': 'failed'}.get(handle.state, 'cancelled')
+            self.stats[key] += 1
+            self.stats['total_wait_ms'] += handle.get_wait_ms()
+            run_ms = handle.get_run_ms()
+            self.stats['total_run_ms'] += run_ms
+            self.stats['max_run_ms'] = max(self.stats['max_run_ms'], run_ms)
+    
+    def shutdown(self, timeout):
+        """Cancel queued and running tasks, stop the workers and wait for them"""
+        while True:
+            try:
+                _, _, handle = self.tasks.get_nowait()
+            except queue.Empty:
+                break
+            if handle is not None:
+                handle.cancel()
+                self.record(handle)
+        
+        with self.lock:
+            running = list(self.running)
+            workers = list(self.workers)
+        for handle in running:
+            handle.cancel()
+        
+        for index, _ in enumerate(workers):
+            self.tasks.put((float('inf'), index, None))  # Sentinels sort after every task
+        deadline = time.monotonic() + timeout
+        for worker in workers:
+            worker.join(max(0, deadline - time.monotonic()))
+        return all(not worker.is_alive() for worker in workers)
+    
+    def get_stats(self):
+        """Get counters, queue depth and average timings of the pool"""
+        with self.lock:
+            stats = dict(self.stats)
+            stats['running'] = len(self.running)
+            stats['workers'] = len(self.workers)
+        stats['queue_depth'] = self.tasks.qsize()
+        finished = stats['completed'] + stats['failed'] + stats['cancelled']
+        stats['avg_wait_ms'] = stats['total_wait_ms'] / finished if finished else 0.0
+        stats['avg_run_ms'] = stats['total_run_ms'] / finished if finished else 0.0
+        return stats
+
+
+class ExecutorService:
+    """Application-wide executor with named pools, e.g. 'io' for scraping and 'cpu' for parsing.
+    
+    Concurrency is bounded per pool, tasks run by priority and return a TaskHandle
+    for cancellation, and shutdown() cancels outstanding work when the app closes.
+    """
+    
+    def __init__(self, pools=None, max_queue=100):
+        self.pools = {}
+        self.sequence = itertools.count()
+        self.is_shutdown = False
+        for name, max_workers in (pools or {'io': 2, 'cpu': 1}).items():
+            self.pools[name] = WorkerPool(name, max_workers, max_queue)
+    
+    def submit(self, pool, fn, *args, priority=NORMAL, name=None, **kwargs):
+        """Run fn(*args, **kwargs) on a named pool and get its TaskHandle"""
+        if self.is_shutdown:
+            raise RuntimeError("Executor has been shut down")
+        if pool not in self.pools:
+            raise ValueError(f"Unknown executor pool: {pool}")
+        
+        sequence = next(self.sequence)
+        handle = TaskHandle(sequence, pool, name or getattr(fn, '__name__', 'task'), priority, fn, args, kwargs)
+        self.pools[pool].put(priority, sequence, handle)
+        return handle
+    
+    def shutdown(self, timeout=2.0):
+        """Stop accepting work, cancel outstanding tasks and wait up to timeout for workers"""
+        if self.is_shutdown:
+            return True
+        self.is_shutdown = True
+        
+        deadline = time.monotonic() + timeout
+        stopped = True
+        for worker_pool in self.pools.values():
+            stopped = worker_pool.shutdown(max(0, deadline - time.monotonic())) and stopped
+        if not stopped:
+            print("Executor shutdown timed out; abandoning remaining daemon workers")
+        return stopped
+    
+    def get_stats(self):
+        """Get per-pool queue depth, task counters and durations"""
+        return {name: worker_pool.get_stats() for name, worker_pool in self.pools.items()}
+    
+    def describe_stats(self):
+        """Get a one-line summary of every pool"""
+        parts = []
+        for name, stats in self.get_stats().items():
+            parts.append(f"{name}: {stats['running']} running, {stats['queue_depth']} queued, "
+                         f"{stats['completed']} done, {stats['failed']} failed, {stats['cancelled']} cancelled, "
+                         f"avg run {stats['avg_run_ms']:.0f}ms")
+        return "Executor: " + "; ".join(parts)
+
+
+_default_executor = None
+_default_lock = threading.Lock()
+
+
+def get_executor():
+    """Get the shared application executor, creating it on first use"""
+    global _default_executor
+    with _default_lock:
+        if _default_executor is None or _default_executor.is_shutdown:
+            _default_executor = ExecutorService()
+        return _default_executor
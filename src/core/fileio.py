@@ -0,0 +1,29 @@
+"""
+File I/O Module
+Atomic file writes shared by the scraper, the snapshot coordination and preferences.
+"""
+
+import json
+import os
+import threading
+
+
+def atomic_write_json(path, data, fsync=True):
+    """Write JSON so readers see either the old or the new file, never a partial one
+    
+    fsync=False skips flushing the file to disk, so a power loss can still
+    lose it, but never leaves a partial file in place.
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=4)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
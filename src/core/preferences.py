@@ -0,0 +1,54 @@
+"""
+Preferences Module
+Persists small user preferences in the application's config directory.
+"""
+
+import json
+import os
+
+from core.fileio import atomic_write_json
+
+
+CONFIG_DIR = os.path.join(os.path.expanduser('~'), '.football_scores_pro')
+
+
+class CollapsedTournaments:
+    """Remembers which tournament sections the user has collapsed."""
+    
+    def __init__(self, path=None):
+        self.path = path or os.path.join(CONFIG_DIR, 'collapsed_tournaments.json')
+        self.collapsed = self.load()
+    
+    def load(self):
+        """Load collapsed tournament ids from disk"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return set(str(tournament_id) for tournament_id in json.load(f))
+        except FileNotFoundError:
+            return set()
+        except Exception as e:
+            print(f"Failed to load collapsed tournaments: {e}")
+            return set()
+    
+    def save(self):
+        """Save collapsed tournament ids to disk"""
+        try:
+            atomic_write_json(self.path, sorted(self.collapsed))
+        except Exception as e:
+            print(f"Failed to save collapsed tournaments: {e}")
+    
+    def is_collapsed(self, tournament_id):
+        """Check if a tournament section is collapsed"""
+        return str(tournament_id) in self.collapsed
+    
+    def set_collapsed(self, tournament_id, collapsed):
+        """Set the collapse state of a tournament section and persist it"""
+        tournament_id = str(tournament_id)
+        if collapsed == (tournament_id in self.collapsed):
+            return
+        
+        if collapsed:
+            self.collapsed.add(tournament_id)
+        else:
+            self.collapsed.discard(tournament_id)
+        self.save()
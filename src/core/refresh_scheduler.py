@@ -0,0 +1,159 @@
+"""
+Refresh Scheduler Module
+Picks how often to refresh match data and runs refreshes on the Tk event loop.
+"""
+
+import random
+import time
+from datetime import datetime
+
+
+class RefreshPolicy:
+    """Chooses the next refresh interval from the state of the latest snapshot.
+    
+    Pure and Tk-free: the interval only depends on the data, the current time
+    and the random generator used for jitter.
+    """
+    
+    def __init__(self, live_interval=60, kickoff_interval=120, fixtures_interval=600,
+                 idle_interval=1800, overnight_interval=3600, overnight_hours=(1, 7),
+                 kickoff_window=900, jitter=0.1, max_error_interval=1800, seed=None):
+        self.live_interval = live_interval  # Matches in progress
+        self.kickoff_interval = kickoff_interval  # A match kicks off within kickoff_window seconds
+        self.fixtures_interval = fixtures_interval  # Only fixtures remain
+        self.idle_interval = idle_interval  # Nothing left to follow
+        self.overnight_interval = overnight_interval  # Quiet hours without live matches
+        self.overnight_hours = overnight_hours  # [start, end) local hours
+        self.kickoff_window = kickoff_window
+        self.jitter = jitter  # Fraction of the interval added or removed at random
+        self.max_error_interval = max_error_interval
+        self.random = random.Random(seed)
+    
+    def get_base_interval(self, data, now=None):
+        """Get the interval in seconds before jitter and the reason it was chosen"""
+        now = time.time() if now is None else now
+        events = (data or {}).get('events', [])
+        
+        if any(event.get('status', {}).get('type') == 'inprogress' for event in events):
+            return self.live_interval, "live matches"
+        
+        upcoming = [event.get('startTimestamp') for event in events
+                    if event.get('status', {}).get('type') == 'notstarted' and event.get('startTimestamp')]
+        if any(start - now <= self.kickoff_window for start in upcoming):
+            return self.kickoff_interval, "kick-off soon"
+        
+        start_hour, end_hour = self.overnight_hours
+        if start_hour <= datetime.fromtimestamp(now).hour < end_hour:
+            return self.overnight_interval, "overnight"
+        
+        if upcoming:
+            return self.fixtures_interval, "fixtures only"
+        return self.idle_interval, "no matches to follow"
+    
+    def next_interval(self, data, now=None):
+        """Get the jittered interval in seconds and the reason it was chosen"""
+        interval, reason = self.get_base_interval(data, now)
+        return self.apply_jitter(interval), reason
+    
+    def error_interval(self, failures):
+        """Get a backoff interval after consecutive failed refreshes"""
+        interval = min(self.max_error_interval, self.kickoff_interval * 2 ** max(0, failures - 1))
+        return self.apply_jitter(interval)
+    
+    def apply_jitter(self, interval):
+        """Spread refreshes so clients don't hit the source in lockstep"""
+        return interval * (1 + self.random.uniform(-self.jitter, self.jitter))
+
+
+class RefreshScheduler:
+    """Runs refreshes on the Tk event loop at the interval chosen by a RefreshPolicy.
+    
+    Refreshes never overlap, and none start while the window is iconified or
+    unmapped; a refresh that fell due meanwhile runs as soon as it is shown again.
+    on_pause is called when refreshing pauses, to release what the source holds.
+    """
+    
+    def __init__(self, root, refresh_callback, is_busy=None, policy=None, busy_retry=15, on_pause=None):
+        self.root = root
+        self.refresh_callback = refresh_callback  # Starts a refresh; completion is reported back
+        self.is_busy = is_busy or (lambda: False)
+        self.policy = policy or RefreshPolicy()
+        self.busy_retry = busy_retry  # Seconds to wait when a refresh is already running
+        self.on_pause = on_pause or (lambda: None)
+        self.job = None
+        self.paused = False
+        self.due_while_paused = False
+        self.failures = 0
+        self.next_refresh_at = None
+        self.last_reason = None
+        self.stats = {'scheduled': 0, 'refreshes': 0, 'skipped_busy': 0, 'deferred_hidden': 0}
+        
+        self.root.bind('<Unmap>', self.on_unmap, add='+')
+        self.root.bind('<Map>', self.on_map, add='+')
+    
+    def schedule(self, delay):
+        """Schedule the next refresh in delay seconds, replacing any pending one"""
+        self.cancel()
+        self.stats['scheduled'] += 1
+        self.next_refresh_at = time.time() + delay
+        self.job = self.root.after(int(delay * 1000), self.run)
+    
+    def cancel(self):
+        """Cancel the pending refresh"""
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
+        self.next_refresh_at = None
+    
+    def on_refresh_complete(self, success, data=None):
+        """Schedule the next refresh after any refresh (manual or automatic) has finished"""
+        if success:
+            self.failures = 0
+            delay, self.last_reason = self.policy.next_interval(data)
+        else:
+            self.failures += 1
+            delay = self.policy.error_interval(self.failures)
+            self.last_reason = f"retry after {self.failures} failed refresh(es)"
+        
+        self.schedule(delay)
+        print(f"Next refresh in {delay:.0f}s ({self.last_reason})")
+    
+    def run(self):
+        """Start a due refresh unless the window is hidden or one is already running"""
+        self.job = None
+        self.next_refresh_at = None
+        if self.paused:
+            self.due_while_paused = True
+            self.stats['deferred_hidden'] += 1
+            return
+        
+        if self.is_busy():
+            self.stats['skipped_busy'] += 1
+            self.schedule(self.busy_retry)
+            return
+        
+        self.stats['refreshes'] += 1
+        self.refresh_callback()
+    
+    def on_unmap(self, event):
+        """Stop refreshing while the main window is iconified or hidden"""
+        if event.widget is self.root and not self.paused:
+            self.paused = True
+            self.on_pause()
+    
+    def on_map(self, event):
+        """Catch up with a refresh that fell due while the window was hidden"""
+        if event.widget is self.root and self.paused:
+            self.paused = False
+            if self.due_while_paused:
+                self.due_while_paused = False
+                self.run()
+    
+    def get_status(self):
+        """Get a short description of the next scheduled refresh"""
+        if self.paused:
+            return "Auto-refresh paused while minimized"
+        if self.next_refresh_at is None:
+            return "Auto-refresh idle"
+        seconds = max(0, int(self.next_refresh_at - time.time()))
+        return f"Next refresh in {seconds}s ({self.last_reason})"
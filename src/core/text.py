@@ -0,0 +1,9 @@
+"""
+Text Module
+Display text helpers shared by the Tk-free view models and the design system.
+"""
+
+
+def truncate_name(name, max_length=20):
+    """Truncate a team name for display"""
+    return name[:max_length] + '...' if len(name) > max_length else name
@@ -0,0 +1,234 @@
+"""
+Match API Server Module
+Serves the latest match snapshot over HTTP/JSON so many screens share one scraper.
+"""
+
+import email.utils
+import gzip
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from data.data_processor import MatchOrganizer
+from data.delta_stream import DeltaStream
+
+
+def build_documents(data):
+    """Get the JSON document served on each route for a snapshot"""
+    events = (data or {}).get('events', [])
+    live = [event for event in events if event.get('status', {}).get('type') == 'inprogress']
+    tournaments = list(MatchOrganizer.organize_matches_by_tournament(data).values())
+    return {
+        '/events': {'events': events},
+        '/live': {'events': live},
+        '/tournaments': {'tournaments': tournaments}
+    }
+
+
+def accepts_gzip(header):
+    """Check if an Accept-Encoding header allows gzip"""
+    for part in (header or '').split(','):
+        token, _, params = part.strip().partition(';')
+        if token.strip().lower() in ('gzip', '*'):
+            return params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000')
+    return False
+
+
+class CachedResponse:
+    """Encoded body of one route for one snapshot, plain and gzipped, with its ETag.
+    
+    The ETag is a hash of the body, so it stays valid across snapshot versions
+    (and daemon restarts) as long as the content doesn't change.
+    """
+    
+    def __init__(self, document, version):
+        self.version = version
+        self.last_modified = email.utils.formatdate(usegmt=True)
+        self.body = json.dumps(document, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        self.gzip_body = gzip.compress(self.body, compresslevel=6)
+        self.etag = '"' + hashlib.sha1(self.body).hexdigest()[:20] + '"'
+    
+    def matches(self, if_none_match):
+        """Check an If-None-Match header against the ETag"""
+        if not if_none_match:
+            return False
+        tags = [tag.strip() for tag in if_none_match.split(',')]
+        return '*' in tags or self.etag in tags or f"W/{self.etag}" in tags
+
+
+class MatchRequestHandler(BaseHTTPRequestHandler):
+    """Answers GET requests from the server's cached responses."""
+    
+    protocol_version = 'HTTP/1.1'  # Keep connections open for polling clients
+    server_version = 'FootballScoresAPI/1.0'
+    disable_nagle_algorithm = True  # Headers and a small body go out as separate writes
+    
+    def do_GET(self):
+        api = self.server.api
+        url = urlsplit(self.path)
+        route = url.path.rstrip('/') or '/'
+        if route == api.STREAM_ROUTE:
+            self.send_stream(api, url.query)
+            return
+        if route not in api.ROUTES:
+            api.record(404, 0)
+            routes = ', '.join(api.ROUTES + (api.STREAM_ROUTE,))
+            self.send_error(404, "Unknown route", f"Available routes: {routes}")
+            return
+        
+        response = api.get_response(route)
+        if response is None:
+            api.record(503, 0)
+            self.send_response(503, "No data yet")
+            self.send_header('Retry-After', '5')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        
+        if response.matches(self.headers.get('If-None-Match')):
+            api.record(304, 0)
+            self.send_response(304)
+            self.send_header('ETag', response.etag)
+            self.send_header('Last-Modified', response.last_modified)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        
+        compressed = accepts_gzip(self.headers.get('Accept-Encoding'))
+        body = response.gzip_body if compressed else response.body
+        api.record(200, len(body), compressed)
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', response.etag)
+        self.send_header('Last-Modified', response.last_modified)
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Vary', 'Accept-Encoding')
+        self.send_header('X-Snapshot-Version', str(response.version))
+        if compressed:
+            self.send_header('Content-Encoding', 'gzip')
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def send_stream(self, api, query):
+        """Stream deltas as Server-Sent Events, resuming from Last-Event-ID or ?since="""
+        last_event_id = self.headers.get('Last-Event-ID') or parse_qs(query).get('since', [None])[0]
+        position = api.stream.parse_id(last_event_id)
+        
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream; charset=utf-8')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'close')
+        self.send_header('X-Accel-Buffering', 'no')
+        self.end_headers()
+        self.close_connection = True
+        
+        api.count_subscriber(1)
+        try:
+            self.wfile.write(f"retry: {api.retry_ms}\n\n".encode('utf-8'))
+            while True:
+                result = api.stream.read(position, api.heartbeat)
+                if result is None:
+                    return
+                events, position = result
+                self.wfile.write(b''.join(events) if events else b': ping\n\n')
+                self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError, TimeoutError):
+            pass  # Subscriber went away
+        finally:
+            api.count_subscriber(-1)
+    
+    def log_message(self, format, *args):
+        pass  # Logging each request would cost more than serving it
+
+
+class MatchAPIServer:
+    """Threaded HTTP server for the latest snapshot on /events, /live and /tournaments.
+    
+    publish() encodes every route once per snapshot version, so a request only
+    picks cached bytes: 304 when the client's ETag matches, gzip when accepted.
+    /stream pushes per-match deltas between snapshots as Server-Sent Events.
+    """
+    
+    ROUTES = ('/events', '/live', '/tournaments')
+    STREAM_ROUTE = '/stream'
+    
+    def __init__(self, host='127.0.0.1', port=8765, heartbeat=15, retry_ms=3000):
+        self.host = host
+        self.port = port
+        self.heartbeat = heartbeat  # Seconds between keep-alive comments on idle streams
+        self.retry_ms = retry_ms  # Reconnect delay suggested to SSE clients
+        self.stream = DeltaStream()
+        self.responses = {}  # route -> CachedResponse for the current version
+        self.version = None
+        self.lock = threading.Lock()
+        self.httpd = None
+        self.thread = None
+        self.stats = {'requests': 0, 'ok': 0, 'not_modified': 0, 'gzip': 0, 'errors': 0,
+                      'bytes_sent': 0, 'publishes': 0, 'last_publish_ms': 0.0, 'subscribers': 0}
+    
+    def publish(self, data, version):
+        """Make a new snapshot the one being served; safe to call from any thread"""
+        start = time.perf_counter()
+        responses = {route: CachedResponse(document, version)
+                     for route, document in build_documents(data).items()}
+        self.stream.publish(data, version)
+        with self.lock:
+            self.responses = responses
+            self.version = version
+            self.stats['publishes'] += 1
+            self.stats['last_publish_ms'] = (time.perf_counter() - start) * 1000
+    
+    def get_response(self, route):
+        """Get the cached response of a route, or None before the first publish"""
+        with self.lock:
+            return self.responses.get(route)
+    
+    def record(self, status, size, compressed=False):
+        """Count a served request"""
+        with self.lock:
+            self.stats['requests'] += 1
+            self.stats['bytes_sent'] += size
+            if status == 200:
+                self.stats['ok'] += 1
+                self.stats['gzip'] += int(compressed)
+            elif status == 304:
+                self.stats['not_modified'] += 1
+            else:
+                self.stats['errors'] += 1
+    
+    def count_subscriber(self, change):
+        """Track the number of open streams"""
+        with self.lock:
+            self.stats['subscribers'] += change
+    
+    def start(self):
+        """Start serving on a background thread; port 0 picks a free port"""
+        self.httpd = ThreadingHTTPServer((self.host, self.port), MatchRequestHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.api = self
+        self.port = self.httpd.server_address[1]
+        self.thread = threading.Thread(target=self.httpd.serve_forever, name='api-server', daemon=True)
+        self.thread.start()
+        print(f"API server listening on http://{self.host}:{self.port}")
+    
+    def stop(self):
+        """Stop serving and close the socket"""
+        if self.httpd is None:
+            return
+        self.stream.close()
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join(timeout=2.0)
+        self.httpd = None
+    
+    def get_stats(self):
+        """Get request counters and the served version"""
+        with self.lock:
+            stats = dict(self.stats)
+            stats['version'] = self.version
+        stats['stream'] = self.stream.get_stats()
+        return stats
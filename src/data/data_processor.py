@@ -1,82 +1,125 @@
 """
 Data Processing Module
-Handles data processing, scraper integration, and match data organization.
+Handles data processing, data source integration, and match data organization.
 """
 
 import json
 import os
 import threading
-from scraper.match_scraper import MatchScraper
+import time
+from core.executor import get_executor, HIGH, LOW
+from data.view_model import MatchCardBuilder
+from data.live_clock import LiveClock
+from data.sources import ScraperSource, SourceError
 
 
 class DataProcessor:
-    """Handles data processing and scraper integration."""
+    """Handles data processing and data source integration."""
     
-    def __init__(self, output_path=None):
+    def __init__(self, output_path=None, executor=None, scraper_factory=None, source=None):
         self.output_path = output_path or os.path.join("data", "events.json")
-        self.scraper = None
-        self.scraper_thread = None
-        self.is_running = False
+        self.executor = executor or get_executor()
+        self.source = source or ScraperSource(self.output_path, scraper_factory)  # Where fetches get data from
+        self.fetch_task = None
+        self.fetch_lock = threading.Lock()
+        self.is_running = False  # True from start_fetching until the fetch task has fully finished
+        self.idle_event = threading.Event()
+        self.idle_event.set()
+        self.cancel_requested_at = None
+        self.last_cancel_latency_ms = None  # Time from stop_fetching until the source was idle
         self.json_data = None
+        self.snapshot_version = 0  # Incremented every time new match data arrives
         self.last_error = None
         self.max_initial_matches = 50  # Limit initial matches to prevent UI freezing
+        self.prepare_on_fetch = True  # Build match card descriptors after each fetch; headless runs skip it
         self.cache_duration = 300  # Cache data for 5 minutes
         self.last_fetch_time = 0
         self.cached_data = None
+        self.live_clock = LiveClock()  # Ticks live match minutes between fetches
+        self.view_models = MatchCardBuilder(self.live_clock)  # Match card descriptors for the current snapshot
     
     def start_fetching(self, callback=None):
-        """Start fetching matches in a separate thread"""
-        if self.is_running:
-            return False
-            
-        self.is_running = True
+        """Start fetching matches from the data source on the executor's I/O pool
+        
+        Only one fetch runs at a time: this returns False while a previous fetch,
+        including a cancelled one that is still closing its browser, is running.
+        """
+        with self.fetch_lock:
+            if self.is_running:
+                return False
+            self.is_running = True
+            self.idle_event.clear()
         self.last_error = None
         
         try:
-            # Initialize the scraper
-            self.scraper = MatchScraper(output_path=self.output_path)
+            cancel_event = threading.Event()
             
-            # Run the scraper in a separate thread
-            self.scraper_thread = threading.Thread(target=self._run_scraper, args=(callback,))
-            self.scraper_thread.daemon = True
-            self.scraper_thread.start()
+            # Fetch on the I/O pool; cancelling the task stops the source and any parsing
+            self.fetch_task = self.executor.submit('io', self._run_fetch, cancel_event, callback,
+                                                   priority=HIGH, name=f"fetch from {self.source.name}")
+            self.fetch_task.add_cancel_callback(lambda task: (cancel_event.set(), self.source.stop()))
+            self.fetch_task.add_done_callback(self.on_fetch_finished)
             
             return True
         except Exception as e:
             self.last_error = str(e)
             self.is_running = False
+            self.idle_event.set()
             return False
     
-    def _run_scraper(self, callback=None):
-        """Run the scraper and process results"""
+    def _run_fetch(self, cancel_event, callback=None):
+        """Fetch from the source and process results; a cancelled fetch reports nothing"""
         try:
-            # Run the scraper
-            success = self.scraper.run()
+            data = self.source.fetch(cancel_event)
+            if cancel_event.is_set() or data is None:
+                print("Fetch cancelled, discarding results")
+                return
             
-            if success and hasattr(self.scraper, 'json_data') and self.scraper.json_data:
-                self.json_data = self.scraper.json_data
-                if callback:
-                    callback(True, self.json_data)
-            else:
-                error_msg = "Failed to fetch matches. Please check your internet connection and try again."
-                if hasattr(self.scraper, 'last_error'):
-                    error_msg = f"Error: {self.scraper.last_error}"
-                self.last_error = error_msg
-                if callback:
-                    callback(False, error_msg)
+            # Unchanged data (e.g. a 304 from a server) keeps its snapshot version and card descriptors
+            if data is not self.json_data:
+                # Precompute card descriptors here so the Tk thread only builds widgets; a fetch
+                # cancelled midway leaves the current data and descriptors untouched
+                cache = None
+                if self.prepare_on_fetch:
+                    cache = self.view_models.build_cache(data, self.snapshot_version + 1, cancel_event.is_set)
+                if cancel_event.is_set():
+                    print("Fetch cancelled while preparing matches")
+                    return
+                self.set_data(data)
+                if cache is not None:
+                    self.view_models.commit(cache)
+            if callback:
+                callback(True, self.json_data)
+        except SourceError as e:
+            self.last_error = str(e)
+            if callback:
+                callback(False, self.last_error)
         except Exception as e:
             error_msg = f"An unexpected error occurred: {str(e)}"
             self.last_error = error_msg
             if callback:
                 callback(False, error_msg)
-        finally:
-            self.is_running = False
     
-    def stop_fetching(self):
-        """Stop the running scraper"""
-        if self.scraper:
-            self.scraper.stop()
+    def on_fetch_finished(self, task):
+        """Mark the processor idle once the fetch task is done, cancelled or failed"""
+        if task is not self.fetch_task:
+            return
+        if self.cancel_requested_at is not None:
+            self.last_cancel_latency_ms = (time.perf_counter() - self.cancel_requested_at) * 1000
+            self.cancel_requested_at = None
+            print(f"Fetch cancelled in {self.last_cancel_latency_ms:.0f}ms")
         self.is_running = False
+        self.idle_event.set()
+    
+    def stop_fetching(self):
+        """Ask the running fetch to stop; is_fetching() stays True until the source has stopped"""
+        if self.fetch_task and not self.fetch_task.done_event.is_set():
+            self.cancel_requested_at = time.perf_counter()
+            self.fetch_task.cancel()
+    
+    def wait_until_idle(self, timeout=None):
+        """Wait for the current fetch to finish; returns False on timeout"""
+        return self.idle_event.wait(timeout)
     
     def load_data_from_file(self):
         """Load data from the JSON file"""
@@ -89,12 +132,36 @@ class DataProcessor:
             self.last_error = f"Error loading data: {str(e)}"
             return None
     
+    def set_data(self, data, fetched_at=None, clock_rate=1.0):
+        """Replace the current data and start a new snapshot version
+        
+        fetched_at is the wall time the data was captured, for data that isn't
+        fresh, such as a replayed recording; the live clock then runs from it at
+        clock_rate times real time.
+        """
+        self.json_data = data
+        self.snapshot_version += 1
+        self.live_clock.mark_fetched(fetched_at, clock_rate)
+    
     def get_data(self):
         """Get the current data (from memory or file)"""
         if self.json_data:
             return self.json_data
         
-        return self.load_data_from_file()
+        # Keep the file contents in memory so views don't re-parse it on every visit
+        data = self.load_data_from_file()
+        if data:
+            self.set_data(data)
+            self.prepare_view_models(background=True)
+        return data
+    
+    def prepare_view_models(self, background=False, should_stop=None):
+        """Precompute match card descriptors for the current snapshot; returns False if stopped"""
+        if background:
+            self.executor.submit('cpu', self.view_models.build_snapshot, self.json_data, self.snapshot_version,
+                                 priority=LOW, name='build_view_models')
+            return True
+        return self.view_models.build_snapshot(self.json_data, self.snapshot_version, should_stop) is not None
     
     def is_fetching(self):
         """Check if currently fetching data"""
@@ -173,7 +240,8 @@ class MatchOrganizer:
         matches_by_tournament = {}
         
         for event in data['events']:
-            tournament_name = event['tournament']['name']
+            tournament = event['tournament']
+            tournament_name = tournament['name']
             round_info = event.get('roundInfo', {})
             round_name = round_info.get('round', 'Regular Season')
             
@@ -182,6 +250,7 @@ class MatchOrganizer:
             if key not in matches_by_tournament:
                 matches_by_tournament[key] = {
                     'tournament': tournament_name,
+                    'tournament_id': MatchOrganizer.get_tournament_id(tournament),
                     'round': round_name,
                     'matches': []
                 }
@@ -190,6 +259,19 @@ class MatchOrganizer:
         
         return matches_by_tournament
     
+    @staticmethod
+    def get_tournament_id(tournament):
+        """Get a stable id for a tournament section (its id, then its name)
+        
+        Groups of one competition (e.g. "Champions League, Group A" and
+        "Group B") share a uniqueTournament id but have their own id, so each
+        section keeps its own collapse state.
+        """
+        tournament_id = tournament.get('id')
+        if tournament_id is None:
+            return tournament.get('name')
+        return tournament_id
+    
     @staticmethod
     def get_match_statistics(matches_by_tournament):
         """Get statistics about the matches"""
@@ -0,0 +1,185 @@
+"""
+Delta Log Module
+Append-only history of match snapshots: periodic full snapshots followed by per-refresh deltas,
+with replay to any point in time and compaction.
+"""
+
+import glob
+import json
+import os
+import time
+
+from data.deltas import apply_deltas, compute_deltas, index_events
+
+
+class DeltaLog:
+    """Appends snapshot and delta records to NDJSON segment files in a directory.
+    
+    Each segment starts with a 'snapshot' record holding the full data and
+    continues with one 'delta' record per changed snapshot, so a refresh
+    writes only what changed. A new segment is started every checkpoint_every
+    deltas, and after a restart, which keeps every segment replayable on its
+    own and lets compaction delete whole old segments.
+    
+    Without a directory, the same records go to writer (an NDJSONWriter), e.g.
+    the daemon's stdout, with no segments or compaction.
+    """
+    
+    def __init__(self, directory=None, checkpoint_every=100, max_age=None, max_bytes=None, fsync=False,
+                 writer=None):
+        self.directory = directory
+        self.writer = writer
+        self.checkpoint_every = checkpoint_every
+        self.max_age = max_age  # Seconds of history kept by compaction
+        self.max_bytes = max_bytes  # Disk budget kept by compaction
+        self.fsync = fsync  # Sync every record to disk, not just to the OS
+        self.previous = None
+        self.previous_version = None
+        self.file = None
+        self.path = None
+        self.deltas_in_segment = 0
+        self.stats = {'snapshots': 0, 'deltas': 0, 'unchanged': 0, 'bytes': 0, 'compacted': 0}
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    
+    def get_segments(self):
+        """Get (start time, path) of the segment files, oldest first"""
+        if not self.directory:
+            return []
+        segments = []
+        for path in glob.glob(os.path.join(self.directory, 'segment-*.ndjson')):
+            try:
+                start = int(os.path.basename(path)[len('segment-'):-len('.ndjson')]) / 1000
+            except ValueError:
+                continue
+            segments.append((start, path))
+        return sorted(segments)
+    
+    def append(self, data, timestamp=None, version=None):
+        """Log a snapshot; get the 'snapshot' or 'delta' record written, or None if nothing changed"""
+        timestamp = timestamp or time.time()
+        if self.previous is None or self.deltas_in_segment >= self.checkpoint_every:
+            record = {'type': 'snapshot', 'ts': timestamp, 'version': version,
+                      'events': len(data.get('events', [])), 'data': data}
+            self.start_segment(record)
+        else:
+            deltas = compute_deltas(self.previous, data)
+            if not deltas:
+                self.previous = data
+                self.stats['unchanged'] += 1
+                return None
+            record = {'type': 'delta', 'ts': timestamp, 'version': version,
+                      'base_version': self.previous_version, 'deltas': deltas}
+            self.write(record)
+            self.deltas_in_segment += 1
+            self.stats['deltas'] += 1
+        
+        self.previous = data
+        self.previous_version = version
+        return record
+    
+    def start_segment(self, record):
+        """Start a new segment with a snapshot record, then compact"""
+        self.close()
+        if self.directory:
+            self.path = os.path.join(self.directory, f"segment-{int(record['ts'] * 1000):013d}.ndjson")
+            self.file = open(self.path, 'a', encoding='utf-8')
+        self.write(record)
+        self.deltas_in_segment = 0
+        self.stats['snapshots'] += 1
+        if self.directory and (self.max_age is not None or self.max_bytes is not None):
+            self.compact(record['ts'])
+    
+    def write(self, record):
+        """Append one record line to the current segment, or hand it to the writer"""
+        if self.file is None:
+            self.writer.write(record)
+            return
+        line = json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n'
+        self.file.write(line)
+        self.file.flush()
+        if self.fsync:
+            os.fsync(self.file.fileno())
+        self.stats['bytes'] += len(line)
+    
+    def read_segment(self, path):
+        """Yield the records of a segment; a line cut short by a crash is skipped"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except ValueError:
+                        continue
+        except OSError:
+            return
+    
+    def iter_records(self, start=None, end=None):
+        """Yield records from the snapshot at or before start up to end, in order"""
+        segments = self.get_segments()
+        first = 0
+        if start is not None:
+            for index, (segment_start, _) in enumerate(segments):
+                if segment_start <= start:
+                    first = index
+        for _, path in segments[first:]:
+            for record in self.read_segment(path):
+                if end is not None and record.get('ts', 0) > end:
+                    return
+                yield record
+    
+    def replay(self, at=None):
+        """Rebuild the snapshot as of wall time at (default: the latest); get (data, version, ts) or None"""
+        segments = self.get_segments()
+        if at is not None:
+            segments = [segment for segment in segments if segment[0] <= at]
+        if not segments:
+            return None
+        
+        events, version, timestamp = None, None, None
+        for record in self.read_segment(segments[-1][1]):
+            if at is not None and record.get('ts', 0) > at:
+                break
+            if record.get('type') == 'snapshot':
+                events = index_events(record['data'])
+            elif record.get('type') == 'delta' and events is not None:
+                apply_deltas(events, record['deltas'])
+            else:
+                continue
+            version, timestamp = record.get('version'), record.get('ts')
+        if events is None:
+            return None
+        return {'events': list(events.values())}, version, timestamp
+    
+    def compact(self, now=None):
+        """Delete the oldest segments beyond max_age or max_bytes; get the number deleted.
+        
+        The segment that covers the max_age cutoff is kept so replays at the
+        cutoff still work, and the segment being written is never deleted.
+        """
+        now = now or time.time()
+        segments = self.get_segments()
+        total = sum(os.path.getsize(path) for _, path in segments)
+        removed = 0
+        for index, (_, path) in enumerate(segments):
+            if path == self.path:
+                break
+            following_start = segments[index + 1][0] if index + 1 < len(segments) else None
+            too_old = (self.max_age is not None and following_start is not None
+                       and following_start <= now - self.max_age)
+            too_big = self.max_bytes is not None and total > self.max_bytes
+            if not (too_old or too_big):
+                break
+            size = os.path.getsize(path)
+            os.remove(path)
+            total -= size
+            removed += 1
+        self.stats['compacted'] += removed
+        return removed
+    
+    def close(self):
+        """Close the current segment; the next append starts a new one"""
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+        self.previous = None
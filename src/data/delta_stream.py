@@ -0,0 +1,125 @@
+"""
+Delta Stream Module
+Sequences per-match changes between snapshots for Server-Sent Events subscribers.
+"""
+
+import itertools
+import json
+import threading
+import time
+from collections import deque
+
+from data.deltas import compute_deltas
+
+
+def encode_event(event_id, event_type, payload):
+    """Encode one Server-Sent Event"""
+    data = json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+    return f"id: {event_id}\nevent: {event_type}\ndata: {data}\n\n".encode('utf-8')
+
+
+class DeltaStream:
+    """Numbered history of match deltas that subscribers read from a position.
+    
+    Every publish appends one 'delta' event per changed match and a 'commit'
+    event that closes the batch. Event ids are "<stream id>-<sequence>", so a
+    client resuming with the id of another server run gets a fresh 'snapshot'
+    instead of a wrong replay; so does one that fell out of the history.
+    Events are encoded once and shared by all subscribers.
+    """
+    
+    def __init__(self, history=2000):
+        self.stream_id = format(int(time.time() * 1000), 'x')
+        self.history = deque(maxlen=history)  # (sequence, encoded event), contiguous sequences
+        self.sequence = 0
+        self.data = None
+        self.version = None
+        self.snapshot_event = None  # Encoded snapshot of the current sequence, built on demand
+        self.condition = threading.Condition()
+        self.closed = False
+        self.stats = {'publishes': 0, 'deltas': 0, 'snapshots_sent': 0, 'event_batches_sent': 0}
+    
+    def publish(self, data, version):
+        """Append the changes from the previous snapshot and wake up subscribers"""
+        deltas = compute_deltas(self.data, data) if self.data is not None else None
+        with self.condition:
+            if deltas:
+                for delta in deltas:
+                    self.append('delta', dict(delta, version=version))
+                self.append('commit', {'version': version, 'deltas': len(deltas)})
+            elif deltas is None:
+                self.sequence += 1  # Only subscribers that got a snapshot can be at this position
+            self.data = data
+            self.version = version
+            self.snapshot_event = None
+            self.stats['publishes'] += 1
+            self.stats['deltas'] += len(deltas or [])
+            self.condition.notify_all()
+    
+    def append(self, event_type, payload):
+        """Number and encode an event; the caller holds the condition"""
+        self.sequence += 1
+        self.history.append((self.sequence, encode_event(self.make_id(self.sequence), event_type, payload)))
+    
+    def make_id(self, sequence):
+        """Get the event id of a sequence number"""
+        return f"{self.stream_id}-{sequence}"
+    
+    def parse_id(self, event_id):
+        """Get the sequence of an event id from this stream, or None"""
+        stream_id, _, sequence = (event_id or '').strip().rpartition('-')
+        if stream_id != self.stream_id or not sequence.isdigit():
+            return None
+        return int(sequence)
+    
+    def can_resume(self, position):
+        """Check if every event after position is still in the history; the caller holds the condition"""
+        if position is None or position > self.sequence:
+            return False
+        if position == self.sequence:
+            return True
+        return bool(self.history) and self.history[0][0] <= position + 1
+    
+    def get_snapshot_event(self):
+        """Get the encoded snapshot of the current sequence; the caller holds the condition"""
+        if self.snapshot_event is None:
+            self.snapshot_event = encode_event(self.make_id(self.sequence), 'snapshot',
+                                               {'version': self.version, 'data': self.data})
+        return self.snapshot_event
+    
+    def read(self, position, timeout):
+        """Get (encoded events, new position) after position, waiting up to timeout for news
+        
+        A position of None, or one that can't be resumed, gets the latest snapshot.
+        Returns ([], position) on timeout and None once the stream is closed.
+        """
+        with self.condition:
+            self.condition.wait_for(
+                lambda: self.closed or (self.data is not None and (position is None or self.sequence != position)),
+                timeout
+            )
+            if self.closed:
+                return None
+            if self.data is None or position == self.sequence:
+                return [], position
+            if not self.can_resume(position):
+                self.stats['snapshots_sent'] += 1
+                return [self.get_snapshot_event()], self.sequence
+            
+            self.stats['event_batches_sent'] += 1
+            start = position + 1 - self.history[0][0]
+            return [event for _, event in itertools.islice(self.history, start, None)], self.sequence
+    
+    def close(self):
+        """Wake up and end every subscriber"""
+        with self.condition:
+            self.closed = True
+            self.condition.notify_all()
+    
+    def get_stats(self):
+        """Get publish and delivery counters and the current sequence"""
+        with self.condition:
+            stats = dict(self.stats)
+            stats['sequence'] = self.sequence
+            stats['history'] = len(self.history)
+        return stats
@@ -0,0 +1,112 @@
+"""
+Match Deltas Module
+Computes what changed between two match data snapshots and applies the changes.
+"""
+
+import copy
+
+
+# Event fields compared between snapshots, as paths into the sofascore event. Snapshots rebuilt
+# from deltas only see changes to these, so every field the cards and the live clock read is here.
+TRACKED_FIELDS = {
+    'status': ('status', 'type'),
+    'status_code': ('status', 'code'),
+    'status_description': ('status', 'description'),
+    'status_winner': ('status', 'winnerCode'),
+    'winner': ('winnerCode',),
+    'home_score': ('homeScore', 'current'),
+    'away_score': ('awayScore', 'current'),
+    'period_start': ('time', 'currentPeriodStartTimestamp'),
+    'period_initial': ('time', 'initial'),
+    'period_max': ('time', 'max'),
+    'period_extra': ('time', 'extra'),
+    'minute': ('time', 'minute'),
+    'start_timestamp': ('startTimestamp',),
+}
+
+
+def get_field(event, path):
+    """Get a nested field of an event, or None if any part of the path is missing"""
+    value = event
+    for key in path:
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def set_field(event, path, value):
+    """Set a nested field of an event, creating missing parents; None removes the field"""
+    for key in path[:-1]:
+        if not isinstance(event.get(key), dict):
+            if value is None:
+                return
+            event[key] = {}
+        event = event[key]
+    if value is None:
+        event.pop(path[-1], None)
+    else:
+        event[path[-1]] = value
+
+
+def index_events(data):
+    """Map event ids to events for a snapshot"""
+    if not data or 'events' not in data:
+        return {}
+    return {event['id']: event for event in data['events'] if 'id' in event}
+
+
+def compute_deltas(previous, current, fields=None):
+    """Get the list of changes from one snapshot to the next
+    
+    Each delta is a dict with 'op' ('added', 'removed' or 'changed') and the event 'id';
+    added events carry the whole 'event', changed events a 'changes' dict of
+    field -> [old, new] for the tracked fields that differ.
+    """
+    fields = fields or TRACKED_FIELDS
+    old_events = index_events(previous)
+    new_events = index_events(current)
+    deltas = []
+    
+    for event_id, event in new_events.items():
+        old_event = old_events.get(event_id)
+        if old_event is None:
+            deltas.append({'op': 'added', 'id': event_id, 'event': event})
+            continue
+        
+        changes = {}
+        for name, path in fields.items():
+            old_value = get_field(old_event, path)
+            new_value = get_field(event, path)
+            if old_value != new_value:
+                changes[name] = [old_value, new_value]
+        if changes:
+            deltas.append({'op': 'changed', 'id': event_id, 'changes': changes})
+    
+    for event_id in old_events:
+        if event_id not in new_events:
+            deltas.append({'op': 'removed', 'id': event_id})
+    
+    return deltas
+
+
+def apply_deltas(events, deltas, fields=None):
+    """Apply deltas to an event id -> event index in place, the inverse of compute_deltas
+    
+    Changed events are copied before they are updated, so snapshots built
+    from the index earlier never change underneath their readers.
+    """
+    fields = fields or TRACKED_FIELDS
+    for delta in deltas:
+        op = delta.get('op')
+        if op == 'added':
+            events[delta['id']] = delta['event']
+        elif op == 'removed':
+            events.pop(delta['id'], None)
+        elif op == 'changed' and delta['id'] in events:
+            event = copy.deepcopy(events[delta['id']])
+            for name, (_, new_value) in delta.get('changes', {}).items():
+                if name in fields:
+                    set_field(event, fields[name], new_value)
+            events[delta['id']] = event
+    return events
@@ -0,0 +1,91 @@
+"""
+Live Clock Module
+Derives the current minute of live matches locally between fetches.
+"""
+
+import time
+
+
+# Sofascore status codes of periods in which the match clock runs
+FIRST_HALF = 6
+SECOND_HALF = 7
+HALFTIME = 31
+EXTRA_TIME_FIRST_HALF = 41
+EXTRA_TIME_SECOND_HALF = 42
+RUNNING_PERIODS = {FIRST_HALF, SECOND_HALF, EXTRA_TIME_FIRST_HALF, EXTRA_TIME_SECOND_HALF}
+
+
+class LiveClock:
+    """Computes match minutes from period start timestamps and a monotonic clock.
+    
+    The wall time is only read when a snapshot is fetched; afterwards time advances
+    with time.monotonic(), so adjusting the system clock doesn't make minutes jump.
+    A replay anchors the clock at the recorded time and runs it at its speed.
+    """
+    
+    def __init__(self, max_added_minutes=15):
+        self.max_added_minutes = max_added_minutes  # Cap when the payload gives no 'extra'
+        self.mark_fetched()
+    
+    def mark_fetched(self, wall_time=None, rate=1.0):
+        """Anchor the clock at the wall time a snapshot was fetched, running rate times real time"""
+        self.fetched_wall = wall_time if wall_time is not None else time.time()
+        self.fetched_monotonic = time.monotonic()
+        self.rate = rate
+    
+    def now(self):
+        """Get the current wall time estimated from the fetch anchor"""
+        return self.fetched_wall + (time.monotonic() - self.fetched_monotonic) * self.rate
+    
+    def get_elapsed_seconds(self, event, now=None):
+        """Get the match clock in seconds, or None if it isn't running or can't be derived"""
+        status_code = event.get('status', {}).get('code')
+        match_time = event.get('time', {})
+        period_start = match_time.get('currentPeriodStartTimestamp')
+        if status_code not in RUNNING_PERIODS or not period_start:
+            return None
+        
+        now = self.now() if now is None else now
+        return match_time.get('initial', 0) + max(0, now - period_start)
+    
+    def get_minute(self, event, now=None):
+        """Get (minute, added minutes) of a live match, e.g. (45, 2) for 45+2'"""
+        elapsed = self.get_elapsed_seconds(event, now)
+        if elapsed is None:
+            return None
+        
+        match_time = event.get('time', {})
+        minute = int(elapsed // 60) + 1
+        period_end = match_time.get('max')
+        if not period_end:
+            return minute, 0
+        
+        regular_minutes = period_end // 60
+        if minute <= regular_minutes:
+            return minute, 0
+        
+        max_added = match_time.get('extra', self.max_added_minutes * 60) // 60
+        return regular_minutes, min(minute - regular_minutes, max_added)
+    
+    def format_minute(self, event, now=None):
+        """Get the display minute of a live match ("67'", "45+2'", "HT"), falling back to the payload"""
+        if event.get('status', {}).get('code') == HALFTIME:
+            return "HT"
+        
+        minute = self.get_minute(event, now)
+        if minute is None:
+            payload_minute = event.get('time', {}).get('minute')
+            return f"{payload_minute}'" if payload_minute else ""
+        
+        minute, added = minute
+        return f"{minute}+{added}'" if added else f"{minute}'"
+    
+    def seconds_until_next_minute(self, events, now=None):
+        """Get the real seconds until the earliest minute change among running matches"""
+        now = self.now() if now is None else now
+        waits = []
+        for event in events:
+            elapsed = self.get_elapsed_seconds(event, now)
+            if elapsed is not None:
+                waits.append(60 - elapsed % 60)
+        return min(waits) / self.rate if waits else None
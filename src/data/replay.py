@@ -0,0 +1,131 @@
+"""
+Replay Module
+Plays a recorded match day back on its original timeline, sped up, and measures how far the
+display falls behind it.
+"""
+
+import json
+import os
+import statistics
+import threading
+import time
+
+from data.delta_log import DeltaLog
+from data.deltas import apply_deltas, index_events
+
+
+def read_ndjson(path):
+    """Yield the records of an NDJSON file, skipping lines that don't parse"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def load_records(path):
+    """Get the timestamped records of a recording, oldest first.
+    
+    path is a DeltaLog directory, such as a daemon --output directory, or a
+    single NDJSON file, such as the daemon's stdout.
+    """
+    if os.path.isdir(path):
+        return list(DeltaLog(path).iter_records())
+    records = [record for record in read_ndjson(path) if record.get('type') in ('snapshot', 'delta')]
+    return sorted(records, key=lambda record: record.get('ts', 0))
+
+
+class ReplayPlayer:
+    """Feeds recorded snapshots and deltas to on_data(data, version, due, ts) at speed times real time.
+    
+    ts is the recorded wall time of the snapshot, which live minutes are
+    derived from. due is the perf_counter() time it should be on screen; the app
+    calls record_render(due) once it is, and the difference is the lag. A
+    display that can't keep up skips superseded snapshots, which are counted
+    as delivered but never rendered.
+    
+    Runs on its own daemon thread, like the stream subscriber, because it
+    waits out the whole timeline.
+    """
+    
+    def __init__(self, records, on_data, speed=1.0, on_finished=None):
+        self.records = records
+        self.on_data = on_data  # Called on the replay thread
+        self.on_finished = on_finished or (lambda: None)
+        self.speed = speed
+        self.events = None
+        self.clock = None  # Recorded wall time of the snapshot last delivered
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.lags_ms = []
+        self.stats = {'delivered': 0, 'rendered': 0, 'skipped_records': 0, 'late_deliveries': 0}
+    
+    def start(self):
+        """Start playing"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name='replay', daemon=True)
+            self.thread.start()
+    
+    def stop(self):
+        """Stop playing"""
+        self.stop_event.set()
+    
+    def run(self):
+        """Deliver every record at its scaled time"""
+        if not self.records:
+            self.on_finished()
+            return
+        first_ts = self.records[0].get('ts', 0)
+        start = time.perf_counter()
+        for record in self.records:
+            due = start + (record.get('ts', first_ts) - first_ts) / self.speed
+            delay = due - time.perf_counter()
+            if delay > 0 and self.stop_event.wait(delay):
+                return
+            if self.stop_event.is_set():
+                return
+            if delay < -0.01:
+                self.stats['late_deliveries'] += 1  # Applying earlier records took longer than the timeline
+            if self.apply(record):
+                self.clock = record.get('ts')
+                self.stats['delivered'] += 1
+                self.on_data({'events': list(self.events.values())}, record.get('version'), due, record.get('ts'))
+        self.on_finished()
+    
+    def apply(self, record):
+        """Apply one record to the replayed snapshot; False if nothing can be shown yet"""
+        if record.get('type') == 'snapshot':
+            self.events = index_events(record.get('data'))
+        elif self.events is not None:
+            apply_deltas(self.events, record.get('deltas', []))
+        else:
+            self.stats['skipped_records'] += 1  # Deltas before the first full snapshot
+            return False
+        return True
+    
+    def record_render(self, due):
+        """Record that the snapshot due at perf_counter() time due is on screen"""
+        self.stats['rendered'] += 1
+        self.lags_ms.append(max(0.0, (time.perf_counter() - due) * 1000))
+    
+    def get_report(self):
+        """Get delivery counts and the lag percentiles behind the intended timeline"""
+        report = dict(self.stats, speed=self.speed, records=len(self.records))
+        report['superseded'] = self.stats['delivered'] - self.stats['rendered']
+        if self.lags_ms:
+            lags = sorted(self.lags_ms)
+            report.update({
+                'lag_p50_ms': round(statistics.median(lags), 1),
+                'lag_p95_ms': round(lags[min(len(lags) - 1, int(len(lags) * 0.95))], 1),
+                'lag_max_ms': round(lags[-1], 1)
+            })
+        return report
+    
+    def describe(self):
+        """Get a one-line summary of the replay"""
+        report = self.get_report()
+        clock = time.strftime('%H:%M:%S', time.localtime(self.clock)) if self.clock else '--:--:--'
+        lag = f", lag p50 {report['lag_p50_ms']:.0f}ms p95 {report['lag_p95_ms']:.0f}ms" if self.lags_ms else ""
+        return (f"Replay {self.speed:g}x at {clock}: {report['rendered']}/{report['delivered']} "
+                f"snapshots shown{lag}")
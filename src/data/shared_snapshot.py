@@ -0,0 +1,124 @@
+"""
+Shared Snapshot Module
+Coordinates app instances on one machine through the snapshot file: a leader lock
+and a change watcher.
+"""
+
+import os
+import threading
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """Exclusive, non-blocking lock on a file, held until released or the process exits.
+    
+    The operating system drops the lock when its holder dies, so a crashed
+    leader never blocks the other instances.
+    """
+    
+    def __init__(self, path):
+        self.path = path
+        self.file = None
+    
+    @property
+    def locked(self):
+        """Check if this object holds the lock"""
+        return self.file is not None
+    
+    def acquire(self):
+        """Try to take the lock without waiting; True if it is held now"""
+        if self.file is not None:
+            return True
+        
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        f = open(self.path, 'a+')
+        try:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+        except OSError:
+            f.close()
+            return False
+        
+        # Record the holder for diagnostics
+        f.seek(0)
+        f.truncate()
+        f.write(str(os.getpid()))
+        f.flush()
+        self.file = f
+        return True
+    
+    def release(self):
+        """Give up the lock"""
+        if self.file is None:
+            return
+        try:
+            if fcntl:
+                fcntl.flock(self.file.fileno(), fcntl.LOCK_UN)
+            else:
+                self.file.seek(0)
+                msvcrt.locking(self.file.fileno(), msvcrt.LK_UNLCK, 1)
+        except OSError:
+            pass
+        self.file.close()
+        self.file = None
+
+
+class SnapshotWatcher:
+    """Calls on_change() on its own thread whenever the snapshot file is replaced or modified.
+    
+    Polls the file's modification time and size, which works on every platform
+    and for atomic replaces; a stat every interval is all it costs.
+    """
+    
+    def __init__(self, path, on_change, interval=1.0):
+        self.path = path
+        self.on_change = on_change
+        self.interval = interval
+        self.signature = self.get_signature()
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.changes = 0
+    
+    def get_signature(self):
+        """Get (mtime, size, inode) of the file, or None if it doesn't exist"""
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size, stat.st_ino
+    
+    def start(self):
+        """Start watching"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name='snapshot-watcher', daemon=True)
+            self.thread.start()
+    
+    def stop(self):
+        """Stop watching"""
+        self.stop_event.set()
+    
+    def run(self):
+        """Poll until stopped"""
+        while not self.stop_event.wait(self.interval):
+            self.check()
+    
+    def check(self):
+        """Call on_change if the file changed since the last check; returns True if it did"""
+        signature = self.get_signature()
+        if signature is None or signature == self.signature:
+            return False
+        self.signature = signature
+        self.changes += 1
+        try:
+            self.on_change()
+        except Exception as e:
+            print(f"Error in snapshot change callback: {e}")
+        return True
@@ -0,0 +1,361 @@
+"""
+Snapshot Segment Module
+Publishes the latest snapshot into a memory-mapped file that local consumers map once and
+re-read only when its version changes.
+"""
+
+import json
+import mmap
+import os
+import struct
+import time
+from array import array
+
+MAGIC = b'LFSS'
+LAYOUT = 2
+# magic, layout, flags, event count, sequence, snapshot version, static part length, published at,
+# static part version, (unused)
+HEADER = struct.Struct('<4sIIIQQQdQQ')
+HEADER_SIZE = 64
+REPLACED = 1  # Flag set on a segment superseded by a larger file at the same path
+
+# Hot fields stored as one int64 column each: (key, None) for a top-level value, (key, field) for a
+# field of a nested object. 'status' holds an index into the static part's table of statuses.
+COLUMNS = (
+    ('id', None), ('status', None),
+    ('homeScore', 'current'), ('homeScore', 'display'), ('homeScore', 'period1'),
+    ('homeScore', 'period2'), ('homeScore', 'normaltime'),
+    ('awayScore', 'current'), ('awayScore', 'display'), ('awayScore', 'period1'),
+    ('awayScore', 'period2'), ('awayScore', 'normaltime'),
+    ('time', 'initial'), ('time', 'max'), ('time', 'extra'), ('time', 'currentPeriodStartTimestamp'),
+)
+NESTED_KEYS = ('homeScore', 'awayScore', 'time')
+MISSING = -(1 << 63)  # Column value of a field the event doesn't have, or keeps in the static part
+
+
+def is_column_value(value):
+    """Check if a value fits an int64 column"""
+    return type(value) is int and MISSING < value < (1 << 63)
+
+
+def build_event(static_event, row, statuses):
+    """Rebuild an event from its static part and its row of hot columns"""
+    event = dict(static_event)
+    for key in NESTED_KEYS:
+        if key in event:
+            event[key] = dict(event[key])
+    for (key, field), value in zip(COLUMNS, row):
+        if value == MISSING:
+            continue
+        if field is not None:
+            event[key][field] = value
+        elif key == 'status':
+            event[key] = dict(statuses[value])
+        else:
+            event[key] = value
+    return event
+
+
+class SnapshotPublisher:
+    """Writes snapshots into a segment file as int64 columns of hot fields plus a static JSON part.
+    
+    Score, status, period and id values go to fixed-layout columns, one row
+    per event; everything else goes to compact JSON that is only rewritten,
+    and only re-parsed by readers, when it changes. Columns use the host's
+    byte order, as the segment never leaves the machine.
+    
+    The sequence is odd while a snapshot is being written and even once it is
+    complete, so readers can tell a torn read and retry. A snapshot larger than
+    the segment is written to a new, larger file that replaces the old one;
+    the old segment is flagged so readers attach to the new file. There must
+    be a single publisher per path.
+    """
+    
+    def __init__(self, path, capacity=1 << 20):
+        self.path = path
+        self.file = None
+        self.map = None
+        self.sequence = 0
+        self.version = None
+        self.count = 0
+        self.static_version = 0
+        self.static_bytes = None  # Static part in the current file; None until written there
+        self.statuses = []  # Distinct status objects, indexed by the status column
+        self.status_index = {}
+        self.stats = {'publishes': 0, 'skipped': 0, 'grows': 0, 'static_writes': 0,
+                      'last_publish_ms': 0.0, 'last_bytes': 0}
+        self.open(capacity)
+    
+    def open(self, capacity):
+        """Map the segment at path, reusing an existing one that is large enough"""
+        if os.path.exists(self.path) and os.path.getsize(self.path) >= HEADER_SIZE:
+            f = open(self.path, 'r+b')
+            segment = mmap.mmap(f.fileno(), 0)
+            magic, layout, _, _, sequence, _, _, _, static_version, _ = HEADER.unpack_from(segment, 0)
+            if magic == MAGIC and layout == LAYOUT:
+                self.file, self.map = f, segment
+                self.sequence = sequence + (sequence & 1)  # A publisher that died mid-write left it odd
+                self.static_version = static_version
+                if len(segment) >= HEADER_SIZE + capacity:
+                    return
+            else:
+                segment.close()
+                f.close()
+        self.create(capacity)  # Flags a mapped segment that is too small as replaced
+    
+    def create(self, capacity):
+        """Create a new segment file with no snapshot and swap it in atomically.
+        
+        The header takes the current sequence, which publish makes odd before
+        growing, so readers that attach before the payload is copied retry.
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(temp_path, 'wb') as f:
+            f.truncate(HEADER_SIZE + capacity)
+        f = open(temp_path, 'r+b')
+        segment = mmap.mmap(f.fileno(), 0)
+        HEADER.pack_into(segment, 0, MAGIC, LAYOUT, 0, 0, self.sequence, self.version or 0, 0, 0.0, 0, 0)
+        os.replace(temp_path, self.path)
+        
+        if self.map is not None:
+            self.write_flags(REPLACED)
+            self.map.close()
+            self.file.close()
+        self.file, self.map = f, segment
+        self.static_bytes = None
+    
+    def write_flags(self, flags):
+        """Set the flags field of the current segment"""
+        struct.pack_into('<I', self.map, 8, flags)
+    
+    def write_header(self, version=None, count=None, length=None, published_at=None, static_version=None):
+        """Write the sequence and, when given, the snapshot fields"""
+        fields = list(HEADER.unpack_from(self.map, 0))
+        fields[4] = self.sequence
+        for index, value in ((5, version), (3, count), (6, length), (7, published_at), (8, static_version)):
+            if value is not None:
+                fields[index] = value
+        HEADER.pack_into(self.map, 0, *fields)
+    
+    def split_event(self, event):
+        """Split an event into its static part and its row of hot column values"""
+        static_event = dict(event)
+        for key in NESTED_KEYS:
+            if isinstance(static_event.get(key), dict):
+                static_event[key] = dict(static_event[key])
+        row = []
+        for key, field in COLUMNS:
+            value = MISSING
+            if field is not None:
+                part = static_event.get(key)
+                if isinstance(part, dict) and is_column_value(part.get(field)):
+                    value = part.pop(field)
+            elif key == 'status':
+                value = self.intern_status(static_event.get(key))
+                if value != MISSING:
+                    del static_event[key]
+            elif is_column_value(static_event.get(key)):
+                value = static_event.pop(key)
+            row.append(value)
+        return static_event, row
+    
+    def intern_status(self, status):
+        """Get the table index of a status object, or MISSING if it can't be shared"""
+        if not isinstance(status, dict):
+            return MISSING
+        try:
+            key = tuple(sorted(status.items()))
+            hash(key)
+        except TypeError:  # Nested values stay in the static part
+            return MISSING
+        if key not in self.status_index:
+            self.status_index[key] = len(self.statuses)
+            self.statuses.append(dict(status))
+        return self.status_index[key]
+    
+    def publish(self, data, version):
+        """Publish a snapshot; an unchanged version is skipped. Returns True if written."""
+        if self.map is None:
+            return False
+        if version == self.version:
+            self.stats['skipped'] += 1
+            return False
+        
+        start = time.perf_counter()
+        static_events, rows = [], []
+        for event in data.get('events', []):
+            static_event, row = self.split_event(event)
+            static_events.append(static_event)
+            rows.append(row)
+        columns = b''.join(array('q', column).tobytes() for column in zip(*rows))
+        static = {'data': {key: value for key, value in data.items() if key != 'events'},
+                  'statuses': self.statuses, 'events': static_events}
+        static = json.dumps(static, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        
+        self.sequence += 1  # Odd: write in progress
+        size = len(columns) + len(static)
+        if HEADER_SIZE + size > len(self.map):
+            self.stats['grows'] += 1
+            self.create(max(size * 2, (len(self.map) - HEADER_SIZE) * 2))
+        self.write_header()
+        self.map[HEADER_SIZE:HEADER_SIZE + len(columns)] = columns
+        written = len(columns)
+        if static != self.static_bytes or len(rows) != self.count:
+            # The static part follows the columns, so it moves when the event count changes
+            offset = HEADER_SIZE + len(columns)
+            self.map[offset:offset + len(static)] = static
+            self.static_bytes = static
+            self.static_version += 1
+            self.stats['static_writes'] += 1
+            written += len(static)
+        self.count = len(rows)
+        self.sequence += 1  # Even: complete
+        self.write_header(version, self.count, len(static), time.time(), self.static_version)
+        
+        self.version = version
+        self.stats['publishes'] += 1
+        self.stats['last_publish_ms'] = (time.perf_counter() - start) * 1000
+        self.stats['last_bytes'] = written
+        return True
+    
+    def close(self):
+        """Unmap the segment; the file keeps the last snapshot for readers"""
+        if self.map is not None:
+            self.map.close()
+            self.file.close()
+            self.map = None
+            self.file = None
+
+
+class SnapshotReader:
+    """Maps a segment file read-only and rebuilds only the events whose hot columns changed.
+    
+    Checking for a new snapshot reads the 64-byte header from the shared
+    mapping. A new snapshot copies the fixed-layout columns out with one
+    memcpy each; the static JSON part is copied and parsed only when its
+    version changes, and events whose row is unchanged are reused from the
+    previous read.
+    """
+    
+    def __init__(self, path, retries=100):
+        self.path = path
+        self.retries = retries  # Attempts while the publisher is mid-write
+        self.file = None
+        self.map = None
+        self.sequence = None  # Sequence of the last snapshot read
+        self.version = None
+        self.published_at = None
+        self.length = 0  # Bytes read for the last snapshot
+        self.static = None  # Parsed static part, and its version in the mapped file
+        self.static_version = None
+        self.columns = None  # Hot columns and events of the last snapshot
+        self.events = []
+        self.stats = {'reads': 0, 'unchanged': 0, 'retries': 0, 'attaches': 0, 'static_parses': 0,
+                      'events_rebuilt': 0}
+    
+    def attach(self):
+        """Map the segment file; False if it doesn't exist yet"""
+        if self.map is not None:
+            return True
+        try:
+            f = open(self.path, 'rb')
+        except OSError:
+            return False
+        try:
+            segment = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):  # Empty file
+            f.close()
+            return False
+        if segment[:4] != MAGIC or HEADER.unpack_from(segment, 0)[1] != LAYOUT:
+            segment.close()
+            f.close()
+            return False
+        self.file, self.map = f, segment
+        self.sequence = None
+        self.static = self.static_version = self.columns = None
+        self.stats['attaches'] += 1
+        return True
+    
+    def detach(self):
+        """Unmap the segment"""
+        if self.map is not None:
+            self.map.close()
+            self.file.close()
+            self.map = None
+            self.file = None
+    
+    def read_columns(self, count):
+        """Copy the hot columns of count events out of the mapping"""
+        size = count * 8
+        return [array('q', self.map[HEADER_SIZE + index * size:HEADER_SIZE + (index + 1) * size])
+                for index in range(len(COLUMNS))]
+    
+    def read(self):
+        """Get (data, version) of a snapshot published since the last read, or None"""
+        for _ in range(self.retries):
+            if not self.attach():
+                return None
+            _, _, flags, count, sequence, version, length, published_at, static_version, _ = \
+                HEADER.unpack_from(self.map, 0)
+            columns_size = count * len(COLUMNS) * 8
+            if flags & REPLACED or HEADER_SIZE + columns_size + length > len(self.map):
+                self.detach()  # The publisher moved to a larger file
+                continue
+            if sequence == self.sequence or sequence == 0:
+                self.stats['unchanged'] += 1
+                return None
+            if sequence & 1:
+                self.stats['retries'] += 1
+                time.sleep(0)
+                continue
+            if static_version == 0:
+                self.stats['unchanged'] += 1  # A new file nothing has been published into yet
+                return None
+            
+            payload = None
+            if static_version != self.static_version:
+                offset = HEADER_SIZE + columns_size
+                payload = self.map[offset:offset + length]
+            columns = self.read_columns(count)
+            if HEADER.unpack_from(self.map, 0)[4] != sequence:
+                self.stats['retries'] += 1  # Overwritten while copying
+                continue
+            
+            if payload is not None:
+                self.static = json.loads(payload)
+                self.static_version = static_version
+                self.columns = None
+                self.stats['static_parses'] += 1
+            self.events = self.build_events(columns)
+            self.columns = columns
+            self.sequence = sequence
+            self.version = version
+            self.published_at = published_at
+            self.length = columns_size + (length if payload is not None else 0)
+            self.stats['reads'] += 1
+            return dict(self.static['data'], events=self.events), version
+        return None
+    
+    def build_events(self, columns):
+        """Reuse the events whose row didn't change since the last read and rebuild the others"""
+        statuses = self.static['statuses']
+        static_events = self.static['events']
+        if self.columns is None or len(self.events) != len(static_events):
+            self.stats['events_rebuilt'] += len(static_events)
+            return [build_event(static_event, row, statuses) for static_event, row in zip(static_events, zip(*columns))]
+        
+        # Only columns that differ as a whole are compared row by row
+        changed = set()
+        for column, previous in zip(columns, self.columns):
+            if column != previous:
+                changed.update(index for index, (new, old) in enumerate(zip(column, previous)) if new != old)
+        events = list(self.events)
+        for index in changed:
+            events[index] = build_event(static_events[index], [column[index] for column in columns], statuses)
+        self.stats['events_rebuilt'] += len(changed)
+        return events
+    
+    def close(self):
+        """Unmap the segment"""
+        self.detach()
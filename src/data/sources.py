@@ -0,0 +1,372 @@
+"""
+Data Sources Module
+Where match data comes from: the Playwright scraper, a local file or a shared server.
+"""
+
+import email.utils
+import glob
+import gzip
+import http.client
+import json
+import os
+import socket
+import time
+from urllib.parse import urlsplit
+
+from data.shared_snapshot import FileLock
+from data.snapshot_segment import SnapshotReader
+
+
+class SourceError(Exception):
+    """A fetch failed with a message fit for the user"""
+
+
+def create_match_scraper(output_path):
+    """Create the Playwright scraper; imported lazily so Playwright is only needed to scrape"""
+    from scraper.match_scraper import MatchScraper
+    return MatchScraper(output_path=output_path)
+
+
+class DataSource:
+    """Interface of match data sources used by DataProcessor.
+    
+    fetch() runs on a worker thread and returns the sofascore-style data, or
+    None when cancel_event was set; errors are raised as SourceError. stop()
+    may be called from any thread to end a running fetch early. Every source
+    reports how fresh its data is and what fetching it costs.
+    """
+    
+    name = 'source'
+    cost_kind = 'unknown'  # 'browser', 'network', 'disk' or 'memory'
+    
+    def __init__(self):
+        self.fetched_at = None  # Wall time of the last successful fetch
+        self.data_time = None  # Wall time the data was produced, if the source knows it
+        self.stats = {'fetches': 0, 'failures': 0, 'unchanged': 0, 'total_ms': 0.0, 'total_bytes': 0}
+    
+    def fetch(self, cancel_event):
+        raise NotImplementedError
+    
+    def stop(self):
+        """Stop a running fetch early"""
+    
+    def pause(self):
+        """The app stopped refreshing for now; let go of what other instances could use"""
+    
+    def close(self):
+        """Release what the source holds when the app exits"""
+    
+    def record_fetch(self, start, size=0, data_time=None, unchanged=False):
+        """Count a successful fetch that started at perf_counter() time start"""
+        self.stats['fetches'] += 1
+        self.stats['total_ms'] += (time.perf_counter() - start) * 1000
+        self.stats['total_bytes'] += size
+        self.stats['unchanged'] += int(unchanged)
+        self.fetched_at = time.time()
+        self.data_time = data_time or self.fetched_at
+    
+    def get_freshness(self):
+        """Get when the data was fetched and produced, and its age in seconds"""
+        age = time.time() - self.data_time if self.data_time else None
+        return {'fetched_at': self.fetched_at, 'data_time': self.data_time, 'age_seconds': age}
+    
+    def get_cost(self):
+        """Get the kind of work a fetch takes and its measured averages"""
+        fetches = self.stats['fetches']
+        return {
+            'kind': self.cost_kind,
+            'fetches': fetches,
+            'failures': self.stats['failures'],
+            'unchanged': self.stats['unchanged'],
+            'avg_fetch_ms': self.stats['total_ms'] / fetches if fetches else None,
+            'avg_bytes': self.stats['total_bytes'] / fetches if fetches else None
+        }
+    
+    def describe(self):
+        """Get a one-line summary of the source, its freshness and cost"""
+        freshness = self.get_freshness()
+        cost = self.get_cost()
+        age = f"{freshness['age_seconds']:.0f}s old" if freshness['age_seconds'] is not None else "no data yet"
+        average = f", avg {cost['avg_fetch_ms']:.0f}ms" if cost['avg_fetch_ms'] is not None else ""
+        return f"{self.name} ({cost['kind']}): {age}, {cost['fetches']} fetches{average}"
+
+
+class ScraperSource(DataSource):
+    """Scrapes sofascore with a headless Chromium for every fetch."""
+    
+    cost_kind = 'browser'
+    
+    def __init__(self, output_path, scraper_factory=None):
+        super().__init__()
+        self.name = 'scraper'
+        self.output_path = output_path
+        self.scraper_factory = scraper_factory or create_match_scraper  # output_path -> object with run() and stop()
+        self.scraper = None
+    
+    def fetch(self, cancel_event):
+        start = time.perf_counter()
+        scraper = self.scraper = self.scraper_factory(self.output_path)
+        if cancel_event.is_set():
+            return None
+        try:
+            success = scraper.run()
+        finally:
+            self.scraper = None
+        if cancel_event.is_set():
+            return None
+        
+        if not success or not getattr(scraper, 'json_data', None):
+            self.stats['failures'] += 1
+            if getattr(scraper, 'last_error', None):
+                raise SourceError(f"Error: {scraper.last_error}")
+            raise SourceError("Failed to fetch matches. Please check your internet connection and try again.")
+        
+        size = os.path.getsize(self.output_path) if os.path.exists(self.output_path) else 0
+        self.record_fetch(start, size)
+        return scraper.json_data
+    
+    def stop(self):
+        scraper = self.scraper
+        if scraper is not None:
+            scraper.stop()
+
+
+class FileSource(DataSource):
+    """Reads a JSON snapshot file, or the newest *.json file of a directory.
+    
+    The file is only parsed again when its modification time or size changes.
+    """
+    
+    cost_kind = 'disk'
+    
+    def __init__(self, path):
+        super().__init__()
+        self.name = f"file {path}"
+        self.path = path
+        self.signature = None  # (path, mtime, size) of the parsed file
+        self.data = None
+    
+    def resolve_path(self):
+        """Get the file to read"""
+        if not os.path.isdir(self.path):
+            return self.path
+        files = glob.glob(os.path.join(self.path, '*.json'))
+        if not files:
+            raise SourceError(f"No JSON files in {self.path}")
+        return max(files, key=os.path.getmtime)
+    
+    def fetch(self, cancel_event):
+        start = time.perf_counter()
+        try:
+            path = self.resolve_path()
+            stat = os.stat(path)
+            signature = (path, stat.st_mtime_ns, stat.st_size)
+            if signature == self.signature:
+                self.record_fetch(start, 0, stat.st_mtime, unchanged=True)
+                return self.data
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            self.stats['failures'] += 1
+            raise SourceError(f"Error reading {self.path}: {e}")
+        
+        self.signature = signature
+        self.data = data
+        self.record_fetch(start, stat.st_size, stat.st_mtime)
+        return data
+
+
+class RemoteSource(DataSource):
+    """Fetches /events from a shared daemon's API server, revalidating with ETags.
+    
+    An unchanged snapshot costs one 304 response; changed ones arrive gzipped.
+    """
+    
+    cost_kind = 'network'
+    
+    def __init__(self, url, timeout=15):
+        super().__init__()
+        parts = urlsplit(url if '://' in url else f"http://{url}")
+        self.name = f"server {parts.netloc}"
+        self.scheme = parts.scheme
+        self.host = parts.hostname
+        self.port = parts.port
+        self.path = parts.path if parts.path not in ('', '/') else '/events'
+        self.timeout = timeout
+        self.etag = None
+        self.data = None
+        self.sock = None
+    
+    def fetch(self, cancel_event):
+        start = time.perf_counter()
+        connection_class = http.client.HTTPSConnection if self.scheme == 'https' else http.client.HTTPConnection
+        connection = connection_class(self.host, self.port, timeout=self.timeout)
+        headers = {'Accept-Encoding': 'gzip'}
+        if self.etag and self.data is not None:
+            headers['If-None-Match'] = self.etag
+        try:
+            connection.connect()
+            self.sock = connection.sock
+            connection.request('GET', self.path, headers=headers)
+            response = connection.getresponse()
+            body = response.read()
+        except (OSError, http.client.HTTPException) as e:
+            if cancel_event.is_set():
+                return None
+            self.stats['failures'] += 1
+            raise SourceError(f"Could not reach {self.name}: {e}")
+        finally:
+            self.sock = None
+            connection.close()
+        if cancel_event.is_set():
+            return None
+        
+        data_time = self.parse_date(response.getheader('Last-Modified'))
+        if response.status == 304:
+            self.record_fetch(start, 0, data_time or self.data_time, unchanged=True)
+            return self.data
+        if response.status != 200:
+            self.stats['failures'] += 1
+            raise SourceError(f"{self.name} answered HTTP {response.status}")
+        
+        try:
+            if response.getheader('Content-Encoding') == 'gzip':
+                body = gzip.decompress(body)
+            data = json.loads(body)
+        except (OSError, ValueError) as e:
+            self.stats['failures'] += 1
+            raise SourceError(f"Invalid response from {self.name}: {e}")
+        
+        self.etag = response.getheader('ETag')
+        self.data = data
+        self.record_fetch(start, len(body), data_time)
+        return data
+    
+    def stop(self):
+        sock = self.sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+    
+    @staticmethod
+    def parse_date(value):
+        """Get the wall time of an HTTP date header, or None"""
+        try:
+            return email.utils.parsedate_to_datetime(value).timestamp() if value else None
+        except (TypeError, ValueError):
+            return None
+
+
+class SegmentSource(DataSource):
+    """Reads the snapshot a local daemon publishes into a memory-mapped segment file.
+    
+    A fetch with no new snapshot only reads the segment header, so polling it
+    often costs next to nothing; a new snapshot only rebuilds the events whose
+    scores, status or period changed.
+    """
+    
+    cost_kind = 'memory'
+    
+    def __init__(self, path):
+        super().__init__()
+        self.name = f"segment {path}"
+        self.path = path
+        self.reader = SnapshotReader(path)
+        self.data = None
+    
+    def fetch(self, cancel_event):
+        start = time.perf_counter()
+        try:
+            result = self.reader.read()
+        except (OSError, ValueError) as e:
+            self.stats['failures'] += 1
+            raise SourceError(f"Error reading {self.path}: {e}")
+        if result is None:
+            if self.data is None:
+                self.stats['failures'] += 1
+                raise SourceError(f"No snapshot published in {self.path} yet")
+            self.record_fetch(start, 0, self.reader.published_at, unchanged=True)
+            return self.data
+        
+        self.data = result[0]
+        self.record_fetch(start, self.reader.length, self.reader.published_at)
+        return self.data
+    
+    def close(self):
+        self.reader.close()
+
+
+class SharedSource(DataSource):
+    """Lets one instance per machine scrape while the others read its snapshot file.
+    
+    The instance holding an exclusive lock next to the snapshot is the leader
+    and fetches from leader_source, which saves the snapshot atomically. The
+    others follow by reading the file and try to take over at every fetch, so
+    a closed, crashed or paused leader is replaced at the next refresh.
+    """
+    
+    def __init__(self, leader_source, path, lock_path=None):
+        super().__init__()
+        self.leader_source = leader_source
+        self.follower_source = FileSource(path)
+        self.path = path
+        self.lock = FileLock(lock_path or f"{path}.lock")
+        self.current = None
+        self.name = 'shared'
+    
+    @property
+    def is_leader(self):
+        """Check if this instance fetches for the others"""
+        return self.lock.locked
+    
+    def fetch(self, cancel_event):
+        if self.lock.locked or self.lock.acquire():
+            if self.current is not self.leader_source:
+                print(f"Leading: this instance fetches for every instance using {self.path}")
+            self.current = self.leader_source
+        else:
+            self.current = self.follower_source
+            if not os.path.exists(self.path):
+                raise SourceError("Waiting for the instance that fetches matches to save its first snapshot")
+        self.name = f"shared {'leader' if self.is_leader else 'follower'} via {self.current.name}"
+        return self.current.fetch(cancel_event)
+    
+    def stop(self):
+        if self.current is not None:
+            self.current.stop()
+    
+    def pause(self):
+        # A paused leader stops scraping, so hand the lead to an instance that still refreshes
+        if self.lock.locked:
+            print(f"Paused: another instance may now fetch for {self.path}")
+        self.lock.release()
+    
+    def close(self):
+        self.lock.release()
+    
+    def get_freshness(self):
+        return (self.current or self.follower_source).get_freshness()
+    
+    def get_cost(self):
+        cost = dict((self.current or self.follower_source).get_cost())
+        cost['role'] = 'leader' if self.is_leader else 'follower'
+        return cost
+
+
+def create_source(spec, output_path):
+    """Create a source from a command line spec: 'shared', 'scraper', an http(s) URL, 'shm:PATH' of a
+    daemon's snapshot segment or a file/directory path"""
+    if spec == 'shared':
+        return SharedSource(ScraperSource(output_path), output_path)
+    if not spec or spec == 'scraper':
+        return ScraperSource(output_path)
+    if spec.startswith(('http://', 'https://')):
+        return RemoteSource(spec)
+    if spec.startswith('shm:'):
+        return SegmentSource(spec[len('shm:'):])
+    path = spec[len('file:'):] if spec.startswith('file:') else spec
+    if not os.path.exists(path):
+        raise ValueError(f"Unknown data source: {spec}")
+    return FileSource(path)
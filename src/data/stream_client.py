@@ -0,0 +1,158 @@
+"""
+Stream Client Module
+Follows the API server's Server-Sent Events stream and rebuilds match snapshots locally.
+"""
+
+import http.client
+import json
+import socket
+import threading
+import time
+from urllib.parse import urlsplit
+
+from data.deltas import apply_deltas, index_events
+
+
+class StreamSubscriber:
+    """Subscribes to a /stream URL and hands complete snapshots to on_data(data, version).
+    
+    The first event is a snapshot; afterwards deltas are applied to a local
+    index and delivered once their batch is committed. After a dropped
+    connection it reconnects with backoff, sending the last event id so the
+    server replays what was missed (or sends a fresh snapshot).
+    
+    Runs on its own daemon thread: the connection stays open for the lifetime
+    of the app, which would permanently occupy an executor worker.
+    """
+    
+    def __init__(self, url, on_data, on_status=None, read_timeout=45, max_backoff=60):
+        self.url = url
+        self.on_data = on_data  # Called on the subscriber thread
+        self.on_status = on_status or (lambda message: None)
+        self.read_timeout = read_timeout  # Seconds without data, heartbeats included, before reconnecting
+        self.max_backoff = max_backoff
+        self.last_event_id = None
+        self.events = {}  # event id -> event of the snapshot being followed
+        self.version = None
+        self.connection = None
+        self.sock = None  # Socket of the current connection; the response keeps it open after close()
+        self.thread = None
+        self.stop_event = threading.Event()
+        self.stats = {'connects': 0, 'snapshots': 0, 'deltas': 0, 'commits': 0, 'errors': 0}
+    
+    def start(self):
+        """Start following the stream"""
+        if self.thread is None:
+            self.thread = threading.Thread(target=self.run, name='stream-subscriber', daemon=True)
+            self.thread.start()
+    
+    def stop(self):
+        """Stop following the stream and close the connection"""
+        self.stop_event.set()
+        self.close()
+    
+    def resync(self):
+        """Reconnect without resuming, so the server sends a full snapshot"""
+        self.last_event_id = None
+        self.close()
+    
+    def close(self):
+        """Shut down the current connection, which ends the blocking read"""
+        sock = self.sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+    
+    def run(self):
+        """Connect, read events and reconnect with backoff until stopped"""
+        failures = 0
+        while not self.stop_event.is_set():
+            try:
+                self.follow()
+                failures = 0
+            except Exception as e:
+                if self.stop_event.is_set():
+                    break
+                failures += 1
+                self.stats['errors'] += 1
+                print(f"Stream error: {e}")
+            
+            if self.stop_event.is_set():
+                break
+            delay = min(self.max_backoff, 2 ** min(failures, 6)) if failures else 1
+            self.on_status(f"Stream disconnected, reconnecting in {delay}s")
+            self.stop_event.wait(delay)
+    
+    def follow(self):
+        """Read one connection's events until it ends"""
+        url = urlsplit(self.url)
+        connection_class = http.client.HTTPSConnection if url.scheme == 'https' else http.client.HTTPConnection
+        self.connection = connection_class(url.hostname, url.port, timeout=self.read_timeout)
+        headers = {'Accept': 'text/event-stream'}
+        if self.last_event_id:
+            headers['Last-Event-ID'] = self.last_event_id
+        try:
+            self.connection.connect()
+            self.sock = self.connection.sock
+            self.connection.request('GET', url.path or '/stream', headers=headers)
+            response = self.connection.getresponse()
+            if response.status != 200:
+                raise ConnectionError(f"HTTP {response.status} from {self.url}")
+            self.stats['connects'] += 1
+            self.on_status(f"Streaming from {url.netloc}")
+            self.read_events(response)
+        finally:
+            self.connection.close()
+            self.connection = None
+            self.sock = None
+    
+    def read_events(self, response):
+        """Parse the Server-Sent Events of a response"""
+        event_type, event_id, data_lines = 'message', None, []
+        while not self.stop_event.is_set():
+            line = response.readline()
+            if not line:
+                return  # Server closed the stream
+            line = line.decode('utf-8').rstrip('\r\n')
+            if not line:
+                if data_lines:
+                    self.handle_event(event_type, '\n'.join(data_lines))
+                if event_id is not None:
+                    self.last_event_id = event_id
+                event_type, event_id, data_lines = 'message', None, []
+                continue
+            
+            field, _, value = line.partition(':')
+            value = value[1:] if value.startswith(' ') else value
+            if field == 'event':
+                event_type = value
+            elif field == 'id':
+                event_id = value
+            elif field == 'data':
+                data_lines.append(value)
+    
+    def handle_event(self, event_type, data):
+        """Apply one event to the local snapshot"""
+        payload = json.loads(data)
+        if event_type == 'snapshot':
+            self.stats['snapshots'] += 1
+            self.events = index_events(payload['data'])
+            self.version = payload.get('version')
+            self.deliver()
+        elif event_type == 'delta':
+            self.stats['deltas'] += 1
+            apply_deltas(self.events, [payload])
+        elif event_type == 'commit':
+            self.stats['commits'] += 1
+            self.version = payload.get('version')
+            self.deliver()
+    
+    def deliver(self):
+        """Hand the current snapshot to on_data"""
+        start = time.perf_counter()
+        self.on_data({'events': list(self.events.values())}, self.version)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        if elapsed_ms > 100:
+            print(f"Stream: delivering version {self.version} took {elapsed_ms:.0f}ms")
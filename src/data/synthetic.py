@@ -0,0 +1,197 @@
+"""
+Synthetic Match Data Module
+Generates sofascore-shaped scheduled-events payloads of any size, deterministic by seed, for
+benchmarks and load tests.
+
+Usage:
+    python src/data/synthetic.py --events 10000 --output data/synthetic.json
+    python src/data/synthetic.py --events 2000 --snapshots 120 --interval 30 --output data/day.ndjson
+"""
+
+import argparse
+import copy
+import json
+import random
+import sys
+import time
+
+SYLLABLES = ['ar', 'ba', 'ce', 'do', 'el', 'fi', 'ga', 'ho', 'in', 'ju', 'ka', 'lo', 'mi', 'no', 'or',
+             'pa', 'qui', 're', 'sa', 'to', 'ur', 'vi', 'wa', 'xe', 'yo', 'za', 'ton', 'berg', 'ville']
+SUFFIXES = ['FC', 'United', 'City', 'Athletic', 'Rovers', 'Sporting', 'Dynamo', 'Real', 'Inter']
+COUNTRIES = ['England', 'Spain', 'Italy', 'Germany', 'France', 'Brazil', 'Argentina', 'Netherlands',
+             'Portugal', 'Turkey', 'Japan', 'USA', 'Mexico', 'Belgium', 'Scotland', 'Norway']
+
+# (code, description, elapsed seconds range of the current period, initial seconds, period max)
+LIVE_PERIODS = [
+    (6, '1st half', (0, 2700), 0, 2700),
+    (31, 'Halftime', (0, 0), 2700, 2700),
+    (7, '2nd half', (0, 2700), 2700, 5400),
+]
+
+
+def make_name(rng, min_length, max_length, suffix=True):
+    """Make a pronounceable name between min_length and max_length characters"""
+    length = rng.randint(min_length, max_length)
+    name = ''
+    while len(name) < length:
+        name += rng.choice(SYLLABLES)
+    name = name[:length].capitalize()
+    if suffix and rng.random() < 0.3:
+        club = rng.choice(SUFFIXES)
+        if length + 1 + len(club) <= max_length:
+            name = f"{name} {club}"
+    return name
+
+
+def slugify(name):
+    """Get the sofascore-style slug of a name"""
+    return name.lower().replace(' ', '-')
+
+
+def make_tournaments(rng, count):
+    """Make tournaments with categories and sofascore-style unique tournament ids"""
+    tournaments = []
+    for index in range(count):
+        country = COUNTRIES[index % len(COUNTRIES)]
+        name = f"{make_name(rng, 5, 12, suffix=False)} League" if index >= len(COUNTRIES) else f"{country} Premier"
+        tournaments.append({
+            'name': name,
+            'slug': slugify(name),
+            'category': {'name': country, 'slug': slugify(country), 'id': 1 + COUNTRIES.index(country)},
+            'uniqueTournament': {'name': name, 'slug': slugify(name), 'id': 1000 + index},
+            'priority': max(0, 1000 - index * 10),
+            'id': 5000 + index
+        })
+    return tournaments
+
+
+def make_team(rng, team_id, min_length, max_length):
+    """Make a team with its short name, slug and three-letter code"""
+    name = make_name(rng, min_length, max_length)
+    return {'name': name, 'shortName': name[:12], 'slug': slugify(name), 'nameCode': name[:3].upper(),
+            'id': team_id}
+
+
+def make_status(rng, kind, now, start_timestamp):
+    """Get the status, scores, time and start fields of a live, finished or upcoming event"""
+    if kind == 'upcoming':
+        return {'status': {'code': 0, 'description': 'Not started', 'type': 'notstarted'},
+                'homeScore': {}, 'awayScore': {}, 'time': {}, 'startTimestamp': start_timestamp}
+    
+    home, away = rng.choice([0, 0, 1, 1, 1, 2, 2, 3, 4]), rng.choice([0, 0, 1, 1, 2, 2, 3])
+    if kind == 'finished':
+        winner = 1 if home > away else 2 if away > home else 3
+        return {'status': {'code': 100, 'description': 'Ended', 'type': 'finished', 'winnerCode': winner},
+                'winnerCode': winner,
+                'homeScore': {'current': home, 'display': home, 'period1': home // 2, 'normaltime': home},
+                'awayScore': {'current': away, 'display': away, 'period1': away // 2, 'normaltime': away},
+                'time': {}, 'startTimestamp': start_timestamp}
+    
+    code, description, (low, high), initial, period_max = rng.choice(LIVE_PERIODS)
+    elapsed = rng.randint(low, high)
+    return {'status': {'code': code, 'description': description, 'type': 'inprogress'},
+            'homeScore': {'current': home, 'display': home, 'period1': home // 2},
+            'awayScore': {'current': away, 'display': away, 'period1': away // 2},
+            'time': {'initial': initial, 'max': period_max, 'extra': 540,
+                     'currentPeriodStartTimestamp': now - elapsed},
+            'startTimestamp': now - initial - elapsed - (900 if initial else 0)}
+
+
+def generate_payload(events=1000, tournaments=50, live=0.2, finished=0.3, name_length=(6, 18), seed=0,
+                     now=None):
+    """Generate a scheduled-events payload; the same arguments always give the same payload.
+    
+    live and finished are the fractions of events in each state, the rest are
+    upcoming. Tournament sizes are skewed like a real match day: a few big
+    leagues and a long tail of small ones. now defaults to the current time
+    and anchors every timestamp.
+    """
+    rng = random.Random(seed)
+    now = int(time.time()) if now is None else int(now)
+    min_length, max_length = name_length
+    tournament_list = make_tournaments(rng, max(1, tournaments))
+    weights = [1 / (rank + 1) for rank in range(len(tournament_list))]
+    
+    live_count = round(events * live)
+    finished_count = min(events - live_count, round(events * finished))
+    kinds = ['live'] * live_count + ['finished'] * finished_count
+    kinds += ['upcoming'] * (events - len(kinds))
+    rng.shuffle(kinds)
+    
+    payload = []
+    for index, kind in enumerate(kinds):
+        # Every tournament gets a match before the skewed draw
+        tournament = tournament_list[index] if index < len(tournament_list) else rng.choices(tournament_list, weights)[0]
+        if kind == 'finished':
+            start_timestamp = now - rng.randint(2, 10) * 3600 - rng.choice([0, 900, 1800, 2700])
+        else:
+            start_timestamp = now + rng.randint(1, 120) * 900
+        event = {
+            'id': 10000000 + index,
+            'customId': ''.join(rng.choice('abcdefghijkmnopqrstuvwxyzABCDEFGH') for _ in range(6)),
+            'tournament': tournament,
+            'roundInfo': {'round': rng.randint(1, 38)},
+            'homeTeam': make_team(rng, 200000 + 2 * index, min_length, max_length),
+            'awayTeam': make_team(rng, 200001 + 2 * index, min_length, max_length),
+        }
+        event['slug'] = f"{event['homeTeam']['slug']}-{event['awayTeam']['slug']}"
+        event.update(make_status(rng, kind, now, start_timestamp))
+        payload.append(event)
+    return {'events': payload}
+
+
+def advance(data, seconds, rng, goal_rate=1 / 2700):
+    """Get the snapshot seconds later: goals in live matches at goal_rate per second each.
+    
+    Only changed events are copied, so unchanged events are shared with data.
+    """
+    events = []
+    for event in data['events']:
+        if event.get('status', {}).get('type') == 'inprogress' and rng.random() < goal_rate * seconds:
+            event = copy.deepcopy(event)
+            side = rng.choice(['homeScore', 'awayScore'])
+            event[side]['current'] = event[side].get('current', 0) + 1
+            event[side]['display'] = event[side]['current']
+        events.append(event)
+    return {'events': events}
+
+
+def main():
+    """Write a payload, or a timeline of snapshots as replayable NDJSON"""
+    parser = argparse.ArgumentParser(description="Generate synthetic sofascore-style match data.")
+    parser.add_argument('--events', type=int, default=1000, help="number of events (default: 1000)")
+    parser.add_argument('--tournaments', type=int, default=50, help="number of tournaments (default: 50)")
+    parser.add_argument('--live', type=float, default=0.2, help="fraction of live events (default: 0.2)")
+    parser.add_argument('--finished', type=float, default=0.3, help="fraction of finished events (default: 0.3)")
+    parser.add_argument('--name-length', type=int, nargs=2, default=[6, 18], metavar=('MIN', 'MAX'),
+                        help="team name length range (default: 6 18)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument('--now', type=float, help="timestamp the data is anchored at (default: current time)")
+    parser.add_argument('--snapshots', type=int, default=1,
+                        help="write this many snapshots with score changes as NDJSON for --replay (default: 1)")
+    parser.add_argument('--interval', type=float, default=30, help="seconds between snapshots (default: 30)")
+    parser.add_argument('--output', help="file to write (default: stdout)")
+    args = parser.parse_args()
+    if args.live < 0 or args.finished < 0 or args.live + args.finished > 1:
+        parser.error("--live and --finished must be fractions adding up to at most 1")
+    
+    now = int(time.time()) if args.now is None else args.now
+    data = generate_payload(args.events, args.tournaments, args.live, args.finished,
+                            tuple(args.name_length), args.seed, now)
+    out = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    try:
+        if args.snapshots <= 1:
+            json.dump(data, out, ensure_ascii=False, indent=4)
+            return
+        rng = random.Random(args.seed + 1)
+        for version in range(1, args.snapshots + 1):
+            record = {'type': 'snapshot', 'ts': now + (version - 1) * args.interval, 'version': version, 'data': data}
+            out.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n')
+            data = advance(data, args.interval, rng)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == '__main__':
+    main()
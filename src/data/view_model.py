@@ -0,0 +1,131 @@
+"""
+Match View Model Module
+Precomputes ready-to-draw match card descriptors away from the Tk thread.
+"""
+
+import threading
+from datetime import datetime, date
+
+from core.text import truncate_name
+from data.live_clock import LiveClock
+
+
+def get_section_type(event):
+    """Get the card section ('live', 'finished' or 'upcoming') for an event"""
+    status = event.get('status', {}).get('type')
+    if status == 'inprogress':
+        return 'live'
+    if status == 'finished':
+        return 'finished'
+    return 'upcoming'
+
+
+class MatchCardBuilder:
+    """Builds match card descriptors and caches them by event id and snapshot version.
+    
+    Descriptors only hold display strings, palette color roles and font keys,
+    so the Tk thread just creates or updates widgets from them.
+    """
+    
+    def __init__(self, live_clock=None):
+        self.live_clock = live_clock or LiveClock()
+        self._cache = {}  # event id -> (snapshot version, build date, descriptor)
+        self._lock = threading.Lock()
+    
+    def build_snapshot(self, data, version, should_stop=None):
+        """Precompute descriptors for every event in a snapshot, replacing older versions
+        
+        Returns the number of descriptors, or None if should_stop() turned True
+        midway, in which case the previous snapshot's descriptors are kept.
+        """
+        cache = self.build_cache(data, version, should_stop)
+        if cache is None:
+            return None
+        self.commit(cache)
+        return len(cache)
+    
+    def build_cache(self, data, version, should_stop=None):
+        """Build the descriptors of a snapshot without using them; None if should_stop() turned True"""
+        cache = {}
+        if not data or 'events' not in data:
+            return cache
+        
+        today = date.today()
+        for event in data['events']:
+            if should_stop and should_stop():
+                return None
+            try:
+                cache[event['id']] = (version, today, self.build_descriptor(event, today))
+            except Exception as e:
+                print(f"Error building match view model: {e}")
+        return cache
+    
+    def commit(self, cache):
+        """Replace the cached descriptors with ones from build_cache"""
+        with self._lock:
+            self._cache = cache
+    
+    def describe(self, event, version=None):
+        """Get the descriptor for an event, building it if it isn't cached for this version"""
+        today = date.today()
+        event_id = event.get('id')
+        
+        with self._lock:
+            cached = self._cache.get(event_id)
+        if cached and version is not None and cached[0] == version and cached[1] == today:
+            return cached[2]
+        
+        descriptor = self.build_descriptor(event, today)
+        if version is not None and event_id is not None:
+            with self._lock:
+                self._cache[event_id] = (version, today, descriptor)
+        return descriptor
+    
+    def build_descriptor(self, event, today=None):
+        """Build the display descriptor of a single match card"""
+        today = today or date.today()
+        section_type = get_section_type(event)
+        status = event.get('status', {})
+        home_team = event["homeTeam"]["name"]
+        away_team = event["awayTeam"]["name"]
+        
+        descriptor = {
+            'id': event.get('id'),
+            'section': section_type,
+            'accent_color': section_type,
+            'home_abbr': home_team[:3].upper(),
+            'away_abbr': away_team[:3].upper(),
+            'home_name': truncate_name(home_team),
+            'away_name': truncate_name(away_team),
+            'show_scores': section_type in ['live', 'finished'],
+            'home_score': str(event.get("homeScore", {}).get("current", "-")),
+            'away_score': str(event.get("awayScore", {}).get("current", "-")),
+            'winner': status.get('winnerCode', 0) if section_type == 'finished' else 0,
+            'name_font': 'body_medium',
+            'score_font': 'headline',
+            'status_font': 'caption',
+            'status_color': section_type,
+        }
+        descriptor['status_text'] = self.get_status_text(event, section_type, today)
+        return descriptor
+    
+    def get_live_status_text(self, event):
+        """Get the status line of a live match with its locally derived minute"""
+        minute = self.live_clock.format_minute(event)
+        return f"LIVE {minute}" if minute else "LIVE"
+    
+    def get_status_text(self, event, section_type, today):
+        """Get the status line text of a match card"""
+        if section_type == 'live':
+            return self.get_live_status_text(event)
+        
+        if section_type == 'finished':
+            return "FULL TIME"
+        
+        try:
+            match_time = datetime.fromtimestamp(event['startTimestamp'])
+            time_str = match_time.strftime('%H:%M')
+            date_str = match_time.strftime('%m/%d') if match_time.date() != today else "Today"
+            return f"{date_str} {time_str}"
+        except Exception:
+            return event.get('status', {}).get('description', 'Scheduled')
@@ -0,0 +1,163 @@
+"""
+Animation Clock Module
+Drives every animated widget in the window from a single Tk timer.
+"""
+
+import time
+import weakref
+import tkinter as tk
+
+
+class AnimationClock:
+    """Single ticker for blinking live dots and score-change flashes.
+    
+    Animations are registered with their color roles, so they follow theme
+    switches. The clock pauses while the window is iconified or unmapped,
+    stops when nothing is animated and stretches its interval when ticks run late.
+    """
+    
+    def __init__(self, root, design_system, interval=250, max_interval=2000, blink_period=1000):
+        self.root = root
+        self.design = design_system
+        self.base_interval = interval
+        self.interval = interval
+        self.max_interval = max_interval
+        self.blink_period = blink_period  # Milliseconds each blink phase lasts
+        self.flash_period = 250
+        
+        self.blinkers = weakref.WeakKeyDictionary()  # widget -> (option, on role, off role)
+        self.flashes = []  # {'widget': weak reference, 'option', 'role', 'rest_role', 'until'}
+        self.blink_phase = None
+        self.painted_colors = None  # role_colors the blinkers were last painted with
+        
+        self.job = None
+        self.due = None
+        self.paused = False
+        self.on_time_ticks = 0
+        self.stats = {'ticks': 0, 'throttled': 0, 'pauses': 0, 'last_frame_ms': 0.0}
+        
+        self.root.bind('<Unmap>', self.on_unmap, add='+')
+        self.root.bind('<Map>', self.on_map, add='+')
+    
+    def add_blinker(self, widget, on_role, off_role, option='fg'):
+        """Blink a widget option between two color roles"""
+        self.blinkers[widget] = (option, on_role, off_role)
+        self.painted_colors = None
+        self.start()
+    
+    def flash(self, widget, rest_role, role='warning', option='fg', duration=3000):
+        """Pulse a widget option in a highlight role, then settle on its resting role"""
+        self.flashes.append({
+            'widget': weakref.ref(widget),
+            'option': option,
+            'role': role,
+            'rest_role': rest_role,
+            'until': time.monotonic() + duration / 1000
+        })
+        self.start()
+    
+    def has_animations(self):
+        """Check if anything still needs the clock"""
+        return bool(self.flashes) or len(self.blinkers) > 0
+    
+    def start(self):
+        """Schedule the next tick unless one is pending or the window is hidden"""
+        if self.job is None and not self.paused:
+            self.due = time.monotonic() + self.interval / 1000
+            self.job = self.root.after(self.interval, self.tick)
+    
+    def stop(self):
+        """Cancel the pending tick"""
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
+    
+    def on_unmap(self, event):
+        """Pause when the main window is iconified or hidden"""
+        if event.widget is self.root and not self.paused:
+            self.paused = True
+            self.stats['pauses'] += 1
+            self.stop()
+    
+    def on_map(self, event):
+        """Resume when the main window is shown again"""
+        if event.widget is self.root and self.paused:
+            self.paused = False
+            self.painted_colors = None
+            self.start()
+    
+    def tick(self):
+        """Advance every animation, then reschedule with an interval adapted to load"""
+        self.job = None
+        now = time.monotonic()
+        if self.root.state() in ('iconic', 'withdrawn'):
+            self.paused = True
+            self.stats['pauses'] += 1
+            return
+        
+        late_ms = (now - self.due) * 1000 if self.due else 0
+        start = time.perf_counter()
+        self.step(now)
+        frame_ms = (time.perf_counter() - start) * 1000
+        self.stats['ticks'] += 1
+        self.stats['last_frame_ms'] = frame_ms
+        self.adapt_interval(late_ms, frame_ms)
+        
+        if self.has_animations():
+            self.start()
+    
+    def adapt_interval(self, late_ms, frame_ms):
+        """Back off while ticks arrive late or take long, recover once they are on time again"""
+        if late_ms > self.interval or frame_ms > self.interval / 2:
+            self.on_time_ticks = 0
+            if self.interval < self.max_interval:
+                self.interval = min(self.max_interval, self.interval * 2)
+                self.stats['throttled'] += 1
+        else:
+            self.on_time_ticks += 1
+            if self.on_time_ticks >= 8 and self.interval > self.base_interval:
+                self.interval = max(self.base_interval, self.interval // 2)
+                self.on_time_ticks = 0
+    
+    def step(self, now):
+        """Paint the current frame of every animation"""
+        colors = self.design.role_colors
+        
+        # Blinkers share one phase and are only repainted when it (or the theme) changes
+        phase = int(now * 1000 / self.blink_period) % 2
+        if phase != self.blink_phase or colors is not self.painted_colors:
+            self.blink_phase = phase
+            self.painted_colors = colors
+            for widget, (option, on_role, off_role) in list(self.blinkers.items()):
+                try:
+                    widget.configure(**{option: colors[on_role if phase == 0 else off_role]})
+                except tk.TclError:
+                    self.blinkers.pop(widget, None)  # Destroyed but still referenced
+        
+        flash_phase = int(now * 1000 / self.flash_period) % 2
+        active = []
+        for flash in self.flashes:
+            widget = flash['widget']()
+            if widget is None:
+                continue
+            try:
+                if now >= flash['until']:
+                    widget.configure(**{flash['option']: colors[flash['rest_role']]})
+                    continue
+                role = flash['role'] if flash_phase == 0 else flash['rest_role']
+                widget.configure(**{flash['option']: colors[role]})
+            except tk.TclError:
+                continue
+            active.append(flash)
+        self.flashes = active
+    
+    def get_stats(self):
+        """Get tick counters and the current interval"""
+        stats = dict(self.stats)
+        stats.update({
+            'interval': self.interval,
+            'paused': self.paused,
+            'blinkers': len(self.blinkers),
+            'flashes': len(self.flashes)
+        })
+        return stats
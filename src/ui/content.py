@@ -3,9 +3,13 @@ Content Area Component Module
 Contains the main content area with match display and scrolling functionality.
 """
 
+import time
 import tkinter as tk
 from tkinter import ttk
 
+from ui.events import EventDispatcher
+from ui.layout import LayoutCoordinator
+
 
 class ContentArea:
     """Modern content area component with match display and scrolling."""
@@ -16,6 +20,8 @@ class ContentArea:
         self.current_view = "live_matches"
         self.match_display = None  # Will be set by main app
         self.match_organizer = None  # Will be set by main app
+        self.view_cache = {}  # Retained, already-rendered frame per view
+        self.visible_view = None  # View whose retained frame is currently packed
         
         self.create_content_area()
         self.setup_modern_scrollable_area()
@@ -23,76 +29,76 @@ class ContentArea:
     
     def create_content_area(self):
         """Create modern content area"""
-        self.content = tk.Frame(
-            self.parent, 
-            bg=self.design.colors['bg_card'],
+        self.content = self.design.themed(
+            tk.Frame, self.parent, {'bg': 'bg_card', 'highlightbackground': 'border'},
             relief=tk.FLAT,
             bd=1,
-            highlightbackground=self.design.colors['border'],
             highlightthickness=1
         )
         self.content.pack(side=tk.RIGHT, fill=tk.BOTH, expand=True)
         
         # Content header
-        header = tk.Frame(self.content, bg=self.design.colors['bg_card'], height=80)
+        header = self.design.themed(tk.Frame, self.content, {'bg': 'bg_card'}, height=80)
         header.pack(fill=tk.X, padx=self.design.spacing['xl'], pady=self.design.spacing['lg'])
         header.pack_propagate(False)
         
         # Header content
-        header_content = tk.Frame(header, bg=self.design.colors['bg_card'])
+        header_content = self.design.themed(tk.Frame, header, {'bg': 'bg_card'})
         header_content.pack(expand=True)
         
-        self.content_title = tk.Label(
-            header_content,
+        self.content_title = self.design.themed(
+            tk.Label, header_content, {'fg': 'text_primary', 'bg': 'bg_card'},
             text="Live Matches",
             font=self.design.fonts['display_medium'],
-            fg=self.design.colors['text_primary'],
-            bg=self.design.colors['bg_card'],
             anchor='w'
         )
         self.content_title.pack(fill=tk.X)
         
         # Subtitle
-        self.content_subtitle = tk.Label(
-            header_content,
+        self.content_subtitle = self.design.themed(
+            tk.Label, header_content, {'fg': 'text_secondary', 'bg': 'bg_card'},
             text="Real-time football scores and updates",
             font=self.design.fonts['body_medium'],
-            fg=self.design.colors['text_secondary'],
-            bg=self.design.colors['bg_card'],
             anchor='w'
         )
         self.content_subtitle.pack(fill=tk.X, pady=(self.design.spacing['xs'], 0))
         
         # Matches container with modern scrolling
-        self.matches_container = tk.Frame(self.content, bg=self.design.colors['bg_card'])
+        self.matches_container = self.design.themed(tk.Frame, self.content, {'bg': 'bg_card'})
         self.matches_container.pack(fill=tk.BOTH, expand=True, padx=self.design.spacing['xl'], pady=(0, self.design.spacing['lg']))
     
     def setup_modern_scrollable_area(self):
         """Setup modern scrollable area with custom styling"""
         # Canvas for scrolling
-        self.canvas = tk.Canvas(
-            self.matches_container,
-            bg=self.design.colors['bg_card'],
+        self.canvas = self.design.themed(
+            tk.Canvas, self.matches_container, {'bg': 'bg_card'},
             bd=0,
             highlightthickness=0
         )
         
         # Modern scrollbar
-        scrollbar = ttk.Scrollbar(
+        self.scrollbar = scrollbar = ttk.Scrollbar(
             self.matches_container,
             orient=tk.VERTICAL,
             command=self.canvas.yview
         )
         
         # Scrollable frame
-        self.scrollable_frame = tk.Frame(self.canvas, bg=self.design.colors['bg_card'])
-        self.scrollable_frame.bind(
-            "<Configure>",
-            lambda e: self.canvas.configure(scrollregion=self.canvas.bbox("all"))
-        )
+        self.scrollable_frame = self.design.themed(tk.Frame, self.canvas, {'bg': 'bg_card'})
+        
+        # Frame for non-retained content (empty, loading and settings states)
+        self.transient_frame = self.design.themed(tk.Frame, self.scrollable_frame, {'bg': 'bg_card'})
+        self.transient_frame.pack(fill=tk.BOTH, expand=True)
+        
+        window_id = self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
+        self.canvas.configure(yscrollcommand=self.on_canvas_scrolled)
         
-        self.canvas.create_window((0, 0), window=self.scrollable_frame, anchor="nw")
-        self.canvas.configure(yscrollcommand=scrollbar.set)
+        # Coalesce scrollregion updates and debounce resize relayout
+        self.layout = LayoutCoordinator(self.canvas, self.scrollable_frame, window_id)
+        
+        # One dispatcher handles hover and clicks for everything in the scroll area
+        self.events = EventDispatcher(self.canvas)
+        self.events.add_handler('button', enter=self.on_button_enter, leave=self.on_button_leave)
         
         # Pack elements
         self.canvas.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
@@ -107,49 +113,41 @@ class ContentArea:
     
     def show_modern_empty_state(self, message="No matches available", subtitle="Click 'Fetch Matches' to get the latest scores"):
         """Show modern empty state"""
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        self.show_transient_content()
         
-        empty_container = tk.Frame(self.scrollable_frame, bg=self.design.colors['bg_card'])
+        empty_container = self.design.themed(tk.Frame, self.transient_frame, {'bg': 'bg_card'})
         empty_container.pack(expand=True, fill=tk.BOTH)
         
         # Center the empty state
-        empty_frame = tk.Frame(empty_container, bg=self.design.colors['bg_card'])
+        empty_frame = self.design.themed(tk.Frame, empty_container, {'bg': 'bg_card'})
         empty_frame.pack(expand=True)
         
         # Large icon
-        tk.Label(
-            empty_frame,
+        self.design.themed(
+            tk.Label, empty_frame, {'fg': 'text_muted', 'bg': 'bg_card'},
             text="⚽",
-            font=('Inter', 64),
-            fg=self.design.colors['text_muted'],
-            bg=self.design.colors['bg_card']
+            font=('Inter', 64)
         ).pack(pady=(0, self.design.spacing['lg']))
         
         # Main message
-        tk.Label(
-            empty_frame,
+        self.design.themed(
+            tk.Label, empty_frame, {'fg': 'text_secondary', 'bg': 'bg_card'},
             text=message,
-            font=self.design.fonts['headline'],
-            fg=self.design.colors['text_secondary'],
-            bg=self.design.colors['bg_card']
+            font=self.design.fonts['headline']
         ).pack(pady=(0, self.design.spacing['sm']))
         
         # Subtitle
-        tk.Label(
-            empty_frame,
+        self.design.themed(
+            tk.Label, empty_frame, {'fg': 'text_muted', 'bg': 'bg_card'},
             text=subtitle,
-            font=self.design.fonts['body_medium'],
-            fg=self.design.colors['text_muted'],
-            bg=self.design.colors['bg_card']
+            font=self.design.fonts['body_medium']
         ).pack()
     
     def show_modern_loading_state(self):
         """Show modern loading state with skeleton screens"""
-        for widget in self.scrollable_frame.winfo_children():
-            widget.destroy()
+        self.show_transient_content()
         
-        loading_frame = tk.Frame(self.scrollable_frame, bg=self.design.colors['bg_card'])
+        loading_frame = self.design.themed(tk.Frame, self.transient_frame, {'bg': 'bg_card'})
         loading_frame.pack(fill=tk.BOTH, expand=True, padx=self.design.spacing['lg'], pady=self.design.spacing['lg'])
         
         # Create skeleton cards
@@ -158,40 +156,42 @@ class ContentArea:
     
     def create_skeleton_card(self, parent):
         """Create skeleton loading card"""
-        skeleton_card = tk.Frame(
-            parent,
-            bg=self.design.colors['bg_primary'],
+        skeleton_card = self.design.themed(
+            tk.Frame, parent, {'bg': 'bg_primary', 'highlightbackground': 'border'},
             relief=tk.FLAT,
             bd=1,
-            highlightbackground=self.design.colors['border'],
             highlightthickness=1
         )
         skeleton_card.pack(fill=tk.X, pady=self.design.spacing['sm'])
         
         # Skeleton content
-        content = tk.Frame(skeleton_card, bg=self.design.colors['bg_primary'])
+        content = self.design.themed(tk.Frame, skeleton_card, {'bg': 'bg_primary'})
         content.pack(fill=tk.X, padx=self.design.spacing['lg'], pady=self.design.spacing['lg'])
         
         # Tournament name skeleton
-        tk.Frame(
-            content,
-            bg=self.design.colors['border'],
+        self.design.themed(
+            tk.Frame, content, {'bg': 'border'},
             height=20,
             width=200
         ).pack(anchor='w', pady=(0, self.design.spacing['md']))
         
         # Match skeleton
-        match_frame = tk.Frame(content, bg=self.design.colors['bg_primary'])
+        match_frame = self.design.themed(tk.Frame, content, {'bg': 'bg_primary'})
         match_frame.pack(fill=tk.X)
         
         for _ in range(2):
-            tk.Frame(
-                match_frame,
-                bg=self.design.colors['border'],
+            self.design.themed(
+                tk.Frame, match_frame, {'bg': 'border'},
                 height=15,
                 width=150
             ).pack(anchor='w', pady=self.design.spacing['xs'])
     
+    def on_canvas_scrolled(self, first, last):
+        """Update the scrollbar and let the renderer prefetch content near the viewport"""
+        self.scrollbar.set(first, last)
+        if self.match_display and hasattr(self.match_display, 'on_viewport_scrolled'):
+            self.match_display.on_viewport_scrolled(first, last)
+    
     def smooth_scroll(self, event):
         """Smooth scrolling for canvas"""
         self.canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
@@ -202,23 +202,98 @@ class ContentArea:
         self.content_subtitle.config(text=subtitle)
     
     def clear_content(self):
-        """Clear all content from the scrollable area"""
+        """Clear transient content and hide retained views in the scrollable area"""
+        self.show_transient_content()
+        
         # Stop any ongoing rendering
         if self.match_display and hasattr(self.match_display, 'stop_rendering'):
             self.match_display.stop_rendering()
+    
+    def show_transient_content(self):
+        """Hide the retained view frames and empty the transient frame"""
+        self.hide_retained_view()
         
-        for widget in self.scrollable_frame.winfo_children():
+        for widget in self.transient_frame.winfo_children():
+            self.events.discard_under(widget)
             widget.destroy()
+        
+        if not self.transient_frame.winfo_manager():
+            self.transient_frame.pack(fill=tk.BOTH, expand=True)
+    
+    def hide_retained_view(self):
+        """Hide the visible retained view, remembering its scroll position"""
+        view = self.visible_view
+        self.visible_view = None
+        entry = self.view_cache.get(view)
+        if not entry:
+            return
+        
+        # A view that is still being rendered is incomplete and can't be reused
+        if self.match_display and getattr(self.match_display, 'is_rendering', False):
+            self.match_display.stop_rendering()
+            self.invalidate_view(view)
+            return
+        
+        self.events.set_hovered(None)
+        entry['yview'] = self.canvas.yview()[0]
+        entry['frame'].pack_forget()
+    
+    def show_retained_view(self, view):
+        """Swap the retained frame of a view back in and restore its scroll position"""
+        entry = self.view_cache[view]
+        if self.visible_view == view:
+            return
+        
+        self.hide_retained_view()
+        self.transient_frame.pack_forget()
+        entry['frame'].pack(fill=tk.BOTH, expand=True)
+        self.visible_view = view
+        
+        # Recompute the scroll region before restoring the old position
+        self.canvas.update_idletasks()
+        self.layout.update_scrollregion()
+        self.canvas.yview_moveto(entry['yview'])
+    
+    def invalidate_view(self, view):
+        """Drop the retained frame of a view so the next visit re-renders it"""
+        entry = self.view_cache.pop(view, None)
+        if entry:
+            if self.visible_view == view:
+                self.visible_view = None
+            self.events.discard_under(entry['frame'])
+            entry['frame'].destroy()
+    
+    def get_slice_signature(self, data):
+        """Build a cheap signature of the displayed slice of data"""
+        signature = []
+        for event in data.get('events', []):
+            status = event.get('status', {})
+            signature.append((
+                event.get('id'),
+                status.get('type'),
+                status.get('description'),
+                status.get('winnerCode'),
+                event.get('homeScore', {}).get('current'),
+                event.get('awayScore', {}).get('current'),
+                event.get('time', {}).get('minute')
+            ))
+        return (tuple(signature), data.get('total_available', 0), data.get('showing', 0))
     
     def set_match_display(self, match_display):
         """Set the match display component"""
         self.match_display = match_display
+        if hasattr(match_display, 'set_viewport'):
+            match_display.set_viewport(self.canvas)
+        if hasattr(match_display, 'on_content_resized'):
+            self.layout.add_resize_callback(match_display.on_content_resized)
+        if hasattr(match_display, 'set_event_dispatcher'):
+            match_display.set_event_dispatcher(self.events)
     
     def set_match_organizer(self, match_organizer):
         """Set the match organizer component"""
         self.match_organizer = match_organizer
     
-    def show_live_matches(self, data=None):
+    def show_live_matches(self, data=None, version=None):
         """Show live matches view"""
         self.current_view = "live_matches"
         self.update_content_title("Live Matches", "Real-time football scores and updates")
@@ -226,13 +301,13 @@ class ContentArea:
         if data:
             filtered_data = self.filter_live_matches(data)
             if filtered_data:
-                self.display_matches(filtered_data)
+                self.display_matches(filtered_data, version)
             else:
                 self.show_modern_empty_state("No live matches", "No matches are currently in progress")
         else:
             self.show_modern_empty_state("No live matches", "Click 'Fetch Matches' to get the latest scores")
     
-    def show_fixtures(self, data=None):
+    def show_fixtures(self, data=None, version=None):
         """Show upcoming fixtures view"""
         self.current_view = "fixtures"
         self.update_content_title("Upcoming Fixtures", "Scheduled matches and kick-off times")
@@ -240,13 +315,13 @@ class ContentArea:
         if data:
             filtered_data = self.filter_upcoming_matches(data)
             if filtered_data:
-                self.display_matches(filtered_data)
+                self.display_matches(filtered_data, version)
             else:
                 self.show_modern_empty_state("No upcoming matches", "No fixtures scheduled at the moment")
         else:
             self.show_modern_empty_state("No upcoming matches", "Click 'Fetch Matches' to get the latest fixtures")
     
-    def show_finished(self, data=None):
+    def show_finished(self, data=None, version=None):
         """Show finished matches view"""
         self.current_view = "finished"
         self.update_content_title("Finished Matches", "Completed matches and final scores")
@@ -254,7 +329,7 @@ class ContentArea:
         if data:
             filtered_data = self.filter_finished_matches(data)
             if filtered_data:
-                self.display_matches(filtered_data)
+                self.display_matches(filtered_data, version)
             else:
                 self.show_modern_empty_state("No finished matches", "No completed matches available at the moment")
         else:
@@ -308,13 +383,27 @@ class ContentArea:
             return {'events': finished_events}
         return None
     
-    def display_matches(self, data):
+    def display_matches(self, data, version=None):
         """Display matches using the match display component with lazy loading"""
         if not self.match_display:
             self.show_modern_empty_state("Error", "Match display component not initialized")
             return
         
+        view = self.current_view
+        start_time = time.perf_counter()
+        signature = self.get_slice_signature(data)
+        
+        # Reuse the retained frame when this view's slice of data hasn't changed
+        entry = self.view_cache.get(view)
+        if entry and entry['signature'] == signature:
+            entry['version'] = version
+            self.show_retained_view(view)
+            elapsed = (time.perf_counter() - start_time) * 1000
+            print(f"Restored {view} view (snapshot {version}) from cache in {elapsed:.1f}ms")
+            return
+        
         # Clear previous content
+        self.invalidate_view(view)
         self.clear_content()
         
         # Organize matches by tournament
@@ -325,32 +414,47 @@ class ContentArea:
         matches_by_tournament = self.match_organizer.organize_matches_by_tournament(data)
         
         if matches_by_tournament:
+            view_frame = self.design.themed(tk.Frame, self.scrollable_frame, {'bg': 'bg_card'})
+            self.transient_frame.pack_forget()
+            view_frame.pack(fill=tk.BOTH, expand=True)
+            self.view_cache[view] = {
+                'frame': view_frame,
+                'signature': signature,
+                'version': version,
+                'yview': 0.0
+            }
+            self.visible_view = view
+            self.canvas.yview_moveto(0)
+            
             # Start lazy loading directly without showing loading state
             total_matches = self.match_display.display_tournaments(
-                self.scrollable_frame, 
-                matches_by_tournament
+                view_frame, 
+                matches_by_tournament,
+                version
             )
-            print(f"Starting lazy loading of {total_matches} matches in {self.current_view} view")
+            print(f"Starting lazy loading of {total_matches} matches in {view} view "
+                  f"(first paint in {self.match_display.first_paint_ms:.1f}ms)")
+            print(self.layout.describe_stats())
+            event_stats = self.events.get_stats()
+            print(f"Events: {event_stats['bindings']} bindings for {event_stats['targets']} targets")
             
             # Add load more button if there are more matches available
             if data.get('total_available', 0) > data.get('showing', 0):
-                self.add_load_more_button(data)
+                self.add_load_more_button(view_frame, data)
         else:
             self.show_modern_empty_state("No matches found", "Try refreshing the data")
     
     
-    def add_load_more_button(self, data):
+    def add_load_more_button(self, parent, data):
         """Add a load more button for additional matches"""
-        load_more_frame = tk.Frame(self.scrollable_frame, bg=self.design.colors['bg_card'])
+        load_more_frame = self.design.themed(tk.Frame, parent, {'bg': 'bg_card'})
         load_more_frame.pack(fill=tk.X, padx=self.design.spacing['xl'], pady=self.design.spacing['lg'])
         
         # Load more button
-        load_more_btn = tk.Button(
-            load_more_frame,
+        load_more_btn = self.design.themed(
+            tk.Button, load_more_frame, {'bg': 'primary', 'fg': 'text_white'},
             text=f"Load More Matches ({data.get('total_available', 0) - data.get('showing', 0)} remaining)",
             font=self.design.fonts['body_medium'],
-            bg=self.design.colors['primary'],
-            fg=self.design.colors['text_white'],
             bd=0,
             relief=tk.FLAT,
             padx=self.design.spacing['lg'],
@@ -361,14 +465,15 @@ class ContentArea:
         load_more_btn.pack()
         
         # Add hover effect
-        def on_enter(e):
-            load_more_btn.config(bg=self.design.colors.get('primary_hover', self.design.colors['primary']))
-        
-        def on_leave(e):
-            load_more_btn.config(bg=self.design.colors['primary'])
-        
-        load_more_btn.bind('<Enter>', on_enter)
-        load_more_btn.bind('<Leave>', on_leave)
+        self.events.register(load_more_btn, 'button')
+    
+    def on_button_enter(self, button, payload=None):
+        """Hover effect for buttons in the scroll area"""
+        button.config(bg=self.design.colors.get('primary_hover', self.design.colors['primary']))
+    
+    def on_button_leave(self, button, payload=None):
+        """Remove the hover effect from buttons in the scroll area"""
+        button.config(bg=self.design.colors['primary'])
     
     def load_more_matches(self, data):
         """Load more matches when button is clicked"""
@@ -380,19 +485,17 @@ class ContentArea:
         """Show settings content"""
         self.clear_content()
         
-        settings_container = tk.Frame(self.scrollable_frame, bg=self.design.colors['bg_card'])
+        settings_container = self.design.themed(tk.Frame, self.transient_frame, {'bg': 'bg_card'})
         settings_container.pack(fill=tk.BOTH, expand=True, padx=self.design.spacing['xl'], pady=self.design.spacing['xl'])
         
         # Settings title
-        title_frame = tk.Frame(settings_container, bg=self.design.colors['bg_card'])
+        title_frame = self.design.themed(tk.Frame, settings_container, {'bg': 'bg_card'})
         title_frame.pack(fill=tk.X, pady=(0, self.design.spacing['lg']))
         
-        tk.Label(
-            title_frame,
+        self.design.themed(
+            tk.Label, title_frame, {'fg': 'text_primary', 'bg': 'bg_card'},
             text="⚙️ Application Settings",
             font=self.design.fonts['headline'],
-            fg=self.design.colors['text_primary'],
-            bg=self.design.colors['bg_card'],
             anchor='w'
         ).pack(fill=tk.X)
         
@@ -407,7 +510,7 @@ class ContentArea:
         
         self.create_settings_section(settings_container, "Data", [
             ("Cache duration", "How long to cache match data"),
-            ("Update frequency", "How often to check for updates"),
+            ("Update frequency", "Adapts to live matches, fixtures and quiet hours"),
             ("Save favorites", "Remember favorite matches")
         ])
         
@@ -419,76 +522,66 @@ class ContentArea:
     
     def create_settings_section(self, parent, section_title, options):
         """Create a settings section"""
-        section_frame = tk.Frame(parent, bg=self.design.colors['bg_card'])
+        section_frame = self.design.themed(tk.Frame, parent, {'bg': 'bg_card'})
         section_frame.pack(fill=tk.X, pady=(0, self.design.spacing['lg']))
         
         # Section title
-        tk.Label(
-            section_frame,
+        self.design.themed(
+            tk.Label, section_frame, {'fg': 'primary', 'bg': 'bg_card'},
             text=section_title,
             font=self.design.fonts['body_large'],
-            fg=self.design.colors['primary'],
-            bg=self.design.colors['bg_card'],
             anchor='w'
         ).pack(fill=tk.X, pady=(0, self.design.spacing['md']))
         
         # Options
         for option, description in options:
-            option_frame = tk.Frame(section_frame, bg=self.design.colors['bg_card'])
+            option_frame = self.design.themed(tk.Frame, section_frame, {'bg': 'bg_card'})
             option_frame.pack(fill=tk.X, pady=self.design.spacing['xs'])
             
             # Option name
-            tk.Label(
-                option_frame,
+            self.design.themed(
+                tk.Label, option_frame, {'fg': 'text_primary', 'bg': 'bg_card'},
                 text=option,
                 font=self.design.fonts['body_medium'],
-                fg=self.design.colors['text_primary'],
-                bg=self.design.colors['bg_card'],
                 anchor='w'
             ).pack(side=tk.LEFT)
             
             # Option description
-            tk.Label(
-                option_frame,
+            self.design.themed(
+                tk.Label, option_frame, {'fg': 'text_secondary', 'bg': 'bg_card'},
                 text=description,
                 font=self.design.fonts['caption'],
-                fg=self.design.colors['text_secondary'],
-                bg=self.design.colors['bg_card'],
                 anchor='w'
             ).pack(side=tk.LEFT, padx=(self.design.spacing['md'], 0))
     
     def create_theme_toggle_section(self, parent):
         """Create interactive theme toggle section"""
-        theme_frame = tk.Frame(parent, bg=self.design.colors['bg_card'])
+        theme_frame = self.design.themed(tk.Frame, parent, {'bg': 'bg_card'})
         theme_frame.pack(fill=tk.X, pady=(0, self.design.spacing['lg']))
         
         # Section title
-        tk.Label(
-            theme_frame,
+        self.design.themed(
+            tk.Label, theme_frame, {'fg': 'primary', 'bg': 'bg_card'},
             text="Theme",
             font=self.design.fonts['body_large'],
-            fg=self.design.colors['primary'],
-            bg=self.design.colors['bg_card'],
             anchor='w'
         ).pack(fill=tk.X, pady=(0, self.design.spacing['md']))
         
         # Theme toggle container
-        toggle_container = tk.Frame(theme_frame, bg=self.design.colors['bg_card'])
+        toggle_container = self.design.themed(tk.Frame, theme_frame, {'bg': 'bg_card'})
         toggle_container.pack(fill=tk.X)
         
         # Current theme label
-        self.theme_status_label = tk.Label(
-            toggle_container,
+        self.theme_status_label = self.design.themed(
+            tk.Label, toggle_container, {'fg': 'text_primary', 'bg': 'bg_card'},
             text=f"Current: {self.design.get_theme().title()} Mode",
             font=self.design.fonts['body_medium'],
-            fg=self.design.colors['text_primary'],
-            bg=self.design.colors['bg_card'],
             anchor='w'
         )
         self.theme_status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         # Theme toggle buttons
-        button_frame = tk.Frame(toggle_container, bg=self.design.colors['bg_card'])
+        button_frame = self.design.themed(tk.Frame, toggle_container, {'bg': 'bg_card'})
         button_frame.pack(side=tk.RIGHT)
         
         # Light mode button
@@ -557,60 +650,14 @@ class ContentArea:
             )
     
     def update_theme(self, design_system=None):
-        """Update component colors when theme changes"""
+        """Update theme state; widget colors, retained views included, follow their theme bindings"""
         if design_system:
             self.design = design_system
         
         try:
-            # Update content frame
-            if hasattr(self, 'content'):
-                self.content.configure(bg=self.design.colors['bg_card'])
-            
-            # Update content title and subtitle
-            if hasattr(self, 'content_title'):
-                self.content_title.config(
-                    fg=self.design.colors['text_primary'], 
-                    bg=self.design.colors['bg_card']
-                )
-            
-            if hasattr(self, 'content_subtitle'):
-                self.content_subtitle.config(
-                    fg=self.design.colors['text_secondary'], 
-                    bg=self.design.colors['bg_card']
-                )
-            
-            # Update canvas and scrollable frame
-            if hasattr(self, 'canvas'):
-                self.canvas.configure(bg=self.design.colors['bg_card'])
-            
-            if hasattr(self, 'scrollable_frame'):
-                self.scrollable_frame.configure(bg=self.design.colors['bg_card'])
-            
-            # Update theme buttons if they exist
-            if hasattr(self, 'light_btn') and hasattr(self, 'dark_btn'):
+            # Theme buttons show which theme is selected, so they are restyled by state
+            if hasattr(self, 'light_btn') and self.light_btn.winfo_exists():
                 self.update_theme_buttons()
-            
-            # Update header frames
-            if hasattr(self, 'content'):
-                self.update_header_frames()
                 
         except Exception as e:
             print(f"Error updating content area theme: {e}")
-    
-    def update_header_frames(self):
-        """Update header frame themes"""
-        # Update content header frame
-        for widget in self.content.winfo_children():
-            if isinstance(widget, tk.Frame):
-                widget.configure(bg=self.design.colors['bg_card'])
-                # Update header content frame
-                for child in widget.winfo_children():
-                    if isinstance(child, tk.Frame):
-                        child.configure(bg=self.design.colors['bg_card'])
-                        # Update labels in header
-                        for grandchild in child.winfo_children():
-                            if isinstance(grandchild, tk.Label):
-                                grandchild.config(
-                                    fg=self.design.colors['text_primary'],
-                                    bg=self.design.colors['bg_card']
-                                )
\ No newline at end of file
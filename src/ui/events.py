@@ -0,0 +1,98 @@
+"""
+Event Dispatcher Module
+Delegates pointer events in a container (the scroll area, the sidebar) to registered widgets.
+"""
+
+
+class EventDispatcher:
+    """Single dispatcher that resolves the registered widget under the pointer.
+    
+    Widgets register with a kind (e.g. 'match_card') instead of binding their own
+    callbacks, so the number of Tcl bindings stays constant however many cards exist.
+    """
+    
+    def __init__(self, container):
+        self.container = container
+        self.container_path = str(container)
+        self.targets = {}  # widget path -> (kind, widget, payload)
+        self.handlers = {}  # kind -> {'enter': callable, 'leave': callable, 'click': callable}
+        self.hovered = None  # Path of the registered widget under the pointer
+        self.binding_count = 0
+        
+        # Bind once on the toplevel tag, which every widget in the window carries
+        toplevel = container.winfo_toplevel()
+        self.toplevel_path = str(toplevel)
+        for sequence, callback in (('<Motion>', self.on_motion),
+                                   ('<Leave>', self.on_leave),
+                                   ('<Button-1>', self.on_click)):
+            toplevel.bind(sequence, callback, add='+')
+            self.binding_count += 1
+    
+    def add_handler(self, kind, enter=None, leave=None, click=None):
+        """Set the handlers for a kind of widget; each receives (widget, payload)"""
+        self.handlers[kind] = {'enter': enter, 'leave': leave, 'click': click}
+    
+    def register(self, widget, kind, payload=None):
+        """Register a widget (and its descendants) as a target of the given kind"""
+        self.targets[str(widget)] = (kind, widget, payload)
+    
+    def discard_under(self, widget):
+        """Forget every target inside a widget that is about to be destroyed"""
+        path = str(widget)
+        prefix = path + '.'
+        for target_path in [p for p in self.targets if p == path or p.startswith(prefix)]:
+            del self.targets[target_path]
+            if target_path == self.hovered:
+                self.hovered = None
+    
+    def resolve(self, widget):
+        """Get the path of the registered target containing a widget"""
+        path = str(widget)
+        prefix = self.container_path + '.'
+        while path.startswith(prefix):
+            if path in self.targets:
+                return path
+            path = path.rsplit('.', 1)[0]
+        return None
+    
+    def dispatch(self, path, action):
+        """Call the handler for an action on a registered target"""
+        target = self.targets.get(path)
+        if not target:
+            return
+        kind, widget, payload = target
+        handler = self.handlers.get(kind, {}).get(action)
+        if handler:
+            try:
+                handler(widget, payload)
+            except Exception as e:
+                print(f"Error in {kind} {action} handler: {e}")
+    
+    def set_hovered(self, path):
+        """Move the hover state to a new target"""
+        if path == self.hovered:
+            return
+        if self.hovered:
+            self.dispatch(self.hovered, 'leave')
+        self.hovered = path
+        if path:
+            self.dispatch(path, 'enter')
+    
+    def on_motion(self, event):
+        """Track the target under the pointer"""
+        self.set_hovered(self.resolve(event.widget))
+    
+    def on_leave(self, event):
+        """Clear hover when the pointer leaves the window"""
+        if str(event.widget) == self.toplevel_path:
+            self.set_hovered(None)
+    
+    def on_click(self, event):
+        """Dispatch clicks to the target under the pointer"""
+        path = self.resolve(event.widget)
+        if path:
+            self.dispatch(path, 'click')
+    
+    def get_stats(self):
+        """Get the number of registered targets and Tcl bindings"""
+        return {'targets': len(self.targets), 'bindings': self.binding_count}
@@ -0,0 +1,86 @@
+"""
+Layout Coordinator Module
+Coalesces geometry changes in the scrollable content area.
+"""
+
+
+class LayoutCoordinator:
+    """Batches scrollregion updates and debounces resize relayout for a scroll canvas."""
+    
+    def __init__(self, canvas, scrollable_frame, window_id, frame_interval=16, resize_delay=150):
+        self.canvas = canvas
+        self.scrollable_frame = scrollable_frame
+        self.window_id = window_id
+        self.frame_interval = frame_interval  # Milliseconds per frame (~60 fps)
+        self.resize_delay = resize_delay  # Quiet period before relayout after a resize
+        self.scroll_job = None
+        self.resize_job = None
+        self.pending_width = None
+        self.resize_callbacks = []
+        self.stats = {
+            'scroll_requests': 0,
+            'scroll_updates': 0,
+            'resize_requests': 0,
+            'relayouts': 0
+        }
+        
+        self.scrollable_frame.bind("<Configure>", self.request_scrollregion_update)
+        self.canvas.bind("<Configure>", self.request_relayout, add='+')
+    
+    def request_scrollregion_update(self, event=None):
+        """Request a scrollregion update, coalesced to at most one per frame"""
+        self.stats['scroll_requests'] += 1
+        if self.scroll_job is None:
+            self.scroll_job = self.canvas.after(self.frame_interval, self.update_scrollregion)
+    
+    def update_scrollregion(self):
+        """Recompute the scrollregion now, cancelling any pending update"""
+        if self.scroll_job is not None:
+            self.canvas.after_cancel(self.scroll_job)
+            self.scroll_job = None
+        
+        self.stats['scroll_updates'] += 1
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+    
+    def request_relayout(self, event):
+        """Debounce relayout while the canvas is being resized"""
+        self.stats['resize_requests'] += 1
+        self.pending_width = event.width
+        
+        if self.resize_job is not None:
+            self.canvas.after_cancel(self.resize_job)
+        self.resize_job = self.canvas.after(self.resize_delay, self.relayout)
+    
+    def relayout(self):
+        """Stretch the content to the canvas width and notify resize listeners"""
+        self.resize_job = None
+        if self.pending_width is None:
+            return
+        
+        self.stats['relayouts'] += 1
+        self.canvas.itemconfigure(self.window_id, width=self.pending_width)
+        for callback in self.resize_callbacks:
+            try:
+                callback(self.pending_width)
+            except Exception as e:
+                print(f"Error in relayout callback: {e}")
+    
+    def add_resize_callback(self, callback):
+        """Register a callback receiving the new content width after a resize"""
+        if callback not in self.resize_callbacks:
+            self.resize_callbacks.append(callback)
+    
+    def get_stats(self):
+        """Get layout counters including how many recomputations were avoided"""
+        stats = dict(self.stats)
+        stats['scroll_updates_avoided'] = max(0, stats['scroll_requests'] - stats['scroll_updates'])
+        stats['relayouts_avoided'] = max(0, stats['resize_requests'] - stats['relayouts'])
+        return stats
+    
+    def describe_stats(self):
+        """Get a one-line summary of the layout counters"""
+        stats = self.get_stats()
+        return (f"Layout: {stats['scroll_updates']} scrollregion updates for {stats['scroll_requests']} "
+                f"geometry changes ({stats['scroll_updates_avoided']} avoided), "
+                f"{stats['relayouts']} relayouts for {stats['resize_requests']} resizes "
+                f"({stats['relayouts_avoided']} avoided)")
@@ -4,9 +4,11 @@ Contains logic for displaying matches, tournaments, and match cards.
 """
 
 import tkinter as tk
-from datetime import datetime
-import threading
+from collections import deque
 import time
+import weakref
+
+from data.view_model import MatchCardBuilder
 
 
 class MatchDisplay:
@@ -14,73 +16,247 @@ class MatchDisplay:
     
     def __init__(self, design_system):
         self.design = design_system
-        self.batch_size = 10  # Number of matches to render per batch
+        self.batch_size = 10  # Number of matches to render per idle batch
         self.render_delay = 50  # Delay between batches in milliseconds
         self.is_rendering = False
+        self.render_generation = 0  # Identifies the current render so stale batches are dropped
+        self.pending_tournaments = deque()  # (index, tournament) pairs not rendered yet
         self.current_batch = 0
         self.all_tournaments = []
         self.scrollable_frame = None
         self.root = None  # Will be set when needed
+        self.canvas = None  # Scroll canvas used to measure the viewport
         self.visible_matches = []  # Track visible match widgets
         self.match_height = 120  # Approximate height of each match card
+        self.tournament_header_height = 70  # Approximate height of a tournament header
+        self.section_header_height = 46  # Approximate height of a status section header
         self.viewport_height = 0  # Height of visible area
+        self.prefetch_threshold = 0.85  # Render ahead once the view is scrolled past this fraction
+        self.prefetch_scheduled = False
+        self.render_started_at = 0
+        self.first_paint_ms = None  # Time to first meaningful paint of the last render
+        self.collapse_state = None  # Persistent store of collapsed tournament ids
+        self.min_card_width = 360  # Narrowest a match card may get before dropping a column
+        self.max_columns = 6  # Upper bound for very wide displays
+        self.column_count = 2  # Current number of card columns
+        self.card_grids = []  # (grid frame, cards) pairs laid out with the current column count
+        self.view_models = MatchCardBuilder()  # Replaced by the data processor's shared builder
+        self.snapshot_version = None  # Snapshot version of the data being rendered
+        self.event_dispatcher = None  # Shared pointer event dispatcher of the scroll area
+        self.card_click_callback = None  # Called with the event id of a clicked card
+        self.animation_clock = None  # Shared clock blinking live dots and flashing score changes
+        self.last_scores = {}  # Event id -> (home score, away score) last drawn on a card
+        self.live_minute_labels = weakref.WeakKeyDictionary()  # Status label of a live card -> event
+        self.minute_job = None
+    
+    def set_viewport(self, canvas):
+        """Set the scroll canvas whose visible area gets rendered first"""
+        self.canvas = canvas
+    
+    def set_view_model_builder(self, builder):
+        """Use a shared builder whose descriptors are precomputed off the Tk thread"""
+        self.view_models = builder
+    
+    def set_event_dispatcher(self, dispatcher):
+        """Route card and tournament header events through a shared dispatcher"""
+        self.event_dispatcher = dispatcher
+        dispatcher.add_handler('match_card', enter=self.on_card_enter, leave=self.on_card_leave,
+                               click=self.on_card_click)
+        dispatcher.add_handler('tournament_header', click=lambda widget, section: self.toggle_tournament(section))
+    
+    def set_animation_clock(self, animation_clock):
+        """Animate live dots and score changes on the shared animation clock"""
+        self.animation_clock = animation_clock
     
-    def display_tournaments(self, scrollable_frame, matches_by_tournament):
-        """Display all tournaments with lazy loading for better performance"""
+    def set_card_click_callback(self, callback):
+        """Set the callback for clicks on a match card (e.g. a detail view)"""
+        self.card_click_callback = callback
+    
+    def set_collapse_state(self, collapse_state):
+        """Set the store that remembers collapsed tournament sections"""
+        self.collapse_state = collapse_state
+    
+    def is_tournament_collapsed(self, tournament_info):
+        """Check if a tournament section should be rendered collapsed"""
+        if not self.collapse_state:
+            return False
+        return self.collapse_state.is_collapsed(self.get_tournament_key(tournament_info))
+    
+    def get_tournament_key(self, tournament_info):
+        """Get the id a tournament's collapse state is stored under"""
+        tournament_id = tournament_info.get('tournament_id')
+        return tournament_id if tournament_id is not None else tournament_info['tournament']
+    
+    def get_viewport_height(self):
+        """Get the height of the visible scroll area"""
+        if self.canvas:
+            height = self.canvas.winfo_height()
+            if height > 1:
+                return height
+            return max(self.canvas.winfo_reqheight(), self.root.winfo_height())
+        return self.root.winfo_height()
+    
+    def estimate_tournament_height(self, tournament_info):
+        """Estimate the rendered height of a tournament without building it"""
+        height = self.tournament_header_height + self.design.spacing['xl']
+        if self.is_tournament_collapsed(tournament_info):
+            return height
+        
+        sections = {}
+        for match in tournament_info['matches']:
+            status = match['status']['type']
+            sections[status] = sections.get(status, 0) + 1
+        
+        for count in sections.values():
+            rows = (count + self.column_count - 1) // self.column_count
+            height += self.section_header_height + rows * self.match_height
+        return height
+    
+    def display_tournaments(self, scrollable_frame, matches_by_tournament, version=None):
+        """Display tournaments, rendering the visible ones first and the rest when idle"""
+        self.stop_rendering()
         self.scrollable_frame = scrollable_frame
+        self.snapshot_version = version
         self.all_tournaments = list(matches_by_tournament.values())
-        self.current_batch = 0
+        self.pending_tournaments = deque(enumerate(self.all_tournaments))
+        self.render_generation += 1
         self.is_rendering = True
+        self.render_started_at = time.perf_counter()
+        self.first_paint_ms = None
         
         # Get root window reference
         self.root = scrollable_frame.winfo_toplevel()
         
+        # Pick the column count for the current width and forget destroyed grids
+        if self.canvas and self.canvas.winfo_width() > 1:
+            self.column_count = self.get_column_count(self.canvas.winfo_width())
+        self.card_grids = [(grid, cards) for grid, cards in self.card_grids if grid.winfo_exists()]
+        
         # Calculate total matches
         total_matches = sum(len(tournament['matches']) for tournament in self.all_tournaments)
         
-        # Start lazy loading in a separate thread
-        threading.Thread(target=self._lazy_render_tournaments, daemon=True).start()
+        self._render_above_the_fold()
         
         return total_matches
     
-    def _lazy_render_tournaments(self):
-        """Render tournaments in batches to prevent UI freezing"""
+    def _render_above_the_fold(self):
+        """Render every tournament that fits in the viewport in one burst"""
+        viewport_height = self.get_viewport_height()
+        used_height = 0
+        rendered = 0
+        
+        while self.pending_tournaments and used_height < viewport_height:
+            index, tournament_info = self.pending_tournaments.popleft()
+            self._render_tournament_lazy(index, tournament_info)
+            used_height += self.estimate_tournament_height(tournament_info)
+            rendered += 1
+        
+        # Let Tk lay out and draw the first screen before measuring
+        self.scrollable_frame.update_idletasks()
+        self.first_paint_ms = (time.perf_counter() - self.render_started_at) * 1000
+        print(f"First meaningful paint: {rendered} tournaments in {self.first_paint_ms:.1f}ms")
+        
+        if self.pending_tournaments:
+            self._schedule_idle_batch()
+        else:
+            self._finish_rendering()
+    
+    def _schedule_idle_batch(self):
+        """Schedule the next off-screen batch for when Tk is idle"""
+        generation = self.render_generation
+        self.root.after(self.render_delay, self.root.after_idle, self._render_idle_batch, generation)
+    
+    def _render_idle_batch(self, generation):
+        """Render an off-screen batch during idle time"""
+        if generation != self.render_generation or not self.is_rendering:
+            return
+        
+        try:
+            self._render_next_batch()
+        except tk.TclError as e:
+            # The target frame was destroyed (e.g. view invalidated)
+            print(f"Error in lazy rendering: {e}")
+            self.stop_rendering()
+            return
+        
+        if self.pending_tournaments:
+            self._schedule_idle_batch()
+        else:
+            self._finish_rendering()
+    
+    def _render_next_batch(self):
+        """Render pending tournaments until about batch_size matches were added"""
+        rendered_matches = 0
+        while self.pending_tournaments and rendered_matches < self.batch_size:
+            index, tournament_info = self.pending_tournaments.popleft()
+            self._render_tournament_lazy(index, tournament_info)
+            rendered_matches += len(tournament_info['matches'])
+    
+    def _finish_rendering(self):
+        """Mark the current render as complete"""
+        if not self.is_rendering:
+            return
+        self.is_rendering = False
+        elapsed = (time.perf_counter() - self.render_started_at) * 1000
+        print(f"Rendered {len(self.all_tournaments)} tournaments in {elapsed:.1f}ms")
+    
+    def on_viewport_scrolled(self, first, last):
+        """Render ahead when scrolling approaches the end of the rendered content"""
+        if not self.is_rendering or not self.pending_tournaments:
+            return
+        
+        if float(last) >= self.prefetch_threshold and not self.prefetch_scheduled:
+            self.prefetch_scheduled = True
+            self.root.after_idle(self._render_prefetch_batch, self.render_generation)
+    
+    def _render_prefetch_batch(self, generation):
+        """Render the next batch right away because it is about to scroll into view"""
+        self.prefetch_scheduled = False
+        if generation != self.render_generation or not self.is_rendering:
+            return
+        
         try:
-            for i, tournament_info in enumerate(self.all_tournaments):
-                if not self.is_rendering:
-                    break
-                    
-                # Add separator between tournaments
-                if i > 0:
-                    self.root.after(0, lambda: self.add_tournament_separator(self.scrollable_frame))
-                    time.sleep(self.render_delay / 1000)
-                
-                # Render tournament with lazy loading
-                self._render_tournament_lazy(tournament_info)
-                
-                # Small delay to keep UI responsive
-                time.sleep(self.render_delay / 1000)
-                
-        except Exception as e:
+            self._render_next_batch()
+        except tk.TclError as e:
             print(f"Error in lazy rendering: {e}")
-        finally:
-            self.is_rendering = False
+            self.stop_rendering()
+            return
+        
+        if not self.pending_tournaments:
+            self._finish_rendering()
     
-    def _render_tournament_lazy(self, tournament_info):
-        """Render a single tournament with lazy loading for matches"""
+    def _render_tournament_lazy(self, index, tournament_info):
+        """Render a single tournament with its match sections"""
+        # Add separator between tournaments
+        if index > 0:
+            self.add_tournament_separator(self.scrollable_frame)
+        
         # Tournament container
-        tournament_container = tk.Frame(
-            self.scrollable_frame,
-            bg=self.design.colors['bg_card']
-        )
-        self.root.after(0, lambda: tournament_container.pack(fill=tk.X, padx=self.design.spacing['lg'], pady=self.design.spacing['md']))
+        tournament_container = self.design.themed(tk.Frame, self.scrollable_frame, {'bg': 'bg_card'})
+        tournament_container.pack(fill=tk.X, padx=self.design.spacing['lg'], pady=self.design.spacing['md'])
+        
+        section = {
+            'info': tournament_info,
+            'container': tournament_container,
+            'body': None,
+            'collapsed': self.is_tournament_collapsed(tournament_info)
+        }
         
         # Tournament header
-        self.root.after(0, lambda: self._create_tournament_header(tournament_container, tournament_info))
+        section['chevron'] = self._create_tournament_header(tournament_container, tournament_info, section)
+        
+        # Collapsed tournaments only build their match cards on first expand
+        if not section['collapsed']:
+            self._build_tournament_body(section)
+    
+    def _build_tournament_body(self, section):
+        """Build the match sections of a tournament"""
+        tournament_info = section['info']
         
         # Matches container
-        matches_container = tk.Frame(tournament_container, bg=self.design.colors['bg_card'])
-        self.root.after(0, lambda: matches_container.pack(fill=tk.X))
+        matches_container = self.design.themed(tk.Frame, section['container'], {'bg': 'bg_card'})
+        matches_container.pack(fill=tk.X)
+        section['body'] = matches_container
         
         # Group matches by status
         live_matches = []
@@ -96,110 +272,163 @@ class MatchDisplay:
             else:
                 upcoming_matches.append(match)
         
-        # Render match sections with lazy loading
+        # Render match sections
         if live_matches:
-            self.root.after(0, lambda: self._create_match_section_lazy("🔴 LIVE", live_matches, matches_container, 'live'))
+            self._create_match_section_lazy("🔴 LIVE", live_matches, matches_container, 'live')
         if finished_matches:
-            self.root.after(0, lambda: self._create_match_section_lazy("✅ FINISHED", finished_matches, matches_container, 'finished'))
+            self._create_match_section_lazy("✅ FINISHED", finished_matches, matches_container, 'finished')
         if upcoming_matches:
-            self.root.after(0, lambda: self._create_match_section_lazy("📅 UPCOMING", upcoming_matches, matches_container, 'upcoming'))
+            self._create_match_section_lazy("📅 UPCOMING", upcoming_matches, matches_container, 'upcoming')
+    
+    def toggle_tournament(self, section):
+        """Collapse or expand a tournament section"""
+        section['collapsed'] = not section['collapsed']
+        section['chevron'].config(text="▸" if section['collapsed'] else "▾")
+        
+        if self.collapse_state:
+            self.collapse_state.set_collapsed(self.get_tournament_key(section['info']), section['collapsed'])
+        
+        if section['collapsed']:
+            if section['body']:
+                section['body'].pack_forget()
+        elif section['body']:
+            section['body'].pack(fill=tk.X)
+        else:
+            self._build_tournament_body(section)
     
-    def _create_tournament_header(self, parent, tournament_info):
-        """Create tournament header"""
+    def _create_tournament_header(self, parent, tournament_info, section):
+        """Create a collapsible tournament header and return its chevron label"""
         # Tournament header with modern styling
-        header_frame = tk.Frame(parent, bg=self.design.colors['bg_card'])
+        header_frame = self.design.themed(tk.Frame, parent, {'bg': 'bg_card'}, cursor='hand2')
         header_frame.pack(fill=tk.X, pady=(0, self.design.spacing['md']))
         
         # Tournament name with accent
-        title_frame = tk.Frame(header_frame, bg=self.design.colors['bg_card'])
+        title_frame = self.design.themed(tk.Frame, header_frame, {'bg': 'bg_card'})
         title_frame.pack(fill=tk.X)
         
+        # Collapse chevron
+        chevron = self.design.themed(
+            tk.Label, title_frame, {'fg': 'text_secondary', 'bg': 'bg_card'},
+            text="▸" if section['collapsed'] else "▾",
+            font=self.design.fonts['body_large']
+        )
+        chevron.pack(side=tk.LEFT, padx=(0, self.design.spacing['sm']))
+        
         # Color accent bar
-        accent_bar = tk.Frame(
-            title_frame,
-            bg=self.design.colors['primary'],
+        accent_bar = self.design.themed(
+            tk.Frame, title_frame, {'bg': 'primary'},
             width=4,
             height=24
         )
         accent_bar.pack(side=tk.LEFT, padx=(0, self.design.spacing['md']))
         
-        tk.Label(
-            title_frame,
+        title_label = self.design.themed(
+            tk.Label, title_frame, {'fg': 'text_primary', 'bg': 'bg_card'},
             text=tournament_info['tournament'],
             font=self.design.fonts['headline'],
-            fg=self.design.colors['text_primary'],
-            bg=self.design.colors['bg_card'],
             anchor='w'
-        ).pack(side=tk.LEFT, fill=tk.X, expand=True)
+        )
+        title_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+        
+        # Match count stays visible while the section is collapsed
+        count_label = self.design.themed(
+            tk.Label, title_frame, {'fg': 'text_muted', 'bg': 'bg_card'},
+            text=f"{len(tournament_info['matches'])} matches",
+            font=self.design.fonts['caption']
+        )
+        count_label.pack(side=tk.RIGHT)
         
         # Round info
         if tournament_info['round'] and tournament_info['round'] != 'Regular Season':
-            tk.Label(
-                header_frame,
+            self.design.themed(
+                tk.Label, header_frame, {'fg': 'text_secondary', 'bg': 'bg_card'},
                 text=tournament_info['round'],
                 font=self.design.fonts['caption'],
-                fg=self.design.colors['text_secondary'],
-                bg=self.design.colors['bg_card'],
                 anchor='w'
             ).pack(fill=tk.X, pady=(self.design.spacing['xs'], 0))
+        
+        # Clicking anywhere on the header toggles the section
+        if self.event_dispatcher:
+            self.event_dispatcher.register(header_frame, 'tournament_header', section)
+        else:
+            for widget in (header_frame, title_frame, chevron, title_label, count_label):
+                widget.bind('<Button-1>', lambda e: self.toggle_tournament(section))
+        
+        return chevron
     
     def _create_match_section_lazy(self, title, matches, parent, section_type):
         """Create a section for matches with lazy loading"""
-        section_frame = tk.Frame(parent, bg=self.design.colors['bg_card'])
+        section_frame = self.design.themed(tk.Frame, parent, {'bg': 'bg_card'})
         section_frame.pack(fill=tk.X, pady=(0, self.design.spacing['md']))
         
         # Section header
-        section_header = tk.Frame(section_frame, bg=self.design.colors['bg_card'])
+        section_header = self.design.themed(tk.Frame, section_frame, {'bg': 'bg_card'})
         section_header.pack(fill=tk.X, pady=(0, self.design.spacing['sm']))
         
-        tk.Label(
-            section_header,
+        self.design.themed(
+            tk.Label, section_header, {'fg': self.design.get_section_role(section_type), 'bg': 'bg_card'},
             text=title,
             font=self.design.fonts['label'],
-            fg=self.design.get_section_color(section_type),
-            bg=self.design.colors['bg_card'],
             anchor='w'
         ).pack(side=tk.LEFT)
         
-        tk.Label(
-            section_header,
+        self.design.themed(
+            tk.Label, section_header, {'fg': 'text_muted', 'bg': 'bg_card'},
             text=f"({len(matches)})",
-            font=self.design.fonts['caption'],
-            fg=self.design.colors['text_muted'],
-            bg=self.design.colors['bg_card']
+            font=self.design.fonts['caption']
         ).pack(side=tk.LEFT, padx=(self.design.spacing['xs'], 0))
         
         # Matches grid
-        matches_grid = tk.Frame(section_frame, bg=self.design.colors['bg_card'])
+        matches_grid = self.design.themed(tk.Frame, section_frame, {'bg': 'bg_card'})
         matches_grid.pack(fill=tk.X)
         
-        # Render matches in batches
-        self._render_matches_batch(matches, matches_grid, section_type, 0)
-    
-    def _render_matches_batch(self, matches, parent, section_type, start_index):
-        """Render a batch of matches with lazy loading"""
-        end_index = min(start_index + self.batch_size, len(matches))
-        
-        for i in range(start_index, end_index):
-            if not self.is_rendering:
-                break
-                
-            # Create row frame for every 2 matches
-            if (i - start_index) % 2 == 0:
-                row_frame = tk.Frame(parent, bg=self.design.colors['bg_card'])
-                row_frame.pack(fill=tk.X, pady=self.design.spacing['xs'])
-            
-            # Create match card
-            self.create_modern_match_card(matches[i], row_frame, section_type)
+        # Render match cards
+        self._render_matches_batch(matches, matches_grid, section_type)
+    
+    def _render_matches_batch(self, matches, parent, section_type):
+        """Render the match cards of a section into a responsive grid"""
+        cards = [self.create_modern_match_card(match, parent, section_type) for match in matches]
+        self.card_grids.append((parent, cards))
+        self.layout_card_grid(parent, cards, self.column_count)
+    
+    def get_column_count(self, width):
+        """Get the number of card columns that fit in the given content width"""
+        usable_width = width - 2 * self.design.spacing['lg']
+        return max(1, min(self.max_columns, usable_width // self.min_card_width))
+    
+    def layout_card_grid(self, grid_frame, cards, columns, previous_columns=0):
+        """Place cards in a grid with the given number of equal-width columns"""
+        for column in range(max(columns, previous_columns)):
+            if column < columns:
+                grid_frame.grid_columnconfigure(column, weight=1, uniform='card')
+            else:
+                grid_frame.grid_columnconfigure(column, weight=0, uniform='')
+        
+        for i, card in enumerate(cards):
+            card.grid(
+                row=i // columns,
+                column=i % columns,
+                sticky='nsew',
+                padx=(0, self.design.spacing['sm']),
+                pady=self.design.spacing['xs']
+            )
+    
+    def on_content_resized(self, width):
+        """Re-flow card grids when the number of columns that fit changes"""
+        columns = self.get_column_count(width)
+        if columns == self.column_count:
+            return
         
-        # If there are more matches, schedule the next batch
-        if end_index < len(matches) and self.is_rendering:
-            self.root.after(self.render_delay, 
-                          lambda: self._render_matches_batch(matches, parent, section_type, end_index))
+        previous_columns = self.column_count
+        self.column_count = columns
+        self.card_grids = [(grid, cards) for grid, cards in self.card_grids if grid.winfo_exists()]
+        for grid, cards in self.card_grids:
+            self.layout_card_grid(grid, cards, columns, previous_columns)
     
     def stop_rendering(self):
         """Stop the current rendering process"""
         self.is_rendering = False
+        self.pending_tournaments = deque()
     
     def setup_virtual_scrolling(self, canvas):
         """Setup virtual scrolling for better performance"""
@@ -253,7 +482,7 @@ class MatchDisplay:
     def create_virtual_match_card(self, match, parent, section_type, index):
         """Create a virtual match card that can be shown/hidden"""
         # Create placeholder frame for virtual scrolling
-        placeholder = tk.Frame(parent, height=self.match_height, bg=self.design.colors['bg_card'])
+        placeholder = self.design.themed(tk.Frame, parent, {'bg': 'bg_card'}, height=self.match_height)
         
         # Store the actual match data
         placeholder.match_data = match
@@ -262,7 +491,7 @@ class MatchDisplay:
         
         # Only render if visible
         if self.is_match_visible(index):
-            self.create_modern_match_card(match, placeholder, section_type)
+            self.create_modern_match_card(match, placeholder, section_type).pack(fill=tk.BOTH, expand=True)
         
         return placeholder
     
@@ -282,54 +511,43 @@ class MatchDisplay:
     def display_modern_tournament(self, parent, tournament_info):
         """Display tournament with modern card design"""
         # Tournament container
-        tournament_container = tk.Frame(
-            parent,
-            bg=self.design.colors['bg_card']
-        )
+        tournament_container = self.design.themed(tk.Frame, parent, {'bg': 'bg_card'})
         tournament_container.pack(fill=tk.X, padx=self.design.spacing['lg'], pady=self.design.spacing['md'])
         
         # Tournament header with modern styling
-        header_frame = tk.Frame(
-            tournament_container,
-            bg=self.design.colors['bg_card']
-        )
+        header_frame = self.design.themed(tk.Frame, tournament_container, {'bg': 'bg_card'})
         header_frame.pack(fill=tk.X, pady=(0, self.design.spacing['md']))
         
         # Tournament name with accent
-        title_frame = tk.Frame(header_frame, bg=self.design.colors['bg_card'])
+        title_frame = self.design.themed(tk.Frame, header_frame, {'bg': 'bg_card'})
         title_frame.pack(fill=tk.X)
         
         # Color accent bar
-        accent_bar = tk.Frame(
-            title_frame,
-            bg=self.design.colors['primary'],
+        accent_bar = self.design.themed(
+            tk.Frame, title_frame, {'bg': 'primary'},
             width=4,
             height=24
         )
         accent_bar.pack(side=tk.LEFT, padx=(0, self.design.spacing['md']))
         
-        tk.Label(
-            title_frame,
+        self.design.themed(
+            tk.Label, title_frame, {'fg': 'text_primary', 'bg': 'bg_card'},
             text=tournament_info['tournament'],
             font=self.design.fonts['headline'],
-            fg=self.design.colors['text_primary'],
-            bg=self.design.colors['bg_card'],
             anchor='w'
         ).pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         # Round info
         if tournament_info['round'] and tournament_info['round'] != 'Regular Season':
-            tk.Label(
-                header_frame,
+            self.design.themed(
+                tk.Label, header_frame, {'fg': 'text_secondary', 'bg': 'bg_card'},
                 text=tournament_info['round'],
                 font=self.design.fonts['caption'],
-                fg=self.design.colors['text_secondary'],
-                bg=self.design.colors['bg_card'],
                 anchor='w'
             ).pack(fill=tk.X, pady=(self.design.spacing['xs'], 0))
         
         # Matches container
-        matches_container = tk.Frame(tournament_container, bg=self.design.colors['bg_card'])
+        matches_container = self.design.themed(tk.Frame, tournament_container, {'bg': 'bg_card'})
         matches_container.pack(fill=tk.X)
         
         # Group matches by status
@@ -356,275 +574,278 @@ class MatchDisplay:
     
     def create_match_section(self, title, matches, parent, section_type):
         """Create a section for matches of the same status"""
-        section_frame = tk.Frame(parent, bg=self.design.colors['bg_card'])
+        section_frame = self.design.themed(tk.Frame, parent, {'bg': 'bg_card'})
         section_frame.pack(fill=tk.X, pady=(0, self.design.spacing['md']))
         
         # Section header
-        section_header = tk.Frame(section_frame, bg=self.design.colors['bg_card'])
+        section_header = self.design.themed(tk.Frame, section_frame, {'bg': 'bg_card'})
         section_header.pack(fill=tk.X, pady=(0, self.design.spacing['sm']))
         
-        tk.Label(
-            section_header,
+        self.design.themed(
+            tk.Label, section_header, {'fg': self.design.get_section_role(section_type), 'bg': 'bg_card'},
             text=title,
             font=self.design.fonts['label'],
-            fg=self.design.get_section_color(section_type),
-            bg=self.design.colors['bg_card'],
             anchor='w'
         ).pack(side=tk.LEFT)
         
-        tk.Label(
-            section_header,
+        self.design.themed(
+            tk.Label, section_header, {'fg': 'text_muted', 'bg': 'bg_card'},
             text=f"({len(matches)})",
-            font=self.design.fonts['caption'],
-            fg=self.design.colors['text_muted'],
-            bg=self.design.colors['bg_card']
+            font=self.design.fonts['caption']
         ).pack(side=tk.LEFT, padx=(self.design.spacing['xs'], 0))
         
         # Matches grid
-        matches_grid = tk.Frame(section_frame, bg=self.design.colors['bg_card'])
+        matches_grid = self.design.themed(tk.Frame, section_frame, {'bg': 'bg_card'})
         matches_grid.pack(fill=tk.X)
         
-        # Display matches in rows of 2
-        for i in range(0, len(matches), 2):
-            row_frame = tk.Frame(matches_grid, bg=self.design.colors['bg_card'])
-            row_frame.pack(fill=tk.X, pady=self.design.spacing['xs'])
-            
-            # First match
-            self.create_modern_match_card(matches[i], row_frame, section_type)
-            
-            # Second match if exists
-            if i + 1 < len(matches):
-                self.create_modern_match_card(matches[i + 1], row_frame, section_type)
+        # Display matches in as many columns as fit the current width
+        self._render_matches_batch(matches, matches_grid, section_type)
+    
+    def get_card_view(self, match):
+        """Get the precomputed display descriptor for a match card"""
+        return self.view_models.describe(match, self.snapshot_version)
     
     def create_modern_match_card(self, match, parent, section_type):
-        """Create a modern match card with enhanced styling"""
+        """Create a modern match card with enhanced styling and return its container for placement"""
+        card_view = self.get_card_view(match)
+        fonts = self.design.fonts
+        home_role, home_name_font, home_score_font = self.get_team_style(card_view, 1)
+        away_role, away_name_font, away_score_font = self.get_team_style(card_view, 2)
+        
         # Card container with hover effects
-        card_container = tk.Frame(parent, bg=self.design.colors['bg_card'])
-        card_container.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, self.design.spacing['sm']))
+        card_container = self.design.themed(tk.Frame, parent, {'bg': 'card_bg'})
         
         # Main card with modern styling
-        card = tk.Frame(
-            card_container,
-            bg=self.design.colors['bg_card'],
+        card = self.design.themed(
+            tk.Frame, card_container, {'bg': 'card_bg', 'highlightbackground': 'card_border'},
             relief=tk.FLAT,
             bd=1,
-            highlightbackground=self.design.colors['border'],
             highlightthickness=1
         )
         card.pack(fill=tk.BOTH, expand=True, padx=self.design.spacing['xs'], pady=self.design.spacing['xs'])
         
         # Add hover effect
-        self.setup_card_hover(card)
+        self.setup_card_hover(card, card_view['id'])
         
         # Status indicator bar
-        status_color = self.design.get_section_color(section_type)
-        status_bar = tk.Frame(card, bg=status_color, height=3)
+        status_bar = self.design.themed(tk.Frame, card, {'bg': card_view['accent_color']}, height=3)
         status_bar.pack(fill=tk.X)
         
         # Card content
-        content = tk.Frame(card, bg=self.design.colors['bg_card'])
+        content = self.design.themed(tk.Frame, card, {'bg': 'card_bg'})
         content.pack(fill=tk.BOTH, expand=True, padx=self.design.spacing['md'], pady=self.design.spacing['md'])
         
-        # Match teams and score
-        home_team = match["homeTeam"]["name"]
-        away_team = match["awayTeam"]["name"]
-        home_score = match["homeScore"].get("current", "-")
-        away_score = match["awayScore"].get("current", "-")
-        
         # Teams section
-        teams_frame = tk.Frame(content, bg=self.design.colors['bg_card'])
+        teams_frame = self.design.themed(tk.Frame, content, {'bg': 'card_bg'})
         teams_frame.pack(fill=tk.X)
         
         # Home team
-        home_frame = tk.Frame(teams_frame, bg=self.design.colors['bg_card'])
+        home_frame = self.design.themed(tk.Frame, teams_frame, {'bg': 'card_bg'})
         home_frame.pack(fill=tk.X, pady=(0, self.design.spacing['xs']))
         
         # Team logo placeholder
-        tk.Label(
-            home_frame,
-            text=home_team[:3].upper(),
-            font=self.design.fonts['caption'],
-            bg=self.design.colors['bg_primary'],
-            fg=self.design.colors['primary'],
+        self.design.themed(
+            tk.Label, home_frame, {'bg': 'card_badge_bg', 'fg': 'card_badge_fg'},
+            text=card_view['home_abbr'],
+            font=fonts['caption'],
             width=4,
             relief=tk.FLAT
         ).pack(side=tk.LEFT, padx=(0, self.design.spacing['sm']))
         
         # Home team name
-        home_label = tk.Label(
-            home_frame,
-            text=self.design.truncate_team_name(home_team),
-            font=self.design.fonts['body_medium'],
-            fg=self.design.colors['text_primary'],
-            bg=self.design.colors['bg_card'],
+        home_label = self.design.themed(
+            tk.Label, home_frame, {'fg': home_role, 'bg': 'card_bg'},
+            text=card_view['home_name'],
+            font=fonts[home_name_font],
             anchor='w'
         )
         home_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         # Home score
         home_score_label = None
-        if section_type in ['live', 'finished']:
-            home_score_label = tk.Label(
-                home_frame,
-                text=str(home_score),
-                font=self.design.fonts['headline'],
-                fg=self.design.colors['text_primary'],
-                bg=self.design.colors['bg_card']
+        if card_view['show_scores']:
+            home_score_label = self.design.themed(
+                tk.Label, home_frame, {'fg': home_role, 'bg': 'card_bg'},
+                text=card_view['home_score'],
+                font=fonts[home_score_font]
             )
             home_score_label.pack(side=tk.RIGHT)
         
         # Away team
-        away_frame = tk.Frame(teams_frame, bg=self.design.colors['bg_card'])
+        away_frame = self.design.themed(tk.Frame, teams_frame, {'bg': 'card_bg'})
         away_frame.pack(fill=tk.X, pady=(0, self.design.spacing['sm']))
         
         # Team logo placeholder
-        tk.Label(
-            away_frame,
-            text=away_team[:3].upper(),
-            font=self.design.fonts['caption'],
-            bg=self.design.colors['bg_primary'],
-            fg=self.design.colors['primary'],
+        self.design.themed(
+            tk.Label, away_frame, {'bg': 'card_badge_bg', 'fg': 'card_badge_fg'},
+            text=card_view['away_abbr'],
+            font=fonts['caption'],
             width=4,
             relief=tk.FLAT
         ).pack(side=tk.LEFT, padx=(0, self.design.spacing['sm']))
         
         # Away team name
-        away_label = tk.Label(
-            away_frame,
-            text=self.design.truncate_team_name(away_team),
-            font=self.design.fonts['body_medium'],
-            fg=self.design.colors['text_primary'],
-            bg=self.design.colors['bg_card'],
+        away_label = self.design.themed(
+            tk.Label, away_frame, {'fg': away_role, 'bg': 'card_bg'},
+            text=card_view['away_name'],
+            font=fonts[away_name_font],
             anchor='w'
         )
         away_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
         
         # Away score
         away_score_label = None
-        if section_type in ['live', 'finished']:
-            away_score_label = tk.Label(
-                away_frame,
-                text=str(away_score),
-                font=self.design.fonts['headline'],
-                fg=self.design.colors['text_primary'],
-                bg=self.design.colors['bg_card']
+        if card_view['show_scores']:
+            away_score_label = self.design.themed(
+                tk.Label, away_frame, {'fg': away_role, 'bg': 'card_bg'},
+                text=card_view['away_score'],
+                font=fonts[away_score_font]
             )
             away_score_label.pack(side=tk.RIGHT)
         
         # Status and time section
-        status_frame = tk.Frame(content, bg=self.design.colors['bg_card'])
+        status_frame = self.design.themed(tk.Frame, content, {'bg': 'card_bg'})
         status_frame.pack(fill=tk.X)
         
         # Status indicator
-        self.create_match_status_indicator(match, status_frame, section_type)
+        self.create_match_status_indicator(match, status_frame, section_type, card_view)
         
-        # Winner highlighting for finished matches
-        if section_type == 'finished' and 'winnerCode' in match.get('status', {}) and home_score_label and away_score_label:
-            self.highlight_winner(match, home_label, away_label, home_score_label, away_score_label)
+        # Flash scores that changed since this match was last drawn
+        if card_view['show_scores']:
+            self.flash_score_changes(card_view, (home_score_label, home_role), (away_score_label, away_role))
+        
+        return card_container
     
-    def create_match_status_indicator(self, match, parent, section_type):
+    def create_match_status_indicator(self, match, parent, section_type, card_view=None):
         """Create modern status indicator"""
-        status_container = tk.Frame(
-            parent,
-            bg=self.design.colors['bg_primary'],
+        card_view = card_view or self.get_card_view(match)
+        
+        status_container = self.design.themed(
+            tk.Frame, parent, {'bg': 'card_status_bg'},
             relief=tk.FLAT
         )
         status_container.pack(fill=tk.X, ipady=self.design.spacing['xs'])
         
+        status_padx = self.design.spacing['sm']
         if section_type == 'live':
             # Live indicator with animation
-            live_dot = tk.Label(
-                status_container,
+            live_dot = self.design.themed(
+                tk.Label, status_container, {'fg': 'live', 'bg': 'card_status_bg'},
                 text="●",
-                font=self.design.fonts['body_medium'],
-                fg=self.design.colors['live'],
-                bg=self.design.colors['bg_primary']
+                font=self.design.fonts['body_medium']
             )
             live_dot.pack(side=tk.LEFT, padx=(self.design.spacing['sm'], self.design.spacing['xs']))
-            
-            minute = match.get('time', {}).get('minute', '')
-            status_text = f"LIVE {minute}'" if minute else "LIVE"
-            
-            tk.Label(
-                status_container,
-                text=status_text,
-                font=self.design.fonts['caption'],
-                fg=self.design.colors['live'],
-                bg=self.design.colors['bg_primary']
-            ).pack(side=tk.LEFT)
-            
-        elif section_type == 'finished':
-            tk.Label(
-                status_container,
-                text="FULL TIME",
-                font=self.design.fonts['caption'],
-                fg=self.design.colors['finished'],
-                bg=self.design.colors['bg_primary']
-            ).pack(side=tk.LEFT, padx=self.design.spacing['sm'])
-            
-        else:  # upcoming
-            try:
-                match_time = datetime.fromtimestamp(match['startTimestamp'])
-                time_str = match_time.strftime('%H:%M')
-                date_str = match_time.strftime('%m/%d') if match_time.date() != datetime.now().date() else "Today"
-                
-                tk.Label(
-                    status_container,
-                    text=f"{date_str} {time_str}",
-                    font=self.design.fonts['caption'],
-                    fg=self.design.colors['upcoming'],
-                    bg=self.design.colors['bg_primary']
-                ).pack(side=tk.LEFT, padx=self.design.spacing['sm'])
-            except:
-                tk.Label(
-                    status_container,
-                    text=match.get('status', {}).get('description', 'Scheduled'),
-                    font=self.design.fonts['caption'],
-                    fg=self.design.colors['upcoming'],
-                    bg=self.design.colors['bg_primary']
-                ).pack(side=tk.LEFT, padx=self.design.spacing['sm'])
+            if self.animation_clock:
+                self.animation_clock.add_blinker(live_dot, 'live', 'card_status_bg')
+            status_padx = 0
+        
+        status_text = card_view['status_text']
+        if card_view['section'] == 'live':
+            # Descriptors may be a minute old; the live clock gives the current minute
+            status_text = self.view_models.get_live_status_text(match)
+        
+        status_label = self.design.themed(
+            tk.Label, status_container, {'fg': card_view['status_color'], 'bg': 'card_status_bg'},
+            text=status_text,
+            font=self.design.fonts[card_view['status_font']]
+        )
+        status_label.pack(side=tk.LEFT, padx=status_padx)
+        
+        if card_view['section'] == 'live':
+            self.track_live_minute(status_label, match)
+    
+    def track_live_minute(self, label, match):
+        """Keep the minute of a live card's status label ticking"""
+        self.live_minute_labels[label] = match
+        if self.minute_job is None:
+            self.root = self.root or label.winfo_toplevel()
+            self.schedule_minute_tick()
+    
+    def schedule_minute_tick(self):
+        """Schedule the next minute update for the earliest live match whose minute changes"""
+        events = list(self.live_minute_labels.values())
+        if not events:
+            self.minute_job = None
+            return
+        
+        wait = self.view_models.live_clock.seconds_until_next_minute(events)
+        delay = 60000 if wait is None else min(60000, max(1000, int(wait * 1000) + 50))
+        self.minute_job = self.root.after(delay, self.update_live_minutes)
+    
+    def update_live_minutes(self):
+        """Update only the minute labels of live cards, skipping the work while the window is hidden"""
+        self.minute_job = None
+        if self.root.state() not in ('iconic', 'withdrawn'):
+            for label, match in list(self.live_minute_labels.items()):
+                text = self.view_models.get_live_status_text(match)
+                try:
+                    if label.cget('text') != text:
+                        label.configure(text=text)
+                except tk.TclError:
+                    self.live_minute_labels.pop(label, None)  # Destroyed but still referenced
+        self.schedule_minute_tick()
     
     def add_tournament_separator(self, parent):
         """Add visual separator between tournaments"""
-        separator_frame = tk.Frame(
-            parent,
-            bg=self.design.colors['bg_card'],
+        separator_frame = self.design.themed(
+            tk.Frame, parent, {'bg': 'bg_card'},
             height=self.design.spacing['xl']
         )
         separator_frame.pack(fill=tk.X, padx=self.design.spacing['lg'])
         
         # Gradient-like separator
-        tk.Frame(
-            separator_frame,
-            bg=self.design.colors['border'],
+        self.design.themed(
+            tk.Frame, separator_frame, {'bg': 'border'},
             height=1
         ).pack(expand=True, fill=tk.X, pady=self.design.spacing['lg'])
     
-    def setup_card_hover(self, card):
+    def setup_card_hover(self, card, match_id=None):
         """Setup hover effects for match cards"""
-        def on_enter(e):
-            card.config(highlightbackground=self.design.colors['primary'], highlightthickness=2)
-        
-        def on_leave(e):
-            card.config(highlightbackground=self.design.colors['border'], highlightthickness=1)
+        if self.event_dispatcher:
+            self.event_dispatcher.register(card, 'match_card', match_id)
+            return
         
-        card.bind('<Enter>', on_enter)
-        card.bind('<Leave>', on_leave)
+        card.bind('<Enter>', lambda e: self.on_card_enter(card))
+        card.bind('<Leave>', lambda e: self.on_card_leave(card))
+    
+    def on_card_enter(self, card, match_id=None):
+        """Highlight the card under the pointer"""
+        card.config(highlightbackground=self.design.get_role_color('card_border_hover'), highlightthickness=2)
     
-    def highlight_winner(self, match, home_label, away_label, home_score_label, away_score_label):
-        """Highlight winner in finished matches"""
-        winner_code = match.get('status', {}).get('winnerCode', 0)
+    def on_card_leave(self, card, match_id=None):
+        """Remove the hover highlight from a card"""
+        card.config(highlightbackground=self.design.get_role_color('card_border'), highlightthickness=1)
+    
+    def on_card_click(self, card, match_id):
+        """Forward a card click to the detail view callback"""
+        if self.card_click_callback:
+            self.card_click_callback(match_id)
+    
+    def flash_score_changes(self, card_view, home, away):
+        """Flash the score labels of a side whose score differs from the last drawn card"""
+        scores = (card_view['home_score'], card_view['away_score'])
+        previous = self.last_scores.get(card_view['id'])
+        self.last_scores[card_view['id']] = scores
+        if not previous or not self.animation_clock:
+            return
         
-        if winner_code == 1:  # Home win
-            home_label.config(fg=self.design.colors['finished'], font=self.design.fonts['body_medium'] + ('bold',))
-            home_score_label.config(fg=self.design.colors['finished'], font=self.design.fonts['headline'] + ('bold',))
-        elif winner_code == 2:  # Away win
-            away_label.config(fg=self.design.colors['finished'], font=self.design.fonts['body_medium'] + ('bold',))
-            away_score_label.config(fg=self.design.colors['finished'], font=self.design.fonts['headline'] + ('bold',))
+        for index, (label, rest_role) in enumerate((home, away)):
+            if previous[index] != scores[index]:
+                self.animation_clock.flash(label, rest_role)
+    
+    def get_team_style(self, card_view, side):
+        """Get the color role, name font and score font of a team (1 home, 2 away)"""
+        if card_view['show_scores'] and card_view['winner'] == side:
+            return 'winner_text', f"{card_view['name_font']}_bold", f"{card_view['score_font']}_bold"
+        return 'card_text', card_view['name_font'], card_view['score_font']
     
     def update_theme(self, design_system=None):
-        """Update component colors when theme changes"""
+        """Update theme state; cards and sections follow their theme bindings"""
         if design_system:
             self.design = design_system
-        # The actual display elements are recreated when needed, so we don't need to update them here
-        # The design system reference has been updated, so new elements will use the correct colors
\ No newline at end of file
+        
+        # Bindings restore the resting border, so re-apply the hover highlight
+        if self.event_dispatcher and self.event_dispatcher.hovered:
+            target = self.event_dispatcher.targets.get(self.event_dispatcher.hovered)
+            if target and target[0] == 'match_card':
+                self.on_card_enter(target[1])
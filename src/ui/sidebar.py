@@ -5,6 +5,8 @@ Contains the modern sidebar with navigation, actions, and status.
 
 import tkinter as tk
 
+from ui.events import EventDispatcher
+
 
 class Sidebar:
     """Modern sidebar component with navigation, actions, and status."""
@@ -14,6 +16,8 @@ class Sidebar:
         self.design = design_system
         self.callbacks = callbacks
         self.nav_buttons = []
+        self.selected_nav_index = None
+        self.fetch_enabled = True
         
         # Validate callbacks
         self.validate_callbacks()
@@ -36,27 +40,28 @@ class Sidebar:
     def create_sidebar(self):
         """Create modern sidebar with card design"""
         # Sidebar container
-        self.sidebar_container = tk.Frame(
-            self.parent,
-            bg=self.design.colors['bg_secondary'],
+        self.sidebar_container = self.design.themed(
+            tk.Frame, self.parent, {'bg': 'bg_secondary'},
             width=300,
             height=800
         )
         self.sidebar_container.pack(side=tk.LEFT, fill=tk.Y, padx=0, pady=0)
         self.sidebar_container.pack_propagate(False)
         
-        # Store references to themed widgets
-        self.themed_widgets = []
-        
         # Sidebar card
-        self.sidebar = tk.Frame(
-            self.sidebar_container,
-            bg=self.design.colors['bg_sidebar'],
+        self.sidebar = self.design.themed(
+            tk.Frame, self.sidebar_container, {'bg': 'sidebar_bg'},
             width=280,
             height=800
         )
         self.sidebar.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
-        self.themed_widgets.extend([self.sidebar_container, self.sidebar])
+        
+        # One dispatcher handles hover and clicks for every sidebar control
+        self.events = EventDispatcher(self.sidebar)
+        self.events.add_handler('search', enter=lambda widget, payload: self.on_search_hover(True),
+                                leave=lambda widget, payload: self.on_search_hover(False))
+        self.events.add_handler('nav', enter=self.on_nav_enter, leave=self.on_nav_leave, click=self.on_nav_button_click)
+        self.events.add_handler('action', enter=self.on_action_enter, leave=self.on_action_leave)
         
         # Add navigation and other sections
         self.create_modern_search()
@@ -67,71 +72,53 @@ class Sidebar:
     def create_modern_search(self):
         """Create a modern search bar with enhanced styling and functionality"""
         # Search section with proper spacing
-        self.search_section = tk.Frame(
-            self.sidebar, 
-            bg=self.design.colors['bg_sidebar']
-        )
+        self.search_section = self.design.themed(tk.Frame, self.sidebar, {'bg': 'sidebar_bg'})
         self.search_section.pack(fill=tk.X, padx=self.design.spacing['md'], pady=(self.design.spacing['lg'], self.design.spacing['md']))
-        self.themed_widgets.append(self.search_section)
         
         # Search container with modern styling
-        search_bg = self.design.colors['bg_secondary'] if self.design.is_dark_theme() else '#F5F5F5'
-        self.search_container = tk.Frame(
-            self.search_section,
-            bg=search_bg,
+        self.search_container = self.design.themed(
+            tk.Frame, self.search_section,
+            {'bg': 'input_bg', 'highlightbackground': 'border', 'highlightcolor': 'primary'},
             relief=tk.FLAT,
             bd=0,
-            highlightthickness=1,
-            highlightbackground=self.design.colors['border'],
-            highlightcolor=self.design.colors['primary']
+            highlightthickness=1
         )
         self.search_container.pack(fill=tk.X, ipady=8, ipadx=12)
-        self.search_container.bind('<Enter>', lambda e: self.on_search_hover(True))
-        self.search_container.bind('<Leave>', lambda e: self.on_search_hover(False))
-        self.themed_widgets.append(self.search_container)
+        self.events.register(self.search_container, 'search')
         
         # Search icon with modern styling
-        self.search_icon = tk.Label(
-            self.search_container,
+        self.search_icon = self.design.themed(
+            tk.Label, self.search_container, {'bg': 'input_bg', 'fg': 'text_secondary'},
             text="\U0001F50D",  # Magnifying glass emoji
-            font=('Segoe UI Emoji', 14),
-            bg=search_bg,
-            fg=self.design.colors['text_secondary']
+            font=('Segoe UI Emoji', 14)
         )
         self.search_icon.pack(side=tk.LEFT, padx=(4, 8))
-        self.themed_widgets.append(self.search_icon)
         
-        # Search entry with modern styling
+        # Search entry with modern styling; fg follows the placeholder state
         self.search_var = tk.StringVar()
-        self.search_entry = tk.Entry(
-            self.search_container,
+        self.search_entry = self.design.themed(
+            tk.Entry, self.search_container,
+            {'bg': 'input_bg', 'insertbackground': 'text_primary', 'selectbackground': 'primary'},
             textvariable=self.search_var,
             font=('Segoe UI', 12),
-            bg=search_bg,
             fg=self.design.colors['text_primary'],
             relief=tk.FLAT,
             borderwidth=0,
             highlightthickness=0,
-            insertbackground=self.design.colors['text_primary'],
-            selectbackground=self.design.colors['primary'],
             selectforeground='white'
         )
         self.search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
-        self.themed_widgets.append(self.search_entry)
         
         # Clear button (initially hidden)
-        self.clear_button = tk.Label(
-            self.search_container,
+        self.clear_button = self.design.themed(
+            tk.Label, self.search_container, {'bg': 'input_bg', 'fg': 'text_secondary'},
             text="✕",
             font=('Segoe UI', 12, 'bold'),
-            bg=search_bg,
-            fg=self.design.colors['text_secondary'],
             cursor='hand2'
         )
         self.clear_button.pack(side=tk.RIGHT, padx=(0, 4))
         self.clear_button.bind('<Button-1>', self.clear_search)
         self.clear_button.pack_forget()  # Initially hidden
-        self.themed_widgets.append(self.clear_button)
         
         # Placeholder behavior and search functionality
         self.search_entry.insert(0, "Search matches...")
@@ -143,12 +130,8 @@ class Sidebar:
     
     def create_modern_navigation(self):
         """Create modern navigation section"""
-        self.nav_section = tk.Frame(
-            self.sidebar,
-            bg=self.design.colors['bg_sidebar']
-        )
+        self.nav_section = self.design.themed(tk.Frame, self.sidebar, {'bg': 'sidebar_bg'})
         self.nav_section.pack(fill=tk.X, pady=(0, self.design.spacing['xl']))
-        self.themed_widgets.append(self.nav_section)
         
         # Navigation items with modern styling
         nav_items = [
@@ -160,55 +143,41 @@ class Sidebar:
         
         self.nav_buttons = []
         for icon, text, command, is_active in nav_items:
-            btn_frame = tk.Frame(self.nav_section, bg=self.design.colors['bg_sidebar'])
+            btn_frame = self.design.themed(tk.Frame, self.nav_section, {'bg': 'sidebar_bg'})
             btn_frame.pack(fill=tk.X, pady=(0, self.design.spacing['xs']))
-            self.themed_widgets.append(btn_frame)
             
-            btn = tk.Label(
-                btn_frame,
+            btn = self.design.themed(
+                tk.Label, btn_frame,
+                {'bg': 'sidebar_bg', 'fg': 'text_primary' if is_active else 'text_secondary'},
                 text=f"{icon}  {text}",
                 font=self.design.fonts['body_medium'],
-                bg=self.design.colors['bg_sidebar'],
-                fg=self.design.colors['text_primary'] if is_active else self.design.colors['text_secondary'],
                 anchor='w',
                 padx=self.design.spacing['lg'],
                 pady=self.design.spacing['md'],
                 cursor='hand2'
             )
             btn.pack(fill=tk.X)
-            self.themed_widgets.append(btn)
-            
-            # Add hover effect
-            btn.bind('<Enter>', lambda e, b=btn: b.config(bg=self.design.colors['hover']))
-            btn.bind('<Leave>', lambda e, b=btn, active=is_active: 
-                    b.config(bg=self.design.colors['bg_sidebar'],
-                            fg=self.design.colors['text_primary'] if active else self.design.colors['text_secondary']))
             
-            # Add click handler
-            btn.bind('<Button-1>', lambda e, cmd=command: self.on_nav_click(cmd, btn_frame))
+            # Hover and click go through the sidebar's dispatcher
+            self.events.register(btn, 'nav', (command, btn_frame, is_active))
             
             self.nav_buttons.append((btn_frame, btn))
         
         # Separator
-        separator = tk.Frame(
-            self.nav_section, 
-            bg=self.design.colors['border'], 
-            height=1
-        )
+        separator = self.design.themed(tk.Frame, self.nav_section, {'bg': 'border'}, height=1)
         separator.pack(fill=tk.X, padx=self.design.spacing['lg'], pady=self.design.spacing['lg'])
     
     def create_modern_actions(self):
         """Create modern action buttons"""
-        action_section = tk.Frame(self.sidebar, bg=self.design.colors['bg_sidebar'])
+        action_section = self.design.themed(tk.Frame, self.sidebar, {'bg': 'sidebar_bg'})
         action_section.pack(fill=tk.X, padx=self.design.spacing['lg'], pady=self.design.spacing['md'])
         
-        # Fetch button with modern styling
-        self.fetch_btn = tk.Button(
-            action_section,
+        # Fetch button with modern styling; bg follows the fetch state
+        self.fetch_btn = self.design.themed(
+            tk.Button, action_section, {'fg': 'text_white'},
             text="🔄  Fetch Matches",
             font=self.design.fonts['body_medium'],
             bg=self.design.colors['success'],
-            fg=self.design.colors['text_white'],
             bd=0,
             relief=tk.FLAT,
             padx=self.design.spacing['lg'],
@@ -240,147 +209,44 @@ class Sidebar:
     
     def create_sidebar_status(self):
         """Create sidebar status section"""
-        status_section = tk.Frame(self.sidebar, bg=self.design.colors['bg_sidebar'])
+        status_section = self.design.themed(tk.Frame, self.sidebar, {'bg': 'sidebar_bg'})
         status_section.pack(side=tk.BOTTOM, fill=tk.X, padx=self.design.spacing['lg'], pady=self.design.spacing['lg'])
         
         # Status indicator
-        status_container = tk.Frame(
-            status_section,
-            bg=self.design.colors['bg_secondary'],
+        status_container = self.design.themed(
+            tk.Frame, status_section, {'bg': 'bg_secondary'},
             relief=tk.FLAT
         )
         status_container.pack(fill=tk.X, pady=self.design.spacing['sm'])
         
-        # Status dot
-        self.status_dot = tk.Label(
-            status_container,
+        # Status dot and text; update_status changes the fg role both follow across theme switches
+        self.status_dot_roles = {'bg': 'bg_secondary', 'fg': 'success'}
+        self.status_dot = self.design.themed(
+            tk.Label, status_container, self.status_dot_roles,
             text="●",
-            font=self.design.fonts['body_medium'],
-            bg=self.design.colors['bg_secondary'],
-            fg=self.design.colors['success']
+            font=self.design.fonts['body_medium']
         )
         self.status_dot.pack(side=tk.LEFT, padx=(self.design.spacing['md'], self.design.spacing['sm']))
         
-        # Status text
-        self.status_label = tk.Label(
-            status_container,
+        self.status_label_roles = {'bg': 'bg_secondary', 'fg': 'text_secondary'}
+        self.status_label = self.design.themed(
+            tk.Label, status_container, self.status_label_roles,
             text="Ready to fetch matches",
             font=self.design.fonts['caption'],
-            fg=self.design.colors['text_secondary'],
-            bg=self.design.colors['bg_secondary'],
             anchor='w'
         )
         self.status_label.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=(0, self.design.spacing['md']))
     
-    def refresh(self):
-        """Refresh the sidebar after theme changes"""
-        try:
-            # Save current status before refresh
-            status_text = self.status_label.cget('text') if hasattr(self, 'status_label') else ""
-            status_color = self.status_dot.cget('fg') if hasattr(self, 'status_dot') else ""
-            status_emoji = self.status_dot.cget('text') if hasattr(self, 'status_dot') else ""
-            
-            # Clear existing widgets
-            for widget in self.sidebar_container.winfo_children():
-                widget.destroy()
-            
-            # Clear the container's grid/pack settings
-            self.sidebar_container.pack_forget()
-            
-            # Recreate the sidebar with updated theme
-            self.create_sidebar()
-            
-            # Repack the sidebar container with proper settings
-            self.sidebar_container.pack(side=tk.LEFT, fill=tk.Y, padx=0, pady=0)
-            
-            # Update status if it existed before
-            if hasattr(self, 'update_status') and status_text:
-                self.update_status(status_text, status_color, status_emoji)
-                
-        except Exception as e:
-            print(f"Error refreshing sidebar: {e}")
-    
     def update_theme(self, design_system):
-        """Update theme colors for all widgets"""
+        """Reapply state-dependent colors; static colors follow their theme bindings"""
         self.design = design_system
         
-        try:
-            # Update main containers
-            if hasattr(self, 'sidebar_container'):
-                self.sidebar_container.config(bg=self.design.colors['bg_secondary'])
-            if hasattr(self, 'sidebar'):
-                self.sidebar.config(bg=self.design.colors['bg_sidebar'])
-            
-            # Update all themed widgets
-            if hasattr(self, 'themed_widgets'):
-                for widget in self.themed_widgets:
-                    try:
-                        if isinstance(widget, tk.Frame):
-                            if hasattr(self, 'search_container') and widget == self.search_container:
-                                widget.config(bg=self.design.colors['bg_secondary'])
-                            else:
-                                widget.config(bg=self.design.colors['bg_sidebar'])
-                        elif isinstance(widget, tk.Label):
-                            if hasattr(self, 'search_icon') and widget == self.search_icon:
-                                widget.config(
-                                    bg=self.design.colors['bg_secondary'], 
-                                    fg=self.design.colors['text_secondary']
-                                )
-                            else:
-                                widget.config(
-                                    bg=self.design.colors['bg_sidebar'], 
-                                    fg=self.design.colors['text_primary']
-                                )
-                        elif isinstance(widget, tk.Entry):
-                            widget.config(
-                                bg=self.design.colors['bg_secondary'],
-                                fg=self.design.colors['text_primary'],
-                                insertbackground=self.design.colors['text_primary']
-                            )
-                    except Exception as e:
-                        print(f"Error updating widget theme: {e}")
-            
-            # Update buttons if they exist
-            if hasattr(self, 'fetch_btn'):
-                self.fetch_btn.config(
-                    bg=self.design.colors['success'], 
-                    fg=self.design.colors['text_white'],
-                    activebackground=self.design.colors['success'],
-                    activeforeground=self.design.colors['text_white']
-                )
-            
-            if hasattr(self, 'stop_btn'):
-                self.stop_btn.config(
-                    bg=self.design.colors['bg_card'], 
-                    fg=self.design.colors['danger'],
-                    activebackground=self.design.colors['bg_card'],
-                    activeforeground=self.design.colors['danger']
-                )
-            
-            # Update status section if it exists
-            if hasattr(self, 'status_frame'):
-                self.status_frame.config(bg=self.design.colors['bg_sidebar'])
-            
-            if hasattr(self, 'status_dot'):
-                self.status_dot.config(
-                    bg=self.design.colors['bg_sidebar'], 
-                    fg=self.design.colors['success']
-                )
-            
-            if hasattr(self, 'status_label'):
-                self.status_label.config(
-                    bg=self.design.colors['bg_sidebar'], 
-                    fg=self.design.colors['text_secondary']
-                )
-                
-        except Exception as e:
-            print(f"Error in sidebar theme update: {e}")
-        
-        # Update button styles
-        self.setup_button_hover_effects()
+        if self.selected_nav_index is not None:
+            self.update_nav_selection(self.selected_nav_index)
+        self.set_fetch_button_state(self.fetch_enabled)
         
-        # Refresh the sidebar to apply all theme changes
-        self.refresh()
+        placeholder = self.search_entry.get() == "Search matches..."
+        self.search_entry.config(fg=self.design.colors['text_secondary' if placeholder else 'text_primary'])
     
     def on_nav_click(self, command, btn_frame):
         """Handle navigation button click"""
@@ -397,26 +263,34 @@ class Sidebar:
         command()
     
     def setup_button_hover_effects(self):
-        """Setup hover effects for buttons"""
-        def fetch_hover_enter(e):
-            self.fetch_btn.config(bg=self.design.colors['text_primary'])
-        
-        def fetch_hover_leave(e):
-            if self.fetch_btn['state'] != tk.DISABLED:
-                self.fetch_btn.config(bg=self.design.colors['success'])
-        
-        def stop_hover_enter(e):
-            if self.stop_btn['state'] != tk.DISABLED:
-                self.stop_btn.config(bg=self.design.colors['text_primary'])
-        
-        def stop_hover_leave(e):
-            if self.stop_btn['state'] != tk.DISABLED:
-                self.stop_btn.config(bg=self.design.colors['danger'])
-        
-        self.fetch_btn.bind('<Enter>', fetch_hover_enter)
-        self.fetch_btn.bind('<Leave>', fetch_hover_leave)
-        self.stop_btn.bind('<Enter>', stop_hover_enter)
-        self.stop_btn.bind('<Leave>', stop_hover_leave)
+        """Register the action buttons with the sidebar's dispatcher for hover effects"""
+        self.events.register(self.fetch_btn, 'action', 'success')
+        self.events.register(self.stop_btn, 'action', 'danger')
+    
+    def on_nav_enter(self, button, payload):
+        """Hover effect for navigation buttons"""
+        button.config(bg=self.design.colors['hover'])
+    
+    def on_nav_leave(self, button, payload):
+        """Remove the hover effect from navigation buttons"""
+        command, btn_frame, is_active = payload
+        button.config(bg=self.design.colors['bg_sidebar'],
+                      fg=self.design.colors['text_primary'] if is_active else self.design.colors['text_secondary'])
+    
+    def on_nav_button_click(self, button, payload):
+        """Run the command of the clicked navigation button"""
+        command, btn_frame, is_active = payload
+        self.on_nav_click(command, btn_frame)
+    
+    def on_action_enter(self, button, rest_role):
+        """Hover effect for the fetch and stop buttons, unless disabled"""
+        if button['state'] != tk.DISABLED:
+            button.config(bg=self.design.colors['text_primary'])
+    
+    def on_action_leave(self, button, rest_role):
+        """Restore an enabled action button's resting color"""
+        if button['state'] != tk.DISABLED:
+            button.config(bg=self.design.colors[rest_role])
     
     def nav_hover_enter(self, button, frame):
         """Navigation hover enter effect"""
@@ -499,7 +373,8 @@ class Sidebar:
         """Update the selected navigation item"""
         if not hasattr(self, 'nav_buttons'):
             return
-            
+        
+        self.selected_nav_index = index
         for i, (frame, btn) in enumerate(self.nav_buttons):
             try:
                 if i == index:
@@ -517,99 +392,21 @@ class Sidebar:
             except Exception as e:
                 print(f"Error updating nav selection: {e}")
     
-    def update_status(self, message, color, indicator="●"):
-        """Update status with modern styling"""
+    def update_status(self, message, role, indicator="●"):
+        """Update status with modern styling; role is a color role, e.g. 'success'"""
+        # The registered role dicts are updated in place, so theme switches keep the status color
+        self.status_label_roles['fg'] = role
+        self.status_dot_roles['fg'] = role
+        color = self.design.get_role_color(role)
         self.status_label.config(text=message, fg=color)
         self.status_dot.config(fg=color, text=indicator)
     
     def set_fetch_button_state(self, enabled):
         """Set fetch button state"""
+        self.fetch_enabled = enabled
         if enabled:
             self.fetch_btn.config(state=tk.NORMAL, bg=self.design.colors['success'])
-            self.stop_btn.config(state=tk.DISABLED, bg=self.design.colors['bg_card'])
+            self.stop_btn.config(state=tk.DISABLED, bg=self.design.colors['bg_card'], fg=self.design.colors['danger'])
         else:
             self.fetch_btn.config(state=tk.DISABLED, bg=self.design.colors['text_muted'])
             self.stop_btn.config(state=tk.NORMAL, bg=self.design.colors['danger'], fg=self.design.colors['text_white'])
-    
-    def update_theme(self, design_system):
-        """Update component colors when theme changes"""
-        self.design = design_system
-        
-        # Update sidebar container
-        self.parent.configure(bg=self.design.colors['bg_secondary'])
-        
-        # Update sidebar frame
-        self.sidebar.configure(bg=self.design.colors['bg_sidebar'])
-        
-        # Update navigation buttons
-        for btn, frame, is_active in self.nav_buttons:
-            if is_active:
-                btn.config(bg=self.design.colors['active'], fg=self.design.colors['primary'])
-                frame.config(bg=self.design.colors['active'])
-            else:
-                btn.config(bg=self.design.colors['bg_sidebar'], fg=self.design.colors['text_primary'])
-                frame.config(bg=self.design.colors['bg_sidebar'])
-        
-        # Update action buttons
-        if hasattr(self, 'fetch_btn'):
-            self.fetch_btn.config(bg=self.design.colors['success'])
-        if hasattr(self, 'stop_btn'):
-            self.stop_btn.config(bg=self.design.colors['bg_card'], fg=self.design.colors['danger'])
-        
-        # Update search section
-        if hasattr(self, 'search_entry'):
-            search_bg = self.design.colors['bg_secondary'] if self.design.is_dark_theme() else '#F1F3F4'
-            self.search_entry.config(
-                bg=search_bg,
-                fg=self.design.colors['text_primary']
-            )
-        
-        # Update search container
-        for widget in self.sidebar.winfo_children():
-            if isinstance(widget, tk.Frame):
-                self.update_search_containers(widget)
-        
-        # Update status section
-        if hasattr(self, 'status_label'):
-            status_bg = self.design.colors['bg_secondary'] if self.design.is_dark_theme() else '#F1F3F4'
-            self.status_label.config(fg=self.design.colors['text_secondary'], bg=status_bg)
-        if hasattr(self, 'status_dot'):
-            status_bg = self.design.colors['bg_secondary'] if self.design.is_dark_theme() else '#F1F3F4'
-            self.status_dot.config(bg=status_bg)
-        
-        # Update status container
-        for widget in self.sidebar.winfo_children():
-            if isinstance(widget, tk.Frame):
-                self.update_status_containers(widget)
-    
-    def update_search_containers(self, widget):
-        """Update search container themes"""
-        if isinstance(widget, tk.Frame):
-            # Check if this is a search container by looking for search entry
-            for child in widget.winfo_children():
-                if isinstance(child, tk.Entry) and hasattr(self, 'search_entry') and child == self.search_entry:
-                    search_bg = self.design.colors['bg_secondary'] if self.design.is_dark_theme() else '#F1F3F4'
-                    widget.configure(bg=search_bg)
-                    # Update search icon
-                    for grandchild in widget.winfo_children():
-                        if isinstance(grandchild, tk.Label) and grandchild.cget('text') == "🔍":
-                            grandchild.config(
-                                bg=search_bg,
-                                fg=self.design.colors['text_secondary']
-                            )
-                else:
-                    self.update_search_containers(child)
-    
-    def update_status_containers(self, widget):
-        """Update status container themes"""
-        if isinstance(widget, tk.Frame):
-            # Check if this is a status container by looking for status elements
-            for child in widget.winfo_children():
-                if isinstance(child, tk.Label) and hasattr(self, 'status_label') and child == self.status_label:
-                    status_bg = self.design.colors['bg_secondary'] if self.design.is_dark_theme() else '#F1F3F4'
-                    widget.configure(bg=status_bg)
-                elif isinstance(child, tk.Label) and hasattr(self, 'status_dot') and child == self.status_dot:
-                    status_bg = self.design.colors['bg_secondary'] if self.design.is_dark_theme() else '#F1F3F4'
-                    widget.configure(bg=status_bg)
-                else:
-                    self.update_status_containers(child)
@@ -17,38 +17,30 @@ class StatusBar:
     
     def create_status_bar(self):
         """Create modern status bar"""
-        status_container = tk.Frame(
-            self.parent,
-            bg=self.design.colors['primary'],
-            height=40
-        )
+        status_container = self.design.themed(tk.Frame, self.parent, {'bg': 'primary'}, height=40)
         status_container.pack(side=tk.BOTTOM, fill=tk.X)
         status_container.pack_propagate(False)
         
         # Status content
-        status_content = tk.Frame(status_container, bg=self.design.colors['primary'])
+        status_content = self.design.themed(tk.Frame, status_container, {'bg': 'primary'})
         status_content.pack(expand=True, padx=self.design.spacing['xl'])
         
         # Status text
         self.status_var = tk.StringVar()
-        self.status_bar = tk.Label(
-            status_content,
+        self.status_bar = self.design.themed(
+            tk.Label, status_content, {'bg': 'primary', 'fg': 'text_white'},
             textvariable=self.status_var,
             font=self.design.fonts['body_medium'],
-            fg=self.design.colors['text_white'],
-            bg=self.design.colors['primary'],
             anchor='w'
         )
         self.status_bar.pack(side=tk.LEFT, expand=True, fill=tk.X)
         self.status_var.set("Ready")
         
         # Match count
-        self.match_count_label = tk.Label(
-            status_content,
+        self.match_count_label = self.design.themed(
+            tk.Label, status_content, {'bg': 'primary', 'fg': 'text_white'},
             text="0 matches",
             font=self.design.fonts['caption'],
-            fg=self.design.colors['text_white'],
-            bg=self.design.colors['primary'],
             anchor='e'
         )
         self.match_count_label.pack(side=tk.RIGHT)
@@ -62,25 +54,5 @@ class StatusBar:
         self.match_count_label.config(text=f"{count} matches")
     
     def update_theme(self, design_system):
-        """Update component colors when theme changes"""
+        """Update theme state; widget colors follow their theme bindings"""
         self.design = design_system
-        
-        # Update status container
-        self.parent.configure(bg=self.design.colors['primary'])
-        
-        # Update status content
-        for widget in self.parent.winfo_children():
-            if isinstance(widget, tk.Frame):
-                widget.configure(bg=self.design.colors['primary'])
-        
-        # Update status bar
-        self.status_bar.config(
-            fg=self.design.colors['text_white'],
-            bg=self.design.colors['primary']
-        )
-        
-        # Update match count label
-        self.match_count_label.config(
-            fg=self.design.colors['text_white'],
-            bg=self.design.colors['primary']
-        )
\ No newline at end of file
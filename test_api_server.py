@@ -0,0 +1,67 @@
+"""
+Test the match API server: routes, ETag revalidation and gzip.
+"""
+
+import gzip
+import http.client
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from data.api_server import MatchAPIServer
+
+
+def make_data(home_score):
+    return {'events': [
+        {'id': 1, 'tournament': {'name': 'League'}, 'status': {'type': 'inprogress'}, 'homeScore': {'current': home_score}},
+        {'id': 2, 'tournament': {'name': 'Cup'}, 'status': {'type': 'notstarted'}, 'homeScore': {}},
+    ]}
+
+
+def get(port, route, headers=None):
+    connection = http.client.HTTPConnection('127.0.0.1', port)
+    connection.request('GET', route, headers=headers or {})
+    response = connection.getresponse()
+    body = response.read()
+    connection.close()
+    return response, body
+
+
+def test_routes_etag_and_gzip():
+    """Routes serve the published snapshot, revalidate with ETags and compress on request"""
+    server = MatchAPIServer(port=0)
+    server.start()
+    try:
+        response, _ = get(server.port, '/events')
+        assert response.status == 503
+        
+        server.publish(make_data(0), 1)
+        response, body = get(server.port, '/live')
+        assert response.status == 200
+        assert [event['id'] for event in json.loads(body)['events']] == [1]
+        etag = response.getheader('ETag')
+        
+        response, body = get(server.port, '/live', {'If-None-Match': etag})
+        assert response.status == 304 and body == b''
+        
+        response, body = get(server.port, '/tournaments', {'Accept-Encoding': 'gzip'})
+        assert response.getheader('Content-Encoding') == 'gzip'
+        tournaments = json.loads(gzip.decompress(body))['tournaments']
+        assert sorted(group['tournament'] for group in tournaments) == ['Cup', 'League']
+        
+        # Same content under a new version keeps the ETag; changed content doesn't
+        server.publish(make_data(0), 2)
+        response, _ = get(server.port, '/live', {'If-None-Match': etag})
+        assert response.status == 304
+        server.publish(make_data(1), 3)
+        response, _ = get(server.port, '/live', {'If-None-Match': etag})
+        assert response.status == 200
+        assert response.getheader('X-Snapshot-Version') == '3'
+        
+        response, _ = get(server.port, '/unknown')
+        assert response.status == 404
+        assert server.get_stats()['not_modified'] == 2
+    finally:
+        server.stop()
@@ -0,0 +1,100 @@
+"""
+Test the headless daemon: NDJSON records, deltas between snapshots and no Tk import.
+"""
+
+import copy
+import io
+import json
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from core.executor import ExecutorService
+from data.data_processor import DataProcessor
+from data.delta_log import DeltaLog
+from data.deltas import compute_deltas
+from daemon import Daemon, NDJSONWriter
+
+
+def make_event(event_id, home_score, status='inprogress'):
+    return {
+        'id': event_id,
+        'status': {'type': status, 'code': 6, 'description': '1st half'},
+        'homeScore': {'current': home_score},
+        'awayScore': {'current': 0},
+        'startTimestamp': 1700000000
+    }
+
+
+class SequenceScraper:
+    """Stands in for MatchScraper, returning the next prepared snapshot on every run"""
+    
+    def __init__(self, snapshots):
+        self.snapshots = snapshots
+        self.json_data = None
+    
+    def run(self):
+        self.json_data = self.snapshots.pop(0)
+        return True
+    
+    def stop(self):
+        pass
+
+
+def test_compute_deltas():
+    """Added, removed and changed events are reported with the changed fields"""
+    previous = {'events': [make_event(1, 0), make_event(2, 1)]}
+    current = {'events': [make_event(1, 1), make_event(3, 0, 'notstarted')]}
+    deltas = compute_deltas(previous, current)
+    
+    assert {'op': 'changed', 'id': 1, 'changes': {'home_score': [0, 1]}} in deltas
+    assert {'op': 'added', 'id': 3, 'event': current['events'][1]} in deltas
+    assert {'op': 'removed', 'id': 2} in deltas
+    assert len(deltas) == 3
+    assert compute_deltas(current, copy.deepcopy(current)) == []
+
+
+def test_daemon_writes_snapshot_deltas_and_metrics(tmp_path):
+    """The first refresh logs a snapshot, changed ones deltas, and every refresh writes metrics"""
+    snapshots = [{'events': [make_event(1, 0)]}, {'events': [make_event(1, 1)]}, {'events': [make_event(1, 1)]}]
+    executor = ExecutorService(pools={'io': 1})
+    processor = DataProcessor(output_path=str(tmp_path / "events.json"), executor=executor,
+                              scraper_factory=lambda output_path: SequenceScraper(snapshots))
+    writer = NDJSONWriter(str(tmp_path))
+    delta_log = DeltaLog(str(tmp_path))
+    try:
+        Daemon(writer, processor, interval=0, delta_log=delta_log).run(max_refreshes=3)
+    finally:
+        delta_log.close()
+        writer.close()
+        executor.shutdown(timeout=1.0)
+    
+    snapshot_record, delta_record = DeltaLog(str(tmp_path)).iter_records()
+    with open(tmp_path / "metrics.ndjson", encoding='utf-8') as f:
+        metrics_records = [json.loads(line) for line in f]
+    
+    assert snapshot_record['type'] == 'snapshot' and snapshot_record['events'] == 1
+    assert snapshot_record['data']['events'][0]['homeScore']['current'] == 0
+    assert delta_record['deltas'] == [{'op': 'changed', 'id': 1, 'changes': {'home_score': [0, 1]}}]
+    assert delta_record['base_version'] == snapshot_record['version']
+    assert [record['refresh'] for record in metrics_records] == [1, 2, 3]
+    assert [record['deltas'] for record in metrics_records] == [None, 1, 0]
+    assert all(record['success'] for record in metrics_records)
+
+
+def test_daemon_streams_records_without_output():
+    """Without an output directory the delta log's records go to the writer's stream"""
+    stream = io.StringIO()
+    daemon = Daemon(NDJSONWriter(stream=stream), DataProcessor(), snapshot_every=2)
+    for home_score in (0, 1, 2):
+        daemon.write_data({'events': [make_event(1, home_score)]}, 1000.0 + home_score)
+    assert [json.loads(line)['type'] for line in stream.getvalue().splitlines()] == ['snapshot', 'delta', 'snapshot']
+
+
+def test_daemon_does_not_import_tk():
+    """The daemon and the data pipeline load without tkinter"""
+    root = os.path.dirname(os.path.abspath(__file__))
+    code = "import sys, daemon; sys.exit('tkinter' in sys.modules)"
+    assert subprocess.run([sys.executable, '-c', code], cwd=root).returncode == 0
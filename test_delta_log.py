@@ -0,0 +1,97 @@
+"""
+Test the delta log: O(changes) appends, replay at any time, crash tolerance and compaction.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from data.delta_log import DeltaLog
+from data.live_clock import LiveClock
+
+
+def make_data(home_score, events=3):
+    return {'events': [{'id': i, 'tournament': {'name': 'League'}, 'status': {'type': 'inprogress'},
+                        'homeScore': {'current': home_score if i == 0 else 0}} for i in range(events)]}
+
+
+def make_phase(phase, kickoff=1700000000):
+    """Build the sofascore event of one match at first half, second half or full time"""
+    event = {'id': 1, 'tournament': {'name': 'League'}, 'homeTeam': {'name': 'Home'}, 'awayTeam': {'name': 'Away'},
+             'homeScore': {'current': 1}, 'awayScore': {'current': 0}, 'startTimestamp': kickoff}
+    if phase == 'first_half':
+        event['status'] = {'code': 6, 'description': '1st half', 'type': 'inprogress'}
+        event['time'] = {'initial': 0, 'max': 2700, 'extra': 540, 'currentPeriodStartTimestamp': kickoff}
+    elif phase == 'second_half':
+        event['status'] = {'code': 7, 'description': '2nd half', 'type': 'inprogress'}
+        event['time'] = {'initial': 2700, 'max': 5400, 'extra': 540, 'currentPeriodStartTimestamp': kickoff + 3600}
+    else:
+        event['status'] = {'code': 100, 'description': 'Ended', 'type': 'finished', 'winnerCode': 1}
+        event['winnerCode'] = 1
+        event['time'] = {}
+    return {'events': [event]}
+
+
+def test_replay_at_any_time(tmp_path):
+    """Deltas hold only the changes and replay rebuilds each moment"""
+    log = DeltaLog(str(tmp_path), checkpoint_every=2)
+    assert log.append(make_data(0), 1000.0, 1)['type'] == 'snapshot'
+    assert log.append(make_data(0), 1010.0, 1) is None
+    bytes_before = log.stats['bytes']
+    assert log.append(make_data(1), 1020.0, 2)['base_version'] == 1
+    assert log.stats['bytes'] - bytes_before < 150  # One score change, not the whole snapshot
+    assert log.append(make_data(2, events=4), 1030.0, 3)['type'] == 'delta'
+    assert log.append(make_data(3, events=4), 1040.0, 4)['type'] == 'snapshot'
+    assert len(log.get_segments()) == 2
+    
+    assert log.replay(at=999.0) is None
+    assert log.replay(at=1025.0) == (make_data(1), 2, 1020.0)
+    assert log.replay(at=1035.0) == (make_data(2, events=4), 3, 1030.0)
+    assert log.replay() == (make_data(3, events=4), 4, 1040.0)
+    assert [record['type'] for record in log.iter_records(1025.0, 1035.0)] == ['snapshot', 'delta', 'delta']
+    
+    # A record cut short by a crash is skipped and a restarted log starts a new segment
+    log.close()
+    with open(log.get_segments()[-1][1], 'a', encoding='utf-8') as f:
+        f.write('{"type":"delta","ts":1045.0,"del')
+    restarted = DeltaLog(str(tmp_path), checkpoint_every=2)
+    assert restarted.replay() == (make_data(3, events=4), 4, 1040.0)
+    assert restarted.append(make_data(4, events=4), 1050.0, 5)['type'] == 'snapshot'
+    assert restarted.replay()[1] == 5
+    restarted.close()
+
+
+def test_replay_between_snapshots_keeps_clock_and_winner(tmp_path):
+    """Deltas carry the period clock and the winner, so replays match the snapshots logged"""
+    log = DeltaLog(str(tmp_path))
+    log.append(make_phase('first_half'), 1700000600.0, 1)
+    log.append(make_phase('second_half'), 1700003700.0, 2)
+    log.append(make_phase('full_time'), 1700006700.0, 3)
+    log.close()
+    assert log.stats['snapshots'] == 1 and log.stats['deltas'] == 2
+    
+    data, version, _ = log.replay(at=1700004000.0)
+    assert (data, version) == (make_phase('second_half'), 2)
+    assert LiveClock().format_minute(data['events'][0], now=1700003600 + 120) == "48'"
+    data, version, _ = log.replay()
+    assert (data, version) == (make_phase('full_time'), 3)
+    assert data['events'][0]['winnerCode'] == 1 and data['events'][0]['status']['winnerCode'] == 1
+
+
+def test_compaction_bounds_history(tmp_path):
+    """Old segments are deleted, keeping the one that covers the retention cutoff"""
+    log = DeltaLog(str(tmp_path), checkpoint_every=1, max_age=100)
+    for minute in range(10):
+        log.append(make_data(minute), 1000.0 + minute * 30, minute)
+        log.append(make_data(minute + 100), 1010.0 + minute * 30, minute)
+    starts = [start for start, _ in log.get_segments()]
+    assert starts[0] <= 1270.0 - 100 < starts[1]
+    assert log.stats['compacted'] > 0
+    assert log.replay(at=1270.0 - 100) is not None
+    
+    log.max_age = None
+    log.max_bytes = os.path.getsize(log.get_segments()[-1][1])
+    assert log.compact() == len(starts) - 1
+    assert len(log.get_segments()) == 1
+    log.close()
@@ -0,0 +1,81 @@
+"""
+Test the main thread dispatcher: key coalescing, delivery order and error isolation.
+"""
+
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from core.dispatcher import MainThreadDispatcher
+
+
+class FakeRoot:
+    """Stands in for the Tk root: after() jobs only run when the test calls run_pending()"""
+    
+    def __init__(self):
+        self.jobs = {}
+        self.next_id = 0
+    
+    def after(self, ms, callback):
+        self.next_id += 1
+        self.jobs[self.next_id] = callback
+        return self.next_id
+    
+    def after_cancel(self, job):
+        self.jobs.pop(job, None)
+    
+    def run_pending(self):
+        jobs, self.jobs = self.jobs, {}
+        for callback in jobs.values():
+            callback()
+
+
+def test_keyed_posts_coalesce():
+    """Only the latest post of a key is delivered, after the posts queued before it"""
+    dispatcher = MainThreadDispatcher(FakeRoot())
+    delivered = []
+    dispatcher.post(delivered.append, 'render 1', key='render')
+    dispatcher.post(delivered.append, 'status')
+    dispatcher.post(delivered.append, 'render 2', key='render')
+    dispatcher.post(delivered.append, 'toast')
+    dispatcher.post(delivered.append, 'toast')
+    dispatcher.wrap(delivered.append, key='render')('render 3')
+    assert dispatcher.get_stats()['queued'] == 4
+    
+    dispatcher.pump()
+    assert delivered == ['status', 'toast', 'toast', 'render 3']
+    stats = dispatcher.get_stats()
+    assert (stats['posted'], stats['coalesced'], stats['delivered'], stats['queued']) == (6, 2, 4, 0)
+
+
+def test_posts_from_threads_are_delivered_on_the_pump():
+    """Worker posts wait for the pump, and a failing callback doesn't stop the others"""
+    root = FakeRoot()
+    dispatcher = MainThreadDispatcher(root)
+    delivered = []
+    
+    def fail():
+        raise ValueError("broken")
+    
+    workers = [threading.Thread(target=dispatcher.post, args=(delivered.append, n), kwargs={'key': n % 10})
+               for n in range(100)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    dispatcher.post(fail)
+    assert delivered == []
+    
+    dispatcher.start()
+    root.run_pending()
+    assert sorted(value % 10 for value in delivered) == list(range(10))
+    assert dispatcher.get_stats()['errors'] == 1
+    assert len(root.jobs) == 1  # The pump rescheduled itself
+    
+    dispatcher.stop()
+    assert root.jobs == {}
+    dispatcher.post(delivered.append, 'late')
+    root.run_pending()
+    assert 'late' not in delivered and dispatcher.get_stats()['queued'] == 1
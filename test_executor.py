@@ -0,0 +1,86 @@
+"""
+Test the executor service: pool routing, priorities, cancellation and shutdown.
+"""
+
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+import pytest
+
+from core.executor import HIGH, LOW, ExecutorService
+
+
+def test_tasks_run_on_their_pool():
+    """Each task runs on a worker of the pool it was submitted to; unknown pools are refused"""
+    executor = ExecutorService(pools={'io': 2, 'cpu': 1})
+    try:
+        io_task = executor.submit('io', lambda: threading.current_thread().name)
+        cpu_task = executor.submit('cpu', lambda value: (threading.current_thread().name, value * 2), 21)
+        assert io_task.wait(1.0) and cpu_task.wait(1.0)
+        assert io_task.state == 'done' and io_task.result.startswith('io-')
+        assert cpu_task.result[0].startswith('cpu-') and cpu_task.result[1] == 42
+        with pytest.raises(ValueError):
+            executor.submit('gpu', print)
+        
+        failing = executor.submit('cpu', lambda: 1 / 0)
+        assert failing.wait(1.0) and failing.state == 'failed'
+        assert isinstance(failing.error, ZeroDivisionError)
+        assert executor.shutdown(timeout=1.0)  # Counters are recorded after the task's waiters wake
+        assert executor.get_stats()['cpu']['failed'] == 1
+    finally:
+        executor.shutdown(timeout=1.0)
+
+
+def test_priority_and_cancellation():
+    """Queued tasks run by priority; a cancelled queued task never starts and a running one is told to stop"""
+    executor = ExecutorService(pools={'io': 1})
+    release = threading.Event()
+    order = []
+    try:
+        def blocking(handle_ready):
+            handle_ready.wait(1.0)
+            while not release.is_set() and not running.cancelled:
+                release.wait(0.01)
+        
+        handle_ready = threading.Event()
+        running = executor.submit('io', blocking, handle_ready)
+        handle_ready.set()
+        low = executor.submit('io', order.append, 'low', priority=LOW)
+        high = executor.submit('io', order.append, 'high', priority=HIGH)
+        skipped = executor.submit('io', order.append, 'skipped', priority=HIGH)
+        assert skipped.cancel() and skipped.state == 'cancelled'
+        assert not skipped.cancel()
+        
+        stopped = []
+        running.add_cancel_callback(stopped.append)
+        assert running.cancel()
+        assert running.wait(1.0) and running.state == 'cancelled' and stopped == [running]
+        assert low.wait(1.0) and high.wait(1.0)
+        assert order == ['high', 'low']
+        assert executor.get_stats()['io']['cancelled'] == 2
+    finally:
+        release.set()
+        executor.shutdown(timeout=1.0)
+
+
+def test_shutdown_cancels_outstanding_work():
+    """Shutdown cancels running and queued tasks, stops the workers and refuses new work"""
+    executor = ExecutorService(pools={'io': 1})
+    started = threading.Event()
+    
+    def wait_for_cancel():
+        started.set()
+        running.cancel_event.wait(5.0)
+    
+    running = executor.submit('io', wait_for_cancel)
+    queued = executor.submit('io', print)
+    assert started.wait(1.0)
+    
+    assert executor.shutdown(timeout=1.0)
+    assert running.state == 'cancelled' and queued.state == 'cancelled'
+    with pytest.raises(RuntimeError):
+        executor.submit('io', print)
+    assert executor.shutdown() is True
@@ -0,0 +1,177 @@
+"""
+Test that stopping a fetch reaches idle quickly and that fetches never overlap.
+"""
+
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from core.executor import ExecutorService
+from data.data_processor import DataProcessor
+
+
+class StubScraper:
+    """Stands in for MatchScraper: polls for a stop request like the real browser loop"""
+    
+    active = 0
+    max_active = 0
+    result = {'events': []}  # Payload of a run that completes
+    lock = threading.Lock()
+    
+    def __init__(self, output_path, run_seconds=5.0, close_seconds=0.05, poll_interval=0.01):
+        self.output_path = output_path
+        self.run_seconds = run_seconds
+        self.close_seconds = close_seconds  # Time it takes to close the "browser"
+        self.poll_interval = poll_interval
+        self.stop_event = threading.Event()
+        self.started = threading.Event()
+        self.json_data = None
+    
+    def run(self):
+        with StubScraper.lock:
+            StubScraper.active += 1
+            StubScraper.max_active = max(StubScraper.max_active, StubScraper.active)
+        self.started.set()
+        try:
+            deadline = time.monotonic() + self.run_seconds
+            while not self.stop_event.is_set() and time.monotonic() < deadline:
+                self.stop_event.wait(self.poll_interval)
+            time.sleep(self.close_seconds)
+            if self.stop_event.is_set():
+                return False
+            self.json_data = StubScraper.result
+            return True
+        finally:
+            with StubScraper.lock:
+                StubScraper.active -= 1
+    
+    def stop(self):
+        self.stop_event.set()
+
+
+def make_processor(run_seconds=5.0):
+    """Create a DataProcessor on a private executor that records the scrapers it creates"""
+    scrapers = []
+    
+    def factory(output_path):
+        scraper = StubScraper(output_path, run_seconds=run_seconds)
+        scrapers.append(scraper)
+        return scraper
+    
+    executor = ExecutorService()
+    processor = DataProcessor(output_path=os.path.join("data", "test_events.json"),
+                              executor=executor, scraper_factory=factory)
+    return processor, executor, scrapers
+
+
+def wait_for_start(scrapers, index=0, timeout=1.0):
+    """Wait until the worker has created a scraper and started running it"""
+    deadline = time.monotonic() + timeout
+    while len(scrapers) <= index and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return len(scrapers) > index and scrapers[index].started.wait(max(0, deadline - time.monotonic()))
+
+
+def make_phase(phase, kickoff=1700000000):
+    """Build the sofascore event of one match at first half, second half or full time"""
+    event = {'id': 1, 'tournament': {'name': 'League'}, 'homeTeam': {'name': 'Home'}, 'awayTeam': {'name': 'Away'},
+             'homeScore': {'current': 1}, 'awayScore': {'current': 0}, 'startTimestamp': kickoff}
+    if phase == 'first_half':
+        event['status'] = {'code': 6, 'description': '1st half', 'type': 'inprogress'}
+        event['time'] = {'initial': 0, 'max': 2700, 'extra': 540, 'currentPeriodStartTimestamp': kickoff}
+    elif phase == 'second_half':
+        event['status'] = {'code': 7, 'description': '2nd half', 'type': 'inprogress'}
+        event['time'] = {'initial': 2700, 'max': 5400, 'extra': 540, 'currentPeriodStartTimestamp': kickoff + 3600}
+    else:
+        event['status'] = {'code': 100, 'description': 'Ended', 'type': 'finished', 'winnerCode': 1}
+        event['winnerCode'] = 1
+        event['time'] = {}
+    return {'events': [event]}
+
+
+def test_cancel_to_idle_latency():
+    """stop_fetching reaches idle within a bounded time and reports nothing"""
+    processor, executor, scrapers = make_processor()
+    results = []
+    try:
+        assert processor.start_fetching(lambda *args: results.append(args))
+        assert wait_for_start(scrapers)
+        
+        start = time.perf_counter()
+        processor.stop_fetching()
+        assert processor.wait_until_idle(2.0)
+        latency_ms = (time.perf_counter() - start) * 1000
+        print(f"Cancel-to-idle latency: {latency_ms:.0f}ms (processor measured {processor.last_cancel_latency_ms:.0f}ms)")
+        
+        assert latency_ms < 500
+        assert not processor.is_fetching()
+        assert processor.last_cancel_latency_ms is not None
+        assert results == []
+        assert processor.json_data is None
+    finally:
+        executor.shutdown(timeout=1.0)
+
+
+def test_single_fetch_at_a_time():
+    """A new fetch can't start until the cancelled one has closed its browser"""
+    StubScraper.max_active = 0
+    processor, executor, scrapers = make_processor()
+    try:
+        assert processor.start_fetching()
+        assert not processor.start_fetching()
+        assert wait_for_start(scrapers)
+        
+        processor.stop_fetching()
+        assert not processor.start_fetching()  # Still closing
+        assert processor.wait_until_idle(2.0)
+        
+        assert processor.start_fetching()
+        processor.stop_fetching()
+        assert processor.wait_until_idle(2.0)
+        assert StubScraper.max_active == 1
+        assert len(scrapers) == 2
+    finally:
+        executor.shutdown(timeout=1.0)
+
+
+def test_completed_fetch_delivers_data():
+    """A fetch that isn't cancelled still delivers its data"""
+    processor, executor, scrapers = make_processor(run_seconds=0.02)
+    results = []
+    try:
+        assert processor.start_fetching(lambda *args: results.append(args))
+        assert processor.wait_until_idle(2.0)
+        assert results == [(True, {'events': []})]
+        assert not processor.is_fetching()
+        assert processor.last_cancel_latency_ms is None
+    finally:
+        executor.shutdown(timeout=1.0)
+
+
+def test_cancel_while_preparing_keeps_previous_snapshot():
+    """A fetch cancelled while building card descriptors leaves the data, version and descriptors as they were"""
+    processor, executor, scrapers = make_processor(run_seconds=0.02)
+    processor.set_data(make_phase('first_half'))
+    processor.prepare_view_models()
+    previous_descriptor = processor.view_models.describe(make_phase('first_half')['events'][0], 1)
+    build_descriptor = processor.view_models.build_descriptor
+    
+    def cancel_midway(event, today=None):
+        processor.stop_fetching()
+        return build_descriptor(event, today)
+    
+    processor.view_models.build_descriptor = cancel_midway
+    StubScraper.result = make_phase('second_half')
+    results = []
+    try:
+        assert processor.start_fetching(lambda *args: results.append(args))
+        assert processor.wait_until_idle(2.0)
+        assert results == []
+        assert processor.json_data == make_phase('first_half') and processor.snapshot_version == 1
+        assert processor.view_models.describe(make_phase('first_half')['events'][0], 1) is previous_descriptor
+    finally:
+        StubScraper.result = {'events': []}
+        executor.shutdown(timeout=1.0)
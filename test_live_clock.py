@@ -0,0 +1,68 @@
+"""
+Test the live clock: minutes by period, half time and stoppage time capped by the payload.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from data.live_clock import HALFTIME, LiveClock
+
+KICKOFF = 1700000000
+SECOND_HALF_START = KICKOFF + 3600
+
+
+def make_event(phase):
+    """Make a live match in its 'first_half' or 'second_half', as sofascore reports it"""
+    if phase == 'first_half':
+        return {'id': 1, 'status': {'code': 6, 'description': '1st half', 'type': 'inprogress'},
+                'time': {'initial': 0, 'max': 2700, 'extra': 540, 'currentPeriodStartTimestamp': KICKOFF}}
+    return {'id': 1, 'status': {'code': 7, 'description': '2nd half', 'type': 'inprogress'},
+            'time': {'initial': 2700, 'max': 5400, 'extra': 540, 'currentPeriodStartTimestamp': SECOND_HALF_START}}
+
+
+def test_first_half_and_half_time():
+    """The first half counts from kick-off and half time shows HT whatever the clock says"""
+    clock = LiveClock()
+    event = make_event('first_half')
+    assert clock.get_minute(event, now=KICKOFF) == (1, 0)
+    assert clock.format_minute(event, now=KICKOFF + 600) == "11'"
+    assert clock.format_minute(event, now=KICKOFF + 2699) == "45'"
+    
+    event['status'] = {'code': HALFTIME, 'description': 'Halftime', 'type': 'inprogress'}
+    assert clock.get_minute(event, now=KICKOFF + 3000) is None
+    assert clock.format_minute(event, now=KICKOFF + 3000) == "HT"
+
+
+def test_second_half_starts_from_initial():
+    """The second half adds its period's elapsed time to 'initial', not to the kick-off"""
+    clock = LiveClock()
+    event = make_event('second_half')
+    assert clock.format_minute(event, now=SECOND_HALF_START) == "46'"
+    assert clock.format_minute(event, now=SECOND_HALF_START + 120) == "48'"
+    assert clock.seconds_until_next_minute([event], now=SECOND_HALF_START + 130) == 50
+
+
+def test_stoppage_time_is_capped():
+    """Minutes past 'max' show as added time, capped by 'extra' or the clock's default"""
+    clock = LiveClock(max_added_minutes=15)
+    first_half = make_event('first_half')
+    assert clock.format_minute(first_half, now=KICKOFF + 2700 + 150) == "45+3'"
+    assert clock.format_minute(first_half, now=KICKOFF + 2700 + 1200) == "45+9'"  # extra is 540s
+    
+    second_half = make_event('second_half')
+    assert clock.get_minute(second_half, now=SECOND_HALF_START + 2700 + 300) == (90, 6)
+    assert clock.format_minute(second_half, now=SECOND_HALF_START + 2700 + 1800) == "90+9'"
+    
+    del second_half['time']['extra']
+    assert clock.format_minute(second_half, now=SECOND_HALF_START + 2700 + 1800) == "90+15'"
+
+
+def test_falls_back_to_payload_minute():
+    """Without a period start the payload's own minute is shown"""
+    clock = LiveClock()
+    event = {'id': 1, 'status': {'type': 'inprogress'}, 'time': {'minute': 12}}
+    assert clock.get_minute(event, now=KICKOFF) is None
+    assert clock.format_minute(event, now=KICKOFF) == "12'"
+    assert clock.seconds_until_next_minute([event], now=KICKOFF) is None
@@ -0,0 +1,49 @@
+"""
+Test the persisted preferences: collapsed tournament sections survive restarts, per section.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from core.preferences import CollapsedTournaments
+from data.data_processor import MatchOrganizer
+
+
+def test_collapsed_tournaments_persist(tmp_path):
+    """Collapse state is saved on change, reloaded by a new instance and tolerant of bad files"""
+    path = str(tmp_path / "config" / "collapsed_tournaments.json")
+    collapsed = CollapsedTournaments(path)
+    assert not collapsed.is_collapsed(17)
+    assert not os.path.exists(path)  # Nothing changed, nothing written
+    
+    collapsed.set_collapsed(17, True)
+    collapsed.set_collapsed('Friendlies', True)
+    assert CollapsedTournaments(path).is_collapsed('17')
+    assert CollapsedTournaments(path).collapsed == {'17', 'Friendlies'}
+    
+    collapsed.set_collapsed(17, False)
+    assert CollapsedTournaments(path).collapsed == {'Friendlies'}
+    assert os.listdir(tmp_path / "config") == ["collapsed_tournaments.json"]
+    
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('{"cut short')
+    assert CollapsedTournaments(path).collapsed == set()
+
+
+def test_groups_of_one_competition_collapse_separately(tmp_path):
+    """Sections are keyed by tournament id, not by the competition they belong to"""
+    def make_event(event_id, group, tournament_id):
+        return {'id': event_id, 'tournament': {'name': f"Champions League, {group}", 'id': tournament_id,
+                                               'uniqueTournament': {'id': 7}}}
+    
+    data = {'events': [make_event(1, 'Group A', 1461), make_event(2, 'Group B', 1462),
+                       {'id': 3, 'tournament': {'name': 'Friendlies'}}]}
+    sections = MatchOrganizer.organize_matches_by_tournament(data)
+    ids = [section['tournament_id'] for section in sections.values()]
+    assert ids == [1461, 1462, 'Friendlies']
+    
+    collapsed = CollapsedTournaments(str(tmp_path / "collapsed_tournaments.json"))
+    collapsed.set_collapsed(ids[0], True)
+    assert [collapsed.is_collapsed(tournament_id) for tournament_id in ids] == [True, False, False]
@@ -0,0 +1,53 @@
+"""
+Test the refresh policy: interval choice from the snapshot, jitter and backoff after failures.
+"""
+
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from core.refresh_scheduler import RefreshPolicy
+
+AFTERNOON = datetime(2026, 10, 17, 15, 0).timestamp()
+NIGHT = datetime(2026, 10, 17, 3, 0).timestamp()
+
+
+def make_events(*statuses, start=AFTERNOON + 7200):
+    """Make a payload with one event per status type, all starting at start"""
+    return {'events': [{'id': index, 'status': {'type': status}, 'startTimestamp': start}
+                       for index, status in enumerate(statuses)]}
+
+
+def test_interval_follows_the_data():
+    """Live matches refresh fastest, then imminent kick-offs, fixtures, overnight and idle"""
+    policy = RefreshPolicy()
+    assert policy.get_base_interval(make_events('finished', 'inprogress'), AFTERNOON) == (60, "live matches")
+    assert policy.get_base_interval(make_events('inprogress'), NIGHT) == (60, "live matches")
+    assert policy.get_base_interval(make_events('notstarted', start=AFTERNOON + 600), AFTERNOON) == \
+        (120, "kick-off soon")
+    assert policy.get_base_interval(make_events('notstarted'), AFTERNOON) == (600, "fixtures only")
+    assert policy.get_base_interval(make_events('notstarted', start=NIGHT + 7200), NIGHT) == (3600, "overnight")
+    assert policy.get_base_interval(make_events('finished'), AFTERNOON) == (1800, "no matches to follow")
+    assert policy.get_base_interval(None, AFTERNOON) == (1800, "no matches to follow")
+
+
+def test_jitter_stays_within_bounds():
+    """Jittered intervals vary around the base interval, reproducibly for a seed"""
+    intervals = [RefreshPolicy(jitter=0.1, seed=1).next_interval(make_events('inprogress'), AFTERNOON)[0]
+                 for _ in range(2)]
+    assert intervals[0] == intervals[1]
+    
+    policy = RefreshPolicy(jitter=0.1, seed=2)
+    intervals = [policy.next_interval(make_events('inprogress'), AFTERNOON)[0] for _ in range(100)]
+    assert all(54 <= interval <= 66 for interval in intervals)
+    assert len(set(intervals)) > 1
+    assert RefreshPolicy(jitter=0).next_interval(make_events('inprogress'), AFTERNOON) == (60, "live matches")
+
+
+def test_error_backoff_doubles_up_to_the_cap():
+    """Consecutive failures double the retry interval from the kick-off interval up to the cap"""
+    policy = RefreshPolicy(kickoff_interval=120, max_error_interval=1800, jitter=0)
+    assert [policy.error_interval(failures) for failures in range(1, 7)] == [120, 240, 480, 960, 1800, 1800]
+    assert policy.error_interval(0) == 120
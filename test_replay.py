@@ -0,0 +1,121 @@
+"""
+Test replaying recordings: loading the recording formats, scaled timing and lag reporting.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from data.delta_log import DeltaLog
+from data.data_processor import DataProcessor
+from data.replay import ReplayPlayer, load_records
+
+
+def make_data(home_score):
+    return {'events': [{'id': 1, 'tournament': {'name': 'League'}, 'status': {'type': 'inprogress'},
+                        'homeScore': {'current': home_score}}]}
+
+
+def make_phase(phase, kickoff=1700000000):
+    """Build the sofascore event of one match at first half, second half or full time"""
+    event = {'id': 1, 'tournament': {'name': 'League'}, 'homeTeam': {'name': 'Home'}, 'awayTeam': {'name': 'Away'},
+             'homeScore': {'current': 1}, 'awayScore': {'current': 0}, 'startTimestamp': kickoff}
+    if phase == 'first_half':
+        event['status'] = {'code': 6, 'description': '1st half', 'type': 'inprogress'}
+        event['time'] = {'initial': 0, 'max': 2700, 'extra': 540, 'currentPeriodStartTimestamp': kickoff}
+    elif phase == 'second_half':
+        event['status'] = {'code': 7, 'description': '2nd half', 'type': 'inprogress'}
+        event['time'] = {'initial': 2700, 'max': 5400, 'extra': 540, 'currentPeriodStartTimestamp': kickoff + 3600}
+    else:
+        event['status'] = {'code': 100, 'description': 'Ended', 'type': 'finished', 'winnerCode': 1}
+        event['winnerCode'] = 1
+        event['time'] = {}
+    return {'events': [event]}
+
+
+def test_replay_follows_scaled_timeline(tmp_path):
+    """A 10 second recording plays in about 0.1s at 100x, in order, and reports its lag"""
+    log = DeltaLog(str(tmp_path / "log"))
+    for second in range(0, 11, 2):
+        log.append(make_data(second), 1000.0 + second, second)
+    log.close()
+    records = load_records(str(tmp_path / "log"))
+    assert [record['type'] for record in records] == ['snapshot'] + ['delta'] * 5
+    
+    received = []
+    finished = threading.Event()
+    player = None
+    
+    def on_data(data, version, due, ts):
+        received.append((data['events'][0]['homeScore']['current'], version, time.perf_counter() - start))
+        player.record_render(due)
+    
+    player = ReplayPlayer(records, on_data, speed=100, on_finished=finished.set)
+    start = time.perf_counter()
+    player.start()
+    assert finished.wait(5)
+    
+    assert [(score, version) for score, version, _ in received] == [(s, s) for s in range(0, 11, 2)]
+    assert 0.09 <= received[-1][2] < 1.0
+    report = player.get_report()
+    assert report['delivered'] == report['rendered'] == 6
+    assert report['superseded'] == 0 and report['lag_max_ms'] < 500
+    assert 'Replay 100x' in player.describe()
+
+
+def test_load_daemon_output(tmp_path):
+    """Daemon stdout records play in time order, skipping metrics and deltas before a snapshot"""
+    records = [{'type': 'delta', 'ts': 5.0, 'version': 0, 'deltas': []},
+               {'type': 'metrics', 'ts': 6.0, 'refresh': 1},
+               {'type': 'delta', 'ts': 20.0, 'version': 2,
+                'deltas': [{'op': 'changed', 'id': 1, 'changes': {'home_score': [0, 1]}}]},
+               {'type': 'snapshot', 'ts': 10.0, 'version': 1, 'data': make_data(0)}]
+    (tmp_path / "daemon.ndjson").write_text(''.join(json.dumps(r) + '\n' for r in records), encoding='utf-8')
+    records = load_records(str(tmp_path / "daemon.ndjson"))
+    assert [record['ts'] for record in records] == [5.0, 10.0, 20.0]
+    
+    received = []
+    player = ReplayPlayer(records, lambda data, version, due, ts: received.append(data), speed=1000)
+    player.run()
+    assert received == [make_data(0), make_data(1)]
+    assert player.stats['skipped_records'] == 1
+
+
+def replay_status_texts(records, processor, speed):
+    """Replay records into a DataProcessor the way the app does and get each snapshot's status line"""
+    texts = []
+    player = None
+    
+    def on_data(data, version, due, ts):
+        processor.set_data(data, fetched_at=ts, clock_rate=player.speed)
+        processor.prepare_view_models()
+        texts.append(processor.view_models.describe(data['events'][0], processor.snapshot_version)['status_text'])
+    
+    player = ReplayPlayer(records, on_data, speed=speed)
+    player.run()
+    return texts
+
+
+def test_replay_minutes_follow_the_recording(tmp_path):
+    """Replayed minutes run from each record's time at the replay speed, not from today's clock"""
+    log = DeltaLog(str(tmp_path / "log"))
+    for version, (phase, ts) in enumerate([('first_half', 1700000605.0), ('second_half', 1700003721.0),
+                                           ('full_time', 1700006700.0)], start=1):
+        log.append(make_phase(phase), ts, version)
+    log.close()
+    
+    processor = DataProcessor(output_path=str(tmp_path / "events.json"))
+    records = load_records(str(tmp_path / "log"))
+    assert replay_status_texts(records, processor, speed=10000) == ["LIVE 11'", "LIVE 48'", "FULL TIME"]
+    
+    # Two minutes of match time pass in 0.2s at 600x
+    second_half = [{'type': 'snapshot', 'ts': 1700003721.0, 'version': 1, 'data': make_phase('second_half')}]
+    assert replay_status_texts(second_half, processor, speed=600) == ["LIVE 48'"]
+    time.sleep(0.2)
+    processor.prepare_view_models()
+    event = processor.json_data['events'][0]
+    assert processor.view_models.describe(event, processor.snapshot_version)['status_text'] == "LIVE 50'"
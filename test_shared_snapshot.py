@@ -0,0 +1,93 @@
+"""
+Test multi-instance coordination: leader election, atomic snapshots and change notifications.
+"""
+
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from core.fileio import atomic_write_json
+from data.shared_snapshot import FileLock, SnapshotWatcher
+from data.sources import DataSource, SharedSource
+
+
+class CountingSource(DataSource):
+    """Stands in for the scraper: counts fetches and saves the snapshot like MatchScraper"""
+    
+    def __init__(self, path, home_score=0):
+        super().__init__()
+        self.name = 'counting'
+        self.path = path
+        self.home_score = home_score
+        self.fetches = 0
+    
+    def fetch(self, cancel_event):
+        self.fetches += 1
+        data = {'events': [{'id': 1, 'homeScore': {'current': self.home_score}}]}
+        atomic_write_json(self.path, data)
+        return data
+
+
+def test_one_leader_per_snapshot(tmp_path):
+    """Only the lock holder fetches; followers read its file and take over when it leaves"""
+    path = str(tmp_path / "events.json")
+    cancel = threading.Event()
+    first = SharedSource(CountingSource(path, home_score=1), path)
+    second = SharedSource(CountingSource(path, home_score=2), path)
+    
+    assert first.fetch(cancel)['events'][0]['homeScore']['current'] == 1
+    assert first.is_leader
+    for _ in range(3):
+        assert second.fetch(cancel)['events'][0]['homeScore']['current'] == 1
+    assert not second.is_leader
+    assert first.leader_source.fetches == 1 and second.leader_source.fetches == 0
+    assert second.get_cost()['role'] == 'follower'
+    
+    first.close()
+    assert second.fetch(cancel)['events'][0]['homeScore']['current'] == 2
+    assert second.is_leader and second.get_cost()['role'] == 'leader'
+    second.close()
+
+
+def test_paused_leader_hands_over(tmp_path):
+    """A leader whose refresh is paused releases the lock, so a follower keeps the snapshot fresh"""
+    path = str(tmp_path / "events.json")
+    cancel = threading.Event()
+    first = SharedSource(CountingSource(path, home_score=1), path)
+    second = SharedSource(CountingSource(path, home_score=2), path)
+    first.fetch(cancel)
+    second.fetch(cancel)
+    assert first.is_leader and not second.is_leader
+    
+    first.pause()
+    assert not first.is_leader
+    assert second.fetch(cancel)['events'][0]['homeScore']['current'] == 2
+    assert second.is_leader
+    
+    assert first.fetch(cancel)['events'][0]['homeScore']['current'] == 2  # Shown again, it follows
+    assert not first.is_leader and first.leader_source.fetches == 1
+    first.close()
+    second.close()
+
+
+def test_lock_and_watcher(tmp_path):
+    """The lock is exclusive and the watcher reports replaced snapshots"""
+    lock_path = str(tmp_path / "events.json.lock")
+    holder, contender = FileLock(lock_path), FileLock(lock_path)
+    assert holder.acquire() and not contender.acquire()
+    holder.release()
+    assert contender.acquire()
+    contender.release()
+    
+    path = str(tmp_path / "events.json")
+    changes = []
+    watcher = SnapshotWatcher(path, lambda: changes.append(1))
+    assert not watcher.check()
+    atomic_write_json(path, {'events': []})
+    assert watcher.check() and not watcher.check()
+    atomic_write_json(path, {'events': [{'id': 1}]})
+    assert watcher.check()
+    assert len(changes) == 2
+    assert [name for name in os.listdir(tmp_path) if name.endswith('.tmp')] == []
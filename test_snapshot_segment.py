@@ -0,0 +1,132 @@
+"""
+Test the shared-memory snapshot segment: versioned publishing, torn-read detection and growth.
+"""
+
+import os
+import random
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from data.snapshot_segment import HEADER, SnapshotPublisher, SnapshotReader
+from data.sources import SourceError, create_source
+from data.synthetic import advance, generate_payload
+
+
+def make_data(home_score, events=1):
+    return {'events': [{'id': i, 'homeScore': {'current': home_score}} for i in range(events)]}
+
+
+def test_readers_parse_each_version_once(tmp_path):
+    """Readers get every new version once and only check the header otherwise"""
+    path = str(tmp_path / "snapshot.seg")
+    source = create_source(f"shm:{path}", 'unused')
+    cancel = threading.Event()
+    try:
+        source.fetch(cancel)
+        assert False, "expected SourceError"
+    except SourceError:
+        pass
+    
+    publisher = SnapshotPublisher(path, capacity=256)
+    reader = SnapshotReader(path)
+    assert reader.read() is None  # Nothing published yet
+    
+    assert publisher.publish(make_data(0), 1)
+    assert not publisher.publish(make_data(0), 1)
+    assert reader.read() == (make_data(0), 1)
+    assert reader.read() is None
+    first = source.fetch(cancel)
+    assert source.fetch(cancel) is first
+    assert source.get_cost()['unchanged'] == 1
+    
+    # A snapshot larger than the segment moves to a new file; attached readers follow
+    assert publisher.publish(make_data(1, events=50), 2)
+    assert publisher.stats['grows'] == 1
+    assert reader.read() == (make_data(1, events=50), 2)
+    assert reader.stats['attaches'] == 2
+    assert source.fetch(cancel) == make_data(1, events=50)
+    
+    # A restarted publisher continues the segment
+    publisher.close()
+    publisher = SnapshotPublisher(path, capacity=256)
+    assert publisher.publish(make_data(2), 1)
+    assert reader.read() == (make_data(2), 1)
+    publisher.close()
+    reader.close()
+    source.close()
+
+
+def test_reader_skips_write_in_progress(tmp_path):
+    """A reader never returns a snapshot while the sequence says it is being written"""
+    path = str(tmp_path / "snapshot.seg")
+    publisher = SnapshotPublisher(path, capacity=256)
+    publisher.publish(make_data(0), 1)
+    reader = SnapshotReader(path, retries=3)
+    
+    publisher.sequence += 1
+    publisher.write_header()
+    assert HEADER.unpack_from(publisher.map, 0)[4] % 2 == 1
+    assert reader.read() is None
+    assert reader.stats['retries'] == 3
+    
+    publisher.sequence += 1
+    publisher.write_header()
+    assert reader.read() == (make_data(0), 1)
+    publisher.close()
+    reader.close()
+
+
+def test_new_segment_file_has_no_snapshot_until_published(tmp_path):
+    """Readers attaching to a swapped-in file never parse its empty payload"""
+    path = str(tmp_path / "snapshot.seg")
+    publisher = SnapshotPublisher(path, capacity=256)
+    publisher.publish(make_data(0), 1)
+    publisher.close()
+    
+    # A restarted publisher that needs more room swaps in an empty file
+    publisher = SnapshotPublisher(path, capacity=4096)
+    reader = SnapshotReader(path, retries=3)
+    assert reader.read() is None
+    
+    # While growing, the new file is swapped in mid-write
+    publisher.sequence += 1
+    publisher.create(8192)
+    assert HEADER.unpack_from(publisher.map, 0)[4] % 2 == 1
+    assert reader.read() is None
+    assert reader.stats['retries'] > 0
+    
+    publisher.sequence -= 1
+    assert publisher.publish(make_data(1), 2)
+    assert reader.read() == (make_data(1), 2)
+    publisher.close()
+    reader.close()
+
+
+def test_reads_rebuild_only_changed_events(tmp_path):
+    """Score changes are read from the columns alone; other changes re-parse the static part"""
+    path = str(tmp_path / "snapshot.seg")
+    publisher = SnapshotPublisher(path, capacity=256)
+    reader = SnapshotReader(path)
+    data = generate_payload(events=200, tournaments=10, seed=3, now=1700000000)
+    data['events'][0]['id'] = 'odd-id'  # Values that don't fit a column stay in the static part
+    data['events'][1]['homeScore']['current'] = 1 << 70
+    publisher.publish(data, 1)
+    assert reader.read() == (data, 1)
+    first = reader.events
+    
+    later = advance(data, 5400, random.Random(1))
+    changed = [index for index, (old, new) in enumerate(zip(data['events'], later['events'])) if old is not new]
+    assert publisher.publish(later, 2)
+    assert publisher.stats['static_writes'] == 1
+    assert reader.read() == (later, 2)
+    assert reader.stats['static_parses'] == 1
+    assert changed and [index for index, event in enumerate(reader.events) if event is not first[index]] == changed
+    
+    later['events'][5] = dict(later['events'][5], homeTeam={'name': 'Renamed FC'})
+    assert publisher.publish(later, 3)
+    assert reader.read() == (later, 3)
+    assert publisher.stats['static_writes'] == 2 and reader.stats['static_parses'] == 2
+    publisher.close()
+    reader.close()
@@ -0,0 +1,75 @@
+"""
+Test the data sources: file and remote sources, freshness and cost reporting.
+"""
+
+import json
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from core.executor import ExecutorService
+from data.api_server import MatchAPIServer
+from data.data_processor import DataProcessor
+from data.sources import FileSource, RemoteSource, SourceError, create_source
+
+
+def make_data(home_score):
+    return {'events': [{'id': 1, 'tournament': {'name': 'League'}, 'status': {'type': 'inprogress'},
+                        'homeScore': {'current': home_score}}]}
+
+
+def test_file_source_reparses_only_changes(tmp_path):
+    """A file is parsed once per change; directories use their newest JSON file"""
+    path = tmp_path / "events.json"
+    path.write_text(json.dumps(make_data(0)), encoding='utf-8')
+    source = FileSource(str(path))
+    cancel = threading.Event()
+    
+    first = source.fetch(cancel)
+    assert source.fetch(cancel) is first
+    assert source.get_cost()['unchanged'] == 1
+    assert source.get_cost()['kind'] == 'disk'
+    assert source.get_freshness()['age_seconds'] >= 0
+    
+    path.write_text(json.dumps(make_data(1)) + ' ', encoding='utf-8')
+    assert source.fetch(cancel)['events'][0]['homeScore']['current'] == 1
+    assert create_source(str(tmp_path), 'unused').fetch(cancel) == make_data(1)
+    
+    try:
+        FileSource(str(tmp_path / "missing.json")).fetch(cancel)
+        assert False, "expected SourceError"
+    except SourceError:
+        pass
+
+
+def test_remote_source_revalidates():
+    """The remote source gets 304s for unchanged snapshots and feeds DataProcessor"""
+    server = MatchAPIServer(port=0)
+    server.start()
+    executor = ExecutorService(pools={'io': 1})
+    try:
+        server.publish(make_data(0), 1)
+        source = create_source(f"http://127.0.0.1:{server.port}", 'unused')
+        assert isinstance(source, RemoteSource)
+        
+        processor = DataProcessor(executor=executor, source=source)
+        results = []
+        for _ in range(2):
+            assert processor.start_fetching(lambda *args: results.append(args))
+            assert processor.wait_until_idle(5)
+        assert [success for success, _ in results] == [True, True]
+        assert processor.snapshot_version == 1  # The 304 kept the snapshot
+        assert source.get_cost()['unchanged'] == 1
+        assert server.get_stats()['not_modified'] == 1
+        
+        server.publish(make_data(2), 2)
+        assert processor.start_fetching()
+        assert processor.wait_until_idle(5)
+        assert processor.json_data == make_data(2)
+        assert processor.snapshot_version == 2
+        assert 'server 127.0.0.1' in source.describe()
+    finally:
+        executor.shutdown(timeout=1.0)
+        server.stop()
@@ -0,0 +1,121 @@
+"""
+Test the delta stream: sequencing, resume handshake and the SSE subscriber.
+"""
+
+import json
+import os
+import queue
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+
+from data.api_server import MatchAPIServer
+from data.delta_stream import DeltaStream
+from data.deltas import compute_deltas
+from data.live_clock import LiveClock
+from data.stream_client import StreamSubscriber
+from data.view_model import MatchCardBuilder
+
+
+def make_data(home_score, extra_event=False):
+    events = [{'id': 1, 'tournament': {'name': 'League'}, 'status': {'type': 'inprogress'},
+               'homeScore': {'current': home_score}, 'time': {'minute': 10 + home_score}}]
+    if extra_event:
+        events.append({'id': 2, 'tournament': {'name': 'Cup'}, 'status': {'type': 'notstarted'}})
+    return {'events': events}
+
+
+def event_types(events):
+    return [event.split(b'\nevent: ')[1].split(b'\n')[0].decode() for event in events]
+
+
+def test_resume_from_sequence():
+    """Subscribers resume from their position, or get a snapshot when they can't"""
+    stream = DeltaStream(history=4)
+    assert stream.read(None, timeout=0) == ([], None)
+    
+    stream.publish(make_data(0), 1)
+    events, position = stream.read(None, timeout=0)
+    assert event_types(events) == ['snapshot']
+    
+    stream.publish(make_data(1), 2)
+    events, resumed = stream.read(stream.parse_id(stream.make_id(position)), timeout=0)
+    assert event_types(events) == ['delta', 'commit']
+    assert b'"home_score":[0,1]' in events[0] and b'"minute":[10,11]' in events[0]
+    assert stream.read(resumed, timeout=0) == ([], resumed)
+    
+    # An id from another server run can't be resumed
+    assert stream.parse_id(f"otherstream-{position}") is None
+    
+    # Falling out of the history gets a fresh snapshot
+    stream.publish(make_data(2, extra_event=True), 3)
+    stream.publish(make_data(3, extra_event=True), 4)
+    events, _ = stream.read(position, timeout=0)
+    assert event_types(events) == ['snapshot']
+
+
+def test_subscriber_follows_server():
+    """The SSE subscriber receives the snapshot, then applies committed deltas"""
+    server = MatchAPIServer(port=0, heartbeat=1)
+    server.start()
+    received = queue.Queue()
+    subscriber = StreamSubscriber(f"http://127.0.0.1:{server.port}/stream",
+                                  lambda data, version: received.put((data, version)))
+    try:
+        server.publish(make_data(0), 1)
+        subscriber.start()
+        data, version = received.get(timeout=5)
+        assert version == 1 and data['events'][0]['homeScore']['current'] == 0
+        
+        server.publish(make_data(2, extra_event=True), 2)
+        data, version = received.get(timeout=5)
+        assert version == 2
+        assert data == make_data(2, extra_event=True)
+        
+        # A dropped connection resumes from the last event id without a new snapshot
+        subscriber.close()
+        server.publish(make_data(3, extra_event=True), 3)
+        data, version = received.get(timeout=10)
+        assert version == 3 and data['events'][0]['homeScore']['current'] == 3
+        assert subscriber.stats['connects'] == 2 and subscriber.stats['snapshots'] == 1
+    finally:
+        subscriber.stop()
+        server.stop()
+
+
+def make_phase(phase, kickoff=1700000000):
+    """Build the sofascore event of one match at first half, second half or full time"""
+    event = {'id': 1, 'tournament': {'name': 'League'}, 'homeTeam': {'name': 'Home'}, 'awayTeam': {'name': 'Away'},
+             'homeScore': {'current': 1}, 'awayScore': {'current': 0}, 'startTimestamp': kickoff}
+    if phase == 'first_half':
+        event['status'] = {'code': 6, 'description': '1st half', 'type': 'inprogress'}
+        event['time'] = {'initial': 0, 'max': 2700, 'extra': 540, 'currentPeriodStartTimestamp': kickoff}
+    elif phase == 'second_half':
+        event['status'] = {'code': 7, 'description': '2nd half', 'type': 'inprogress'}
+        event['time'] = {'initial': 2700, 'max': 5400, 'extra': 540, 'currentPeriodStartTimestamp': kickoff + 3600}
+    else:
+        event['status'] = {'code': 100, 'description': 'Ended', 'type': 'finished', 'winnerCode': 1}
+        event['winnerCode'] = 1
+        event['time'] = {}
+    return {'events': [event]}
+
+
+def test_rebuilt_snapshots_follow_period_changes():
+    """Deltas carry half-time and full-time transitions, so rebuilt clocks and winners are right"""
+    received = []
+    subscriber = StreamSubscriber('http://unused/stream', lambda data, version: received.append(data))
+    previous = make_phase('first_half')
+    subscriber.handle_event('snapshot', json.dumps({'data': previous, 'version': 1}))
+    
+    for version, phase in enumerate(['second_half', 'full_time'], start=2):
+        current = make_phase(phase)
+        for delta in compute_deltas(previous, current):
+            subscriber.handle_event('delta', json.dumps(delta))
+        subscriber.handle_event('commit', json.dumps({'version': version}))
+        assert received[-1] == current
+        previous = current
+    
+    second_half = received[1]['events'][0]
+    assert LiveClock().format_minute(second_half, now=1700000000 + 3600 + 120) == "48'"
+    full_time = MatchCardBuilder().build_descriptor(received[2]['events'][0])
+    assert full_time['winner'] == 1 and full_time['status_text'] == "FULL TIME"